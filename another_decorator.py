@@ -1,30 +1,251 @@
-from functools import wraps 
-from typing import Callable
+import asyncio
+import importlib
+import inspect
+import threading
+import time
+from concurrent.futures import Future
+from functools import wraps
+from typing import Any, Callable, Dict, NamedTuple, Optional
 
+# имя файла задачи начинается с цифры, поэтому обычный import не подходит
+LRUCache = importlib.import_module("leetcode.146_lru_cache").LRUCache
 
-def cache(func: Callable):
-    
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        # for arg in args:
-        print(f"func_name = {func.__name__}")
-        print(" ".join(list((map(str, args)))))
-        for key, value in kwargs.items():
-            print(f"{key} {value}")
+_MISSING = object()
+_KWARGS_MARK = (object(),)
+_FAST_TYPES = {int, str}
 
-        result = func(*args, **kwargs)
-        print(result)    
 
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    coalesced: int
+    currsize: int
+    maxsize: int
 
 
+def _make_key(args: tuple, kwargs: dict) -> Any:
+    # как functools._make_key: один int/str аргумент - сам себе ключ, без лишнего кортежа
+    if not kwargs and len(args) == 1 and type(args[0]) in _FAST_TYPES:
+        return args[0]
+    if not kwargs:
+        return args
+    key = args + _KWARGS_MARK
+    for item in kwargs.items():
+        key += item
+    return key
+
+
+def cache(func: Optional[Callable] = None, *, maxsize: int = 128, ttl: Optional[float] = None,
+          clock: Callable[[], float] = time.monotonic):
+    """
+    Мемоизация на LRUCache для обычных и async функций: @cache или @cache(maxsize=..., ttl=...).
+    Одновременные вызовы с одним ключом объединяются (single-flight): функция выполняется
+    один раз, остальные ждут её результат. Исключения не кэшируются и достаются всем ожидающим.
+    Счётчики - в wrapper.cache_info(): evictions - вытеснения из-за maxsize, expirations -
+    записи, удалённые по ttl; сброс - wrapper.cache_clear().
+    """
+    if func is None:
+        return lambda func: cache(func, maxsize=maxsize, ttl=ttl, clock=clock)
+
+    storage = LRUCache(maxsize, ttl=ttl, clock=clock)
+    # лок защищает storage, in_flight и счётчики; сама функция вызывается вне лока
+    lock = threading.Lock()
+    in_flight: Dict[Any, Any] = {}
+    stats = {"hits": 0, "misses": 0, "coalesced": 0}
+
+    def lookup(key: Any):
+        # под локом: значение из кэша, либо уже идущее вычисление, либо None - вычислять нам
+        value = storage.get(key, _MISSING)
+        if value is not _MISSING:
+            stats["hits"] += 1
+            return value, None
+        pending = in_flight.get(key)
+        if pending is not None:
+            stats["coalesced"] += 1
+        else:
+            stats["misses"] += 1
+        return _MISSING, pending
+
+    def store(key: Any, value: Any) -> None:
+        # под локом; вытеснения и истечения считает сам LRUCache
+        storage.put(key, value)
+
+    if inspect.iscoroutinefunction(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            key = _make_key(args, kwargs)
+            with lock:
+                value, task = lookup(key)
+                if value is not _MISSING:
+                    return value
+                if task is None:
+                    task = in_flight[key] = asyncio.ensure_future(func(*args, **kwargs))
+                    task.add_done_callback(lambda task: finish(key, task))
+            # shield: отмена одного ожидающего не отменяет вычисление для остальных
+            return await asyncio.shield(task)
+
+        def finish(key: Any, task: asyncio.Future) -> None:
+            with lock:
+                del in_flight[key]
+                if not task.cancelled() and task.exception() is None:
+                    store(key, task.result())
+    else:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = _make_key(args, kwargs)
+            with lock:
+                value, future = lookup(key)
+                if value is not _MISSING:
+                    return value
+                if future is not None:
+                    leader = False
+                else:
+                    leader = True
+                    future = in_flight[key] = Future()
+            if not leader:
+                return future.result()
+            try:
+                value = func(*args, **kwargs)
+            except BaseException as e:
+                with lock:
+                    del in_flight[key]
+                future.set_exception(e)
+                raise
+            with lock:
+                del in_flight[key]
+                store(key, value)
+            future.set_result(value)
+            return value
+
+    def cache_info() -> CacheInfo:
+        with lock:
+            return CacheInfo(evictions=storage.evictions, expirations=storage.expirations,
+                             currsize=len(storage), maxsize=maxsize, **stats)
+
+    def cache_clear() -> None:
+        nonlocal storage
+        with lock:
+            storage = LRUCache(maxsize, ttl=ttl, clock=clock)
+            stats.update(hits=0, misses=0, coalesced=0)
+
+    wrapper.cache_info = cache_info
+    wrapper.cache_clear = cache_clear
     return wrapper
 
 
+def test_sync_cache():
+    calls = []
+
+    @cache(maxsize=2)
+    def square(x: int, power: int = 2):
+        calls.append(x)
+        return x ** power
+
+    assert square(3) == 9 and square(3) == 9, "Тест не пройден: неверный результат"
+    assert calls == [3], "Тест не пройден: повторный вызов не взят из кэша"
+    assert square(3, power=3) == 27 and calls == [3, 3], "Тест не пройден: kwargs не учитываются в ключе"
+    square(4)
+    assert square.cache_info() == CacheInfo(hits=1, misses=3, evictions=1, expirations=0, coalesced=0, currsize=2, maxsize=2), \
+        "Тест не пройден: неверные счётчики"
+
+    @cache
+    def fail(x):
+        calls.append("fail")
+        raise ValueError(x)
+
+    for _ in range(2):
+        try:
+            fail(1)
+            assert False, "Тест не пройден: исключение должно было быть вызвано"
+        except ValueError:
+            pass  # Ожидаемый результат
+    assert calls.count("fail") == 2, "Тест не пройден: исключение не должно кэшироваться"
+    assert fail.__name__ == "fail", "Тест не пройден: wraps не сохранил имя функции"
+
+    square.cache_clear()
+    assert square.cache_info().currsize == 0 and square(3) == 9 and calls[-1] == 3, "Тест не пройден: cache_clear"
+
+def test_ttl_expirations():
+    now = [0.0]
+    calls = []
+
+    @cache(maxsize=2, ttl=10, clock=lambda: now[0])
+    def double(x):
+        calls.append(x)
+        return x * 2
+
+    double(1)
+    double(2)
+    now[0] = 20.0
+    # оба ключа истекли: повторные вызовы пересчитываются, но это не вытеснения из-за maxsize
+    assert double(1) == 2 and double(2) == 4 and calls == [1, 2, 1, 2], "Тест не пройден: истёкшее значение взято из кэша"
+    info = double.cache_info()
+    assert (info.expirations, info.evictions) == (2, 0), "Тест не пройден: истечение TTL посчитано как вытеснение"
+    double(3)
+    info = double.cache_info()
+    assert (info.expirations, info.evictions) == (2, 1), "Тест не пройден: вытеснение из-за maxsize не посчитано"
+
+def test_sync_single_flight():
+    calls = []
+    started = threading.Event()
+    release = threading.Event()
+
+    @cache
+    def slow(x):
+        calls.append(x)
+        started.set()
+        release.wait(5)
+        return x * 2
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(slow(21))) for _ in range(8)]
+    threads[0].start()
+    started.wait(5)
+    for thread in threads[1:]:
+        thread.start()
+    # остальные потоки должны встать в ожидание до того, как вычисление закончится
+    while slow.cache_info().coalesced < 7:
+        threading.Event().wait(0.001)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert calls == [21] and results == [42] * 8, "Тест не пройден: функция выполнилась больше одного раза"
+    assert slow.cache_info().misses == 1 and slow.cache_info().coalesced == 7, "Тест не пройден: неверные счётчики"
+
+def test_async_single_flight():
+    calls = []
+
+    @cache(maxsize=16)
+    async def fetch(x):
+        calls.append(x)
+        await asyncio.sleep(0.01)
+        return x * 10
+
+    async def main():
+        results = await asyncio.gather(*(fetch(i % 3) for i in range(100)))
+        assert results == [i % 3 * 10 for i in range(100)], "Тест не пройден: неверные результаты"
+        assert sorted(calls) == [0, 1, 2], "Тест не пройден: каждый ключ должен вычисляться один раз"
+        assert await fetch(1) == 10 and len(calls) == 3, "Тест не пройден: готовое значение не взято из кэша"
+
+        # отмена одного ожидающего не мешает остальным
+        waiter, other = asyncio.ensure_future(fetch(7)), asyncio.ensure_future(fetch(7))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        assert await other == 70, "Тест не пройден: отмена ожидающего отменила вычисление"
+
+    asyncio.run(main())
+    info = fetch.cache_info()
+    assert (info.misses, info.coalesced, info.hits, info.currsize) == (4, 98, 1, 4), "Тест не пройден: неверные счётчики"
 
 
-@cache
-def foo(s: str, *args, **kwargs):
-    # print(foo.__name__)
-    return s
+# Запуск тестов
+if __name__ == "__main__":
+    test_sync_cache()
+    test_ttl_expirations()
+    test_sync_single_flight()
+    test_async_single_flight()
 
-foo("x",2,"xui",[1,2,3],lox="gay")
\ No newline at end of file
+    print("Все тесты пройдены!")
@@ -0,0 +1,254 @@
+from operator import add, sub
+from typing import Any, List, Tuple
+
+from matrix_class import Matrix, np
+
+
+class LazyMatrix:
+    """
+    Ленивая матрица: +, - и * не считают сразу, а строят дерево выражения. Дерево
+    вычисляется один раз при индексации, итерации, == или явном evaluate():
+    цепочка сумм сливается в один проход по строкам без промежуточных матриц,
+    а цепочка произведений перемножается в оптимальном порядке скобок.
+    """
+
+    __slots__ = ("rows", "cols", "_op", "_args", "_value", "_array")
+
+    def __init__(self, op: str, args: Tuple, rows: int, cols: int):
+        self.rows = rows
+        self.cols = cols
+        self._op = op
+        self._args = args
+        self._value = None
+        self._array = None
+
+    @classmethod
+    def _wrap(cls, value: Any) -> "LazyMatrix":
+        if isinstance(value, LazyMatrix):
+            return value
+        if isinstance(value, Matrix):
+            return cls("leaf", (value,), value.rows, value.cols)
+        raise TypeError(f"unsupported operand type {type(value).__name__}")
+
+    def _terms(self, sign: int) -> List[Tuple[int, "LazyMatrix"]]:
+        # a - (b - c) раскрывается в плоский список [(+1, a), (-1, b), (+1, c)]
+        if self._op != "sum" or self._value is not None:
+            return [(sign, self)]
+        return [(sign*term_sign, term) for term_sign, term in self._args]
+
+    def _combine(self, another: Any, sign: int, reflected: bool = False) -> "LazyMatrix":
+        if not isinstance(another, (Matrix, LazyMatrix)):
+            return NotImplemented
+        another = self._wrap(another)
+        if self.cols != another.cols:
+            raise Exception("cols dimension not same")
+        if self.rows != another.rows:
+            raise Exception("rows dimension not same")
+        if reflected:
+            terms = another._terms(1) + self._terms(sign)
+        else:
+            terms = self._terms(1) + another._terms(sign)
+        return LazyMatrix("sum", tuple(terms), self.rows, self.cols)
+
+    def __add__(self, another):
+        return self._combine(another, 1)
+
+    def __radd__(self, another):
+        return self._combine(another, 1, reflected=True)
+
+    def __sub__(self, another):
+        return self._combine(another, -1)
+
+    def __rsub__(self, another):
+        return self._combine(another, -1, reflected=True)
+
+    def _factors(self) -> List["LazyMatrix"]:
+        if self._op != "product" or self._value is not None:
+            return [self]
+        return list(self._args)
+
+    def __mul__(self, another):
+        if not isinstance(another, (Matrix, LazyMatrix)):
+            return NotImplemented
+        another = self._wrap(another)
+        if self.cols != another.rows:
+            raise Exception("wrong dimension")
+        return LazyMatrix("product", tuple(self._factors() + another._factors()), self.rows, another.cols)
+
+    def __rmul__(self, another):
+        if not isinstance(another, Matrix):
+            return NotImplemented
+        return self._wrap(another) * self
+
+    def evaluate(self) -> Matrix:
+        if self._value is None:
+            if self._op == "leaf":
+                self._value = self._args[0]
+            elif self._op == "sum":
+                self._value = _evaluate_sum(self._args)
+            else:
+                self._value = _evaluate_chain([factor.evaluate() for factor in self._args])
+            # дерево больше не нужно: отпускаем ссылки на операнды
+            self._op, self._args = "leaf", (self._value,)
+        return self._value
+
+    def _as_array(self):
+        # ndarray значения узла строится один раз: список списков копируется в массив только
+        # при первом смешанном с numpy вычислении, у numpy-матрицы asarray копии не делает
+        if self._array is None:
+            self._array = np.asarray(self.evaluate().matrix)
+        return self._array
+
+    def __getitem__(self, index):
+        return self.evaluate()[index]
+
+    def __iter__(self):
+        return iter(self.evaluate().matrix)
+
+    def __eq__(self, another):
+        if isinstance(another, LazyMatrix):
+            another = another.evaluate()
+        return self.evaluate() == another
+
+    __hash__ = None
+
+    def _expression(self) -> str:
+        if self._op == "leaf":
+            return f"[{self.rows}x{self.cols}]"
+        if self._op == "product":
+            return " * ".join(
+                f"({factor._expression()})" if factor._op == "sum" else factor._expression() for factor in self._args
+            )
+        text = ""
+        for sign, term in self._args:
+            term_text = term._expression()
+            if term._op == "sum":
+                term_text = f"({term_text})"
+            if text:
+                text += (" + " if sign > 0 else " - ") + term_text
+            else:
+                text = ("-" if sign < 0 else "") + term_text
+        return text
+
+    def __repr__(self):
+        return f"LazyMatrix({self._expression()})"
+
+
+def lazy(matrix: Matrix) -> LazyMatrix:
+    return LazyMatrix._wrap(matrix)
+
+
+def _evaluate_sum(terms) -> Matrix:
+    values = [(sign, term.evaluate()) for sign, term in terms]
+    if any(value.backend == "numpy" for _, value in values):
+        # один выходной массив, остальные слагаемые добавляются в него на месте;
+        # каждый операнд переводится в ndarray один раз и для dtype, и для сложения
+        arrays = [(sign, term._as_array()) for sign, term in terms]
+        sign, first = arrays[0]
+        answer = np.array(first, dtype=np.result_type(*(array for _, array in arrays)))
+        if sign < 0:
+            np.negative(answer, out=answer)
+        for sign, array in arrays[1:]:
+            (np.add if sign > 0 else np.subtract)(answer, array, out=answer)
+        return Matrix(answer)
+
+    # построчное слияние: временные только размером в одну строку, а не в целую матрицу
+    answer = []
+    for rows in zip(*(value.matrix for _, value in values)):
+        sign, row = values[0][0], rows[0]
+        answer_row = list(row) if sign > 0 else [-x for x in row]
+        for (sign, _), row in zip(values[1:], rows[1:]):
+            answer_row = list(map(add if sign > 0 else sub, answer_row, row))
+        answer.append(answer_row)
+    return Matrix(answer)
+
+
+def chain_order(dims: List[int]) -> List[List[int]]:
+    """
+    Оптимальная расстановка скобок для цепочки матриц размеров dims[i] x dims[i+1]
+    (динамика за O(k^3)). Возвращает таблицу разрезов split[i][j].
+    """
+    k = len(dims) - 1
+    cost = [[0]*k for _ in range(k)]
+    split = [[0]*k for _ in range(k)]
+    for length in range(2, k + 1):
+        for i in range(k - length + 1):
+            j = i + length - 1
+            cost[i][j] = float("inf")
+            for s in range(i, j):
+                candidate = cost[i][s] + cost[s + 1][j] + dims[i]*dims[s + 1]*dims[j + 1]
+                if candidate < cost[i][j]:
+                    cost[i][j], split[i][j] = candidate, s
+    return split
+
+
+def _evaluate_chain(matrices: List[Matrix]) -> Matrix:
+    if len(matrices) == 1:
+        return matrices[0]
+    split = chain_order([matrices[0].rows] + [matrix.cols for matrix in matrices])
+
+    def multiply(i: int, j: int) -> Matrix:
+        if i == j:
+            return matrices[i]
+        return multiply(i, split[i][j]) * multiply(split[i][j] + 1, j)
+
+    return multiply(0, len(matrices) - 1)
+
+
+def test_lazy_sum():
+    m1, m2, m3 = Matrix([[1, 2], [3, 4]]), Matrix([[5, 6], [7, 8]]), Matrix([[1, 1], [1, 1]])
+    expression = lazy(m1) + m2 - m3
+    assert expression._op == "sum" and len(expression._args) == 3, "Тест не пройден: сумма должна быть одним плоским узлом"
+    assert expression == m1 + m2 - m3, "Тест не пройден: неверная ленивая сумма"
+    assert expression[1][0] == 9, "Тест не пройден: неверная индексация"
+    assert [row for row in expression] == [[5, 7], [9, 11]], "Тест не пройден: неверная итерация"
+
+    # m1 - (m2 - m3) раскрывается со сменой знаков
+    assert m1 - (lazy(m2) - m3) == m1 - m2 + m3, "Тест не пройден: неверное раскрытие скобок"
+    assert (m1 + lazy(m2)).evaluate() == m1 + m2, "Тест не пройден: Matrix + LazyMatrix"
+    if np is not None:
+        assert lazy(m1.to_numpy()) + m2 - m3 == m1 + m2 - m3, "Тест не пройден: ленивая сумма для numpy"
+        # операнд переводится в ndarray один раз на лист, numpy-матрица - вообще без копии
+        numpy_leaf, python_leaf = lazy(m1.to_numpy()), lazy(m2)
+        assert (numpy_leaf + python_leaf).evaluate() == m1 + m2, "Тест не пройден: смешанная ленивая сумма"
+        converted = python_leaf._array
+        assert np.shares_memory(numpy_leaf._array, numpy_leaf.evaluate().matrix), "Тест не пройден: лишняя копия numpy-операнда"
+        assert (numpy_leaf - python_leaf).evaluate() == m1 - m2 and python_leaf._array is converted, \
+            "Тест не пройден: операнд повторно переведён в ndarray"
+
+    try:
+        lazy(m1) + Matrix([[1, 2, 3], [4, 5, 6]])
+        assert False, "Тест не пройден: исключение должно было быть вызвано при разных размерах"
+    except Exception as e:
+        assert str(e) == "cols dimension not same"
+
+def test_lazy_chain():
+    a = Matrix([[1, 2, 3]] * 10)                 # 10x3
+    b = Matrix([[1] * 100 for _ in range(3)])    # 3x100
+    c = Matrix([[2, 1] for _ in range(100)])     # 100x2
+    expression = lazy(a) * b * c
+    assert len(expression._args) == 3, "Тест не пройден: произведение должно быть одним плоским узлом"
+    assert expression == a * b * c, "Тест не пройден: неверное ленивое произведение"
+
+    # (10x3 * 3x100) * 100x2 стоит 3000 + 2000 умножений, 10x3 * (3x100 * 100x2) - 600 + 60
+    assert chain_order([10, 3, 100, 2])[0][2] == 0, "Тест не пройден: неверный порядок скобок"
+    assert chain_order([2, 100, 3, 10])[0][2] == 1, "Тест не пройден: неверный порядок скобок"
+
+    mixed = (lazy(a) * b + lazy(a) * b) * c
+    assert repr(mixed) == "LazyMatrix(([10x3] * [3x100] + [10x3] * [3x100]) * [100x2])", "Тест не пройден: неверный repr"
+    assert mixed == (a * b + a * b) * c, "Тест не пройден: неверное смешанное выражение"
+    assert repr(mixed) == "LazyMatrix([10x2])", "Тест не пройден: после вычисления дерево должно схлопнуться"
+
+    try:
+        lazy(a) * a
+        assert False, "Тест не пройден: исключение должно было быть вызвано при неверных размерах"
+    except Exception as e:
+        assert str(e) == "wrong dimension"
+
+
+# Запуск тестов
+if __name__ == "__main__":
+    test_lazy_sum()
+    test_lazy_chain()
+
+    print("Все тесты пройдены!")
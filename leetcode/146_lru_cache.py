@@ -1,4 +1,10 @@
-from typing import Any, List
+import heapq
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+
+# put(..., ttl=None) означает "без срока", поэтому "взять ttl кэша" - отдельный маркер
+_DEFAULT_TTL = object()
 
 
 class Node:
@@ -8,6 +14,8 @@ class Node:
         self.value: Any = value
         self.next: Node = None
         self.prev: Node = None
+        self.weight: int = 1
+        self.expires_at: Optional[float] = None
 
 
 class DoubleLinkedList:
@@ -21,7 +29,9 @@ class DoubleLinkedList:
         if not new_node:
             new_node = Node(key, value)
         self.size += 1
+        new_node.prev = None
         if self.head is None:
+            new_node.next = None
             self.head = new_node
             self.tail = new_node
         else:
@@ -29,71 +39,176 @@ class DoubleLinkedList:
             new_node.next = self.head
             self.head = new_node
 
-            # print(node.value)
-            # print(node.next)
-            # print(node.prev)
-
-
     def pop_tail(self) -> Node:
         if self.tail is not None:
             temp = self.tail
-            self.tail = self.tail.prev
-            if self.tail:
-                self.tail.next = None
-            else:
-                self.head = None
-            self.size -= 1
+            self.remove(temp)
             return temp
-    
-    def move_to_head(self, node: Node) -> None:
-
-        # print(node.value)
-        # print(node.next)
-        # print(node.prev)
 
-        if node is self.head:
-            pass
-        elif node is self.tail:
-            self.pop_tail()
-            self.append_head(-1, -1 , node)
+    def remove(self, node: Node) -> None:
+        if node.prev:
+            node.prev.next = node.next
         else:
-            self.size -= 1
+            self.head = node.next
+        if node.next:
             node.next.prev = node.prev
-            node.prev.next = node.next
+        else:
+            self.tail = node.prev
+        node.prev = node.next = None
+        self.size -= 1
+    
+    def move_to_head(self, node: Node) -> None:
+        if node is not self.head:
+            self.remove(node)
             self.append_head(-1, -1 , node)
 
 
+class TimerWheel:
+    """
+    Колесо таймеров: запись попадает в слот своего тика int(expires_at / resolution).
+    Слоты лежат в словаре по номеру тика, а не по модулю длины колеса, поэтому в слоте
+    нет записей из будущих оборотов. Номера тиков слотов лежат в куче: advance(now) снимает
+    с неё только прошедшие тики и стоит O(истёкших + прошедших слотов * log слотов),
+    сколько бы ни длился простой и сколько бы слотов ни ждало в будущем.
+    """
+
+    def __init__(self, now: float, resolution: float = 1.0):
+        self.resolution = resolution
+        self.slots: Dict[int, Dict[Any, Node]] = {}
+        # каждый тик из slots лежит в куче ровно один раз: опустевший слот не удаляется
+        # до advance, иначе повторное планирование в тот же тик дублировало бы его в куче
+        self._ticks: List[int] = []
+
+    def _tick(self, expires_at: float) -> int:
+        return int(expires_at // self.resolution)
+
+    def schedule(self, node: Node) -> None:
+        tick = self._tick(node.expires_at)
+        slot = self.slots.get(tick)
+        if slot is None:
+            slot = self.slots[tick] = {}
+            heapq.heappush(self._ticks, tick)
+        slot[node.key] = node
+
+    def remove(self, node: Node) -> None:
+        slot = self.slots.get(self._tick(node.expires_at))
+        if slot is not None:
+            slot.pop(node.key, None)
+
+    def advance(self, now: float) -> List[Node]:
+        # текущий тик ещё не закончился: его записи истекут лениво в get или на следующем тике
+        current = int(now // self.resolution)
+        ticks = self._ticks
+        expired = []
+        while ticks and ticks[0] < current:
+            expired.extend(self.slots.pop(heapq.heappop(ticks)).values())
+        return expired
 
-            
 
 class LRUCache:
-
-    def __init__(self, capacity: int):
+    """
+    LRU-кэш на словаре и двусвязном списке. Кроме ограничения по числу записей (capacity)
+    умеет ограничение по суммарному весу (max_weight, вес считает weigher(key, value)) и TTL:
+    истёкшая запись не возвращается get сразу (лениво), а память под истёкшие записи
+    освобождается колесом таймеров на каждом put и в expire() с точностью до ttl_resolution.
+    """
+
+    def __init__(self, capacity: Optional[int] = None, max_weight: Optional[int] = None,
+                 weigher: Optional[Callable[[Any, Any], int]] = None, ttl: Optional[float] = None,
+                 ttl_resolution: float = 1.0, clock: Callable[[], float] = time.monotonic):
+        if capacity is None and max_weight is None:
+            raise ValueError("capacity or max_weight is required")
+        if weigher is not None and max_weight is None:
+            raise ValueError("weigher requires max_weight")
         self.capacity = capacity
+        self.max_weight = max_weight
+        self.weigher = weigher
+        self.ttl = ttl
+        self.ttl_resolution = ttl_resolution
+        self.clock = clock
+        self.total_weight = 0
+        # вытеснения из-за capacity/max_weight и удаления по TTL считаются раздельно
+        self.evictions = 0
+        self.expirations = 0
         self.node_map = {}
         self.dl_list = DoubleLinkedList()
-
-    def get(self, key: int) -> int:
+        self._wheel: Optional[TimerWheel] = None
+
+    def _remove(self, node: Node, unschedule: bool = True) -> None:
+        if unschedule and node.expires_at is not None:
+            self._wheel.remove(node)
+        self.dl_list.remove(node)
+        del self.node_map[node.key]
+        self.total_weight -= node.weight
+
+    def _expire(self, now: float) -> int:
+        expired = self._wheel.advance(now)
+        self.expirations += len(expired)
+        for node in expired:
+            self._remove(node, unschedule=False)
+        return len(expired)
+
+    def expire(self) -> int:
+        # периодическая очистка: удалить все истёкшие записи, вернуть их количество
+        if self._wheel is None:
+            return 0
+        return self._expire(self.clock())
+
+    def get(self, key: int, default: Any = -1) -> int:
         if key not in self.node_map:
-            return -1 
+            return default
         node = self.node_map[key]
+        if node.expires_at is not None and node.expires_at <= self.clock():
+            self._remove(node)
+            self.expirations += 1
+            return default
         self.dl_list.move_to_head(node)
-        # self.node_map[key] = self.dl_list.head
         return node.value
         
-    def put(self, key: int, value: int) -> None:
+    def put(self, key: int, value: int, ttl: Any = _DEFAULT_TTL) -> None:
+        # ttl не передан - ttl кэша, None - запись без срока даже при ttl кэша
+        if ttl is _DEFAULT_TTL:
+            ttl = self.ttl
+        now = None
+        if ttl is not None or self._wheel is not None:
+            now = self.clock()
+            if self._wheel is None:
+                self._wheel = TimerWheel(now, self.ttl_resolution)
+            self._expire(now)
+
+        weight = self.weigher(key, value) if self.weigher else 1
+        if self.max_weight is not None and weight > self.max_weight:
+            # запись тяжелее всего кэша не помещается, а старое значение ключа уже неверно
+            if key in self.node_map:
+                self._remove(self.node_map[key])
+                self.evictions += 1
+            return
+
         if key not in self.node_map:
-            if self.capacity == self.dl_list.size:
-                old_node = self.dl_list.pop_tail()
-                del self.node_map[old_node.key]
             self.dl_list.append_head(key, value)
-            self.node_map[key] = self.dl_list.head
+            node = self.node_map[key] = self.dl_list.head
         else:
             node = self.node_map[key]
             node.value = value
+            self.total_weight -= node.weight
+            if node.expires_at is not None:
+                self._wheel.remove(node)
             self.dl_list.move_to_head(node)
-            # self.node_map[key] = self.dl_list.head
+        node.weight = weight
+        self.total_weight += weight
+        node.expires_at = None if ttl is None else now + ttl
+        if ttl is not None:
+            self._wheel.schedule(node)
+
+        # новая запись в голове списка, вытесняются самые давние с хвоста
+        while (self.capacity is not None and self.dl_list.size > self.capacity) or \
+                (self.max_weight is not None and self.total_weight > self.max_weight):
+            self._remove(self.dl_list.tail)
+            self.evictions += 1
+
 
+    def __len__(self) -> int:
+        return self.dl_list.size
 
     def __str__(self) -> str:
         # Создаем список ключей, начиная с головы (самый недавно использованный)
@@ -173,4 +288,87 @@ def main():
     print(cache.get(5))  # Ожидаемый вывод: 5
 
 
-main()
\ No newline at end of file
+def test_ttl_expiry():
+    now = [0.0]
+    cache = LRUCache(100, ttl=10, clock=lambda: now[0])
+    cache.put("a", 1)
+    cache.put("b", 2, ttl=30)
+    now[0] = 9.5
+    assert cache.get("a") == 1, "Тест не пройден: запись истекла раньше срока"
+    now[0] = 10.0
+    assert cache.get("a") == -1, "Тест не пройден: get вернул истёкшую запись"
+    assert "a" not in cache.node_map, "Тест не пройден: истёкшая запись не удалена при get"
+
+    # повторный put продлевает срок жизни
+    cache.put("b", 3, ttl=5)
+    now[0] = 14.0
+    assert cache.get("b") == 3, "Тест не пройден: put не обновил TTL"
+
+    for i in range(50):
+        cache.put(i, i, ttl=1)
+    cache.put("forever", 0, ttl=1000)
+    now[0] = 16.0
+    # 50 ключей с ttl=1 и "b" истекли; в колесе остаётся только долгоживущая запись
+    assert cache.expire() == 51, "Тест не пройден: expire удалил неверное число записей"
+    assert (cache.expirations, cache.evictions) == (52, 0), "Тест не пройден: истечение TTL не должно считаться вытеснением"
+    assert list(cache.node_map) == ["forever"], "Тест не пройден: неверные записи после expire"
+    assert cache.dl_list.size == 1 and cache.total_weight == 1, "Тест не пройден: список или вес рассинхронизированы"
+    assert sum(len(slot) for slot in cache._wheel.slots.values()) == 1, "Тест не пройден: в колесе остались удалённые записи"
+
+    # ttl=None отменяет ttl кэша: запись живёт, пока её не вытеснят
+    cache.put("no_ttl", 1, ttl=None)
+    cache.put("default_ttl", 2)
+    now[0] = 10_000.0
+    assert cache.get("no_ttl") == 1 and cache.get("default_ttl") == -1, "Тест не пройден: ttl=None должен означать запись без срока"
+    assert cache.node_map["no_ttl"].expires_at is None, "Тест не пройден: запись без срока попала в колесо"
+
+    # после долгого простоя advance снимает только прошедшие тики, будущие слоты не трогает
+    wheel = TimerWheel(0.0)
+    nodes = [Node(key, key) for key in range(4)]
+    for node, expires_at in zip(nodes, (5.0, 1000.0, 1000.5, 1e12)):
+        node.expires_at = expires_at
+        wheel.schedule(node)
+    wheel.remove(nodes[0])
+    wheel.schedule(nodes[0])
+    wheel.remove(nodes[0])
+    assert len(wheel._ticks) == len(wheel.slots) == 3, "Тест не пройден: тик слота продублирован в куче"
+    assert [node.key for node in wheel.advance(1e6)] == [1, 2], "Тест не пройден: advance вернул неверные записи"
+    assert list(wheel.slots) == [int(1e12)] and wheel._ticks == [int(1e12)], "Тест не пройден: будущий слот не должен сниматься"
+
+    # простой кэш по-прежнему вытесняет по числу записей и не трогает часы
+    cache = LRUCache(2, clock=lambda: 1 / 0)
+    for key in (1, 2, 3):
+        cache.put(key, key)
+    assert cache.get(1) == -1 and cache.get(3) == 3, "Тест не пройден: неверное вытеснение по capacity"
+    assert (cache.evictions, cache.expirations) == (1, 0), "Тест не пройден: неверные счётчики вытеснений"
+
+def test_max_weight():
+    cache = LRUCache(max_weight=10, weigher=lambda key, value: len(value))
+    cache.put("a", "xxxx")
+    cache.put("b", "xxxx")
+    assert cache.get("a") == "xxxx"
+    cache.put("c", "xxx")
+    # вес 11 > 10: вытесняется давний "b", а не только что прочитанный "a"
+    assert cache.get("b") == -1 and cache.total_weight == 7, "Тест не пройден: неверное вытеснение по весу"
+
+    cache.put("a", "x" * 9)
+    assert list(cache.node_map) == ["a"] and cache.total_weight == 9, "Тест не пройден: обновление веса не вытеснило записи"
+
+    cache.put("a", "x" * 11)
+    assert cache.get("a") == -1 and cache.total_weight == 0, "Тест не пройден: запись тяжелее кэша должна удалить ключ"
+    assert cache.dl_list.head is None and cache.dl_list.tail is None, "Тест не пройден: список не пуст"
+
+    try:
+        LRUCache()
+        assert False, "Тест не пройден: ValueError должен был быть вызван без capacity и max_weight"
+    except ValueError:
+        pass  # Ожидаемый результат
+
+
+# Запуск тестов
+if __name__ == "__main__":
+    main()
+    test_ttl_expiry()
+    test_max_weight()
+
+    print("Все тесты пройдены!")
@@ -0,0 +1,209 @@
+import importlib
+import random
+from array import array
+from typing import Any, Dict, List, Optional
+
+_MISSING = object()
+
+
+class ArrayLRUCache:
+    """
+    LRU-кэш без объекта Node на каждую запись: ключи, значения и связи prev/next лежат
+    в заранее выделенных параллельных массивах, запись - это номер слота. Связи хранятся
+    в array по 4 байта, слот capacity - страж кольцевого списка (next[страж] - самый свежий,
+    prev[страж] - самый давний). Вытеснение переиспользует слот вытесненного ключа, а слоты
+    из pop() уходят в список свободных. value_typecode (например "q" или "d") хранит и
+    значения в array, без отдельного объекта на каждое число.
+    """
+
+    __slots__ = ("capacity", "_slots", "_keys", "_values", "_prev", "_next", "_used", "_free")
+
+    def __init__(self, capacity: int, value_typecode: Optional[str] = None):
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self._slots: Dict[Any, int] = {}
+        self._keys: List[Any] = [None] * capacity
+        if value_typecode is None:
+            self._values = [None] * capacity
+        else:
+            self._values = array(value_typecode, bytes(array(value_typecode).itemsize * capacity))
+        link = "i" if capacity < 2**31 - 1 else "q"
+        self._prev = array(link, [capacity]) * (capacity + 1)
+        self._next = array(link, [capacity]) * (capacity + 1)
+        # слоты от _used ещё ни разу не выдавались; _free - стек освобождённых, связанный через _next
+        self._used = 0
+        self._free = -1
+
+    def get(self, key: Any, default: Any = -1) -> Any:
+        slot = self._slots.get(key)
+        if slot is None:
+            return default
+        nxt, sentinel = self._next, self.capacity
+        head = nxt[sentinel]
+        if head != slot:
+            # перенос в голову развёрнут вручную: вызовы методов тут заметно дороже самих операций
+            prv = self._prev
+            before, after = prv[slot], nxt[slot]
+            nxt[before] = after
+            prv[after] = before
+            nxt[slot] = head
+            prv[slot] = sentinel
+            prv[head] = slot
+            nxt[sentinel] = slot
+        return self._values[slot]
+
+    def put(self, key: Any, value: Any) -> None:
+        slots, nxt, prv, sentinel = self._slots, self._next, self._prev, self.capacity
+        slot = slots.get(key)
+        if slot is not None:
+            self._values[slot] = value
+            if nxt[sentinel] == slot:
+                return
+            before, after = prv[slot], nxt[slot]
+            nxt[before] = after
+            prv[after] = before
+        elif len(slots) < sentinel:
+            # значение пишется первым: если array с value_typecode его не примет (TypeError,
+            # OverflowError), слот ещё не выдан и кэш не изменился
+            slot = self._free if self._free >= 0 else self._used
+            self._values[slot] = value
+            if slot == self._free:
+                self._free = nxt[slot]
+            else:
+                self._used += 1
+            self._keys[slot] = key
+            slots[key] = slot
+        else:
+            # кэш полон: самый давний слот отдаётся новому ключу; старое значение
+            # перезаписывается до вытеснения по той же причине
+            slot = prv[sentinel]
+            self._values[slot] = value
+            del slots[self._keys[slot]]
+            before = prv[slot]
+            nxt[before] = sentinel
+            prv[sentinel] = before
+            self._keys[slot] = key
+            slots[key] = slot
+        head = nxt[sentinel]
+        nxt[slot] = head
+        prv[slot] = sentinel
+        prv[head] = slot
+        nxt[sentinel] = slot
+
+    def pop(self, key: Any, default: Any = _MISSING) -> Any:
+        slot = self._slots.pop(key, None)
+        if slot is None:
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+        nxt, prv = self._next, self._prev
+        before, after = prv[slot], nxt[slot]
+        nxt[before] = after
+        prv[after] = before
+        value = self._values[slot]
+        self._keys[slot] = None
+        if isinstance(self._values, list):
+            self._values[slot] = None
+        nxt[slot] = self._free
+        self._free = slot
+        return value
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._slots
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def items(self):
+        # от самого свежего к самому давнему
+        nxt, sentinel = self._next, self.capacity
+        slot = nxt[sentinel]
+        while slot != sentinel:
+            yield self._keys[slot], self._values[slot]
+            slot = nxt[slot]
+
+    def __str__(self) -> str:
+        # большой кэш целиком не печатаем: только размер и первые записи
+        shown = []
+        for key, value in self.items():
+            if len(shown) == 10:
+                shown.append("...")
+                break
+            shown.append(f"({key}: {value})")
+        return f"ArrayLRUCache {len(self)}/{self.capacity}: " + (" -> ".join(shown) if shown else "empty")
+
+
+def test_matches_lru_cache():
+    # на случайной последовательности операций ведёт себя в точности как LRUCache из задачи 146
+    LRUCache = importlib.import_module("146_lru_cache").LRUCache
+
+    rng = random.Random(1)
+    for capacity in (1, 2, 5, 50):
+        cache, reference = ArrayLRUCache(capacity), LRUCache(capacity)
+        for _ in range(5000):
+            key = rng.randrange(capacity * 3)
+            if rng.random() < 0.5:
+                assert cache.get(key) == reference.get(key), "Тест не пройден: get расходится с LRUCache"
+            else:
+                cache.put(key, key * 7)
+                reference.put(key, key * 7)
+        assert len(cache) == reference.dl_list.size, "Тест не пройден: неверный размер"
+        order, node = [], reference.dl_list.head
+        while node:
+            order.append((node.key, node.value))
+            node = node.next
+        assert list(cache.items()) == order, "Тест не пройден: порядок LRU расходится с LRUCache"
+
+def test_pop_reuses_slots():
+    cache = ArrayLRUCache(3, value_typecode="q")
+    for key in "abc":
+        cache.put(key, ord(key))
+    assert cache.pop("b") == ord("b") and "b" not in cache, "Тест не пройден: pop не удалил ключ"
+    assert cache.pop("b", None) is None, "Тест не пройден: pop не вернул default"
+    try:
+        cache.pop("b")
+        assert False, "Тест не пройден: KeyError не был вызван при удалении несуществующего ключа"
+    except KeyError:
+        pass  # Ожидаемый результат
+
+    cache.put("d", 4)
+    assert cache._slots["d"] == 1 and cache._used == 3, "Тест не пройден: освобождённый слот не переиспользован"
+    cache.put("e", 5)
+    assert "a" not in cache and cache._slots["e"] == 0, "Тест не пройден: новый ключ должен занять слот вытесненного"
+    assert list(cache.items()) == [("e", 5), ("d", 4), ("c", 99)], "Тест не пройден: неверный порядок"
+    assert str(cache) == "ArrayLRUCache 3/3: (e: 5) -> (d: 4) -> (c: 99)", "Тест не пройден: неверный str"
+
+    # значение, которое не принимает array, не должно отнимать слот
+    for bad in ("x", 2**70):
+        before = list(cache.items())
+        for key in ("e", "f"):
+            try:
+                cache.put(key, bad)
+                assert False, "Тест не пройден: array должен был отвергнуть значение"
+            except (TypeError, OverflowError):
+                pass  # Ожидаемый результат
+        assert list(cache.items()) == before and len(cache) == 3, "Тест не пройден: отвергнутое значение изменило кэш"
+    cache.pop("d")
+    try:
+        cache.put("f", "x")
+        assert False, "Тест не пройден: array должен был отвергнуть значение"
+    except TypeError:
+        pass  # Ожидаемый результат
+    cache.put("f", 6)
+    cache.put("g", 7)
+    assert list(cache.items()) == [("g", 7), ("f", 6), ("e", 5)], "Тест не пройден: слот потерян после отвергнутого значения"
+
+    try:
+        ArrayLRUCache(0)
+        assert False, "Тест не пройден: ValueError должен был быть вызван при нулевой ёмкости"
+    except ValueError:
+        pass  # Ожидаемый результат
+
+
+# Запуск тестов
+if __name__ == "__main__":
+    test_matches_lru_cache()
+    test_pop_reuses_slots()
+
+    print("Все тесты пройдены!")
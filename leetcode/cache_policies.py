@@ -0,0 +1,431 @@
+import importlib
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional, Tuple
+
+from array_lru_cache import ArrayLRUCache
+
+# имя файла задачи начинается с цифры, поэтому обычный import не подходит
+_lru = importlib.import_module("146_lru_cache")
+DoubleLinkedList, LRUCache, Node = _lru.DoubleLinkedList, _lru.LRUCache, _lru.Node
+
+
+class CachePolicy(ABC):
+    """
+    Общий интерфейс кэшей с разными политиками вытеснения: get(key, default) и put(key, value),
+    как у LRUCache, плюс len(). Промах get возвращает default (по умолчанию -1, как в задаче 146).
+    """
+
+    @abstractmethod
+    def get(self, key: Any, default: Any = -1) -> Any:
+        ...
+
+    @abstractmethod
+    def put(self, key: Any, value: Any) -> None:
+        ...
+
+    @abstractmethod
+    def __len__(self) -> int:
+        ...
+
+
+# LRUCache и ArrayLRUCache уже реализуют интерфейс, наследоваться им не нужно
+CachePolicy.register(LRUCache)
+CachePolicy.register(ArrayLRUCache)
+
+
+class _Segment:
+    """Один LRU-сегмент политики: DoubleLinkedList из задачи 146 и словарь ключ -> узел."""
+
+    __slots__ = ("nodes", "order")
+
+    def __init__(self):
+        self.nodes: Dict[Any, Node] = {}
+        self.order = DoubleLinkedList()
+
+    def __len__(self) -> int:
+        return self.order.size
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self.nodes
+
+    def push(self, node: Node) -> Node:
+        # в голову списка - самый недавно использованный
+        self.order.append_head(node.key, node.value, node)
+        self.nodes[node.key] = node
+        return node
+
+    def remove(self, key: Any) -> Node:
+        node = self.nodes.pop(key)
+        self.order.remove(node)
+        return node
+
+    def pop_lru(self) -> Node:
+        node = self.order.pop_tail()
+        del self.nodes[node.key]
+        return node
+
+
+class SLRUCache(CachePolicy):
+    """
+    Сегментированный LRU: новые ключи попадают в испытательный сегмент (probation), повторное
+    обращение переводит ключ в защищённый (protected). Одноразовые ключи скана вытесняются
+    из probation, не задевая защищённые.
+    """
+
+    def __init__(self, capacity: int, protected_ratio: float = 0.8):
+        self.capacity = capacity
+        self.protected_capacity = int(capacity * protected_ratio)
+        self.probation = _Segment()
+        self.protected = _Segment()
+
+    def get(self, key: Any, default: Any = -1) -> Any:
+        node = self.protected.nodes.get(key)
+        if node is not None:
+            self.protected.order.move_to_head(node)
+            return node.value
+        if key in self.probation:
+            node = self.protected.push(self.probation.remove(key))
+            if len(self.protected) > self.protected_capacity:
+                self.probation.push(self.protected.pop_lru())
+            return node.value
+        return default
+
+    def put(self, key: Any, value: Any) -> None:
+        if key in self.protected or key in self.probation:
+            self.get(key)
+            (self.protected.nodes.get(key) or self.probation.nodes[key]).value = value
+            return
+        if len(self) >= self.capacity:
+            (self.probation if len(self.probation) else self.protected).pop_lru()
+        self.probation.push(Node(key, value))
+
+    def __len__(self) -> int:
+        return len(self.probation) + len(self.protected)
+
+
+class TwoQueueCache(CachePolicy):
+    """
+    2Q (Johnson, Shasha): новые ключи живут в FIFO a1_in, вытесненные из неё ключи помнятся
+    без значений в FIFO a1_out. Только ключ, снова запрошенный из a1_out, попадает в основной
+    LRU am, поэтому однократный скан проходит через a1_in и не вымывает am.
+    """
+
+    def __init__(self, capacity: int, in_ratio: float = 0.25, out_ratio: float = 0.5):
+        self.capacity = capacity
+        self.in_capacity = max(1, int(capacity * in_ratio))
+        self.out_capacity = max(1, int(capacity * out_ratio))
+        self.a1_in = _Segment()
+        self.a1_out = _Segment()
+        self.am = _Segment()
+
+    def get(self, key: Any, default: Any = -1) -> Any:
+        node = self.am.nodes.get(key)
+        if node is not None:
+            self.am.order.move_to_head(node)
+            return node.value
+        # попадание в a1_in не меняет порядок: это FIFO
+        node = self.a1_in.nodes.get(key)
+        return default if node is None else node.value
+
+    def _reclaim(self) -> None:
+        if len(self.a1_in) + len(self.am) < self.capacity:
+            return
+        if len(self.a1_in) > self.in_capacity or not len(self.am):
+            node = self.a1_in.pop_lru()
+            node.value = None
+            self.a1_out.push(node)
+            if len(self.a1_out) > self.out_capacity:
+                self.a1_out.pop_lru()
+        else:
+            self.am.pop_lru()
+
+    def put(self, key: Any, value: Any) -> None:
+        node = self.am.nodes.get(key) or self.a1_in.nodes.get(key)
+        if node is not None:
+            node.value = value
+            if key in self.am:
+                self.am.order.move_to_head(node)
+            return
+        if key in self.a1_out:
+            self.a1_out.remove(key)
+            self._reclaim()
+            self.am.push(Node(key, value))
+        else:
+            self._reclaim()
+            self.a1_in.push(Node(key, value))
+
+    def __len__(self) -> int:
+        return len(self.a1_in) + len(self.am)
+
+
+class ARCCache(CachePolicy):
+    """
+    Adaptive Replacement Cache (Megiddo, Modha): t1 - ключи, увиденные один раз, t2 - хотя бы
+    дважды, b1/b2 - призраки (ключи без значений), недавно вытесненные из t1/t2. Промах
+    в призраке сдвигает целевой размер t1 (p) в сторону той очереди, которой не хватило места,
+    так что кэш сам подстраивается между recency и frequency.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.p = 0.0
+        self.t1, self.t2 = _Segment(), _Segment()
+        self.b1, self.b2 = _Segment(), _Segment()
+
+    def get(self, key: Any, default: Any = -1) -> Any:
+        if key in self.t1:
+            return self.t2.push(self.t1.remove(key)).value
+        node = self.t2.nodes.get(key)
+        if node is not None:
+            self.t2.order.move_to_head(node)
+            return node.value
+        return default
+
+    def _replace(self, in_b2: bool) -> None:
+        # вытеснить из t1 или t2 в соответствующий призрачный список
+        t1_size = len(self.t1)
+        if t1_size and (t1_size > self.p or (in_b2 and t1_size == self.p) or not len(self.t2)):
+            node = self.t1.pop_lru()
+            node.value = None
+            self.b1.push(node)
+        else:
+            node = self.t2.pop_lru()
+            node.value = None
+            self.b2.push(node)
+
+    def put(self, key: Any, value: Any) -> None:
+        node = self.t1.nodes.get(key) or self.t2.nodes.get(key)
+        if node is not None:
+            node.value = value
+            self.get(key)
+            return
+
+        capacity = self.capacity
+        if key in self.b1:
+            self.p = min(capacity, self.p + max(len(self.b2) / len(self.b1), 1))
+            self._replace(False)
+            node = self.b1.remove(key)
+        elif key in self.b2:
+            self.p = max(0.0, self.p - max(len(self.b1) / len(self.b2), 1))
+            self._replace(True)
+            node = self.b2.remove(key)
+        else:
+            l1 = len(self.t1) + len(self.b1)
+            if l1 == capacity:
+                if len(self.t1) < capacity:
+                    self.b1.pop_lru()
+                    self._replace(False)
+                else:
+                    self.t1.pop_lru()
+            elif l1 < capacity and l1 + len(self.t2) + len(self.b2) >= capacity:
+                if l1 + len(self.t2) + len(self.b2) == 2 * capacity:
+                    self.b2.pop_lru()
+                self._replace(False)
+            self.t1.push(Node(key, value))
+            return
+        # ключ из призрака уже встречался раньше - сразу в t2
+        node.value = value
+        self.t2.push(node)
+
+    def __len__(self) -> int:
+        return len(self.t1) + len(self.t2)
+
+
+class CountMinSketch:
+    """
+    Count-min sketch для оценки частоты ключей: 4 строки счётчиков, ключ увеличивает по одному
+    счётчику в каждой строке, оценка - минимум из них. Счётчики насыщаются на 15 (как 4-битные
+    в Caffeine), а после sample_size увеличений все делятся пополам - старая популярность забывается.
+    """
+
+    # таблица для bytes.translate: каждый счётчик делится пополам за один проход в C
+    _HALVE = bytes(value >> 1 for value in range(256))
+
+    def __init__(self, capacity: int, sample_factor: int = 10):
+        self.width = 1 << max(4, (capacity - 1).bit_length())
+        self.table = bytearray(self.width * 4)
+        self.sample_size = sample_factor * max(capacity, 1)
+        self.additions = 0
+
+    def _indexes(self, key: Any) -> Tuple[int, int, int, int]:
+        # двойное хеширование: строка row получает индекс h1 + row*h2 из одного перемешанного хеша;
+        # глубина зафиксирована, чтобы развернуть цикл - это главный расход времени W-TinyLFU
+        h = (hash(key) * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF
+        h1, h2 = h >> 32, (h & 0xFFFFFFFF) | 1
+        width = self.width
+        mask = width - 1
+        return (h1 & mask, width + ((h1 + h2) & mask),
+                2*width + ((h1 + 2*h2) & mask), 3*width + ((h1 + 3*h2) & mask))
+
+    def frequency(self, key: Any) -> int:
+        table = self.table
+        i0, i1, i2, i3 = self._indexes(key)
+        return min(table[i0], table[i1], table[i2], table[i3])
+
+    def increment(self, key: Any) -> None:
+        table = self.table
+        for i in self._indexes(key):
+            if table[i] < 15:
+                table[i] += 1
+        self.additions += 1
+        if self.additions >= self.sample_size:
+            self.table = table.translate(self._HALVE)
+            self.additions //= 2
+
+
+class WTinyLFUCache(CachePolicy):
+    """
+    W-TinyLFU (как в Caffeine): маленькое окно LRU (window_ratio ёмкости) для всплесков новых ключей
+    и основной SLRU. Ключ, вытесненный из окна, попадает в основной кэш, только если по
+    CountMinSketch он популярнее кандидата на вытеснение оттуда - так скан из одноразовых
+    ключей не вымывает часто используемые.
+    """
+
+    def __init__(self, capacity: int, window_ratio: float = 0.01, protected_ratio: float = 0.8):
+        self.capacity = capacity
+        self.window_capacity = max(1, int(capacity * window_ratio))
+        self.main_capacity = capacity - self.window_capacity
+        self.protected_capacity = int(self.main_capacity * protected_ratio)
+        self.window, self.probation, self.protected = _Segment(), _Segment(), _Segment()
+        self.sketch = CountMinSketch(capacity)
+
+    def get(self, key: Any, default: Any = -1) -> Any:
+        node = self.window.nodes.get(key)
+        if node is not None:
+            self.window.order.move_to_head(node)
+        else:
+            node = self.protected.nodes.get(key)
+            if node is not None:
+                self.protected.order.move_to_head(node)
+            elif key in self.probation:
+                node = self.protected.push(self.probation.remove(key))
+                if len(self.protected) > self.protected_capacity:
+                    self.probation.push(self.protected.pop_lru())
+            else:
+                return default
+        self.sketch.increment(key)
+        return node.value
+
+    def put(self, key: Any, value: Any) -> None:
+        for segment in (self.window, self.protected, self.probation):
+            node = segment.nodes.get(key)
+            if node is not None:
+                node.value = value
+                self.get(key)
+                return
+
+        self.sketch.increment(key)
+        self.window.push(Node(key, value))
+        if len(self.window) <= self.window_capacity:
+            return
+        candidate = self.window.pop_lru()
+        if len(self.probation) + len(self.protected) < self.main_capacity:
+            self.probation.push(candidate)
+            return
+        victim: Optional[Node] = self.probation.order.tail or self.protected.order.tail
+        if victim is None:
+            return
+        # фильтр допуска: проигравший из двух просто выбрасывается
+        if self.sketch.frequency(candidate.key) > self.sketch.frequency(victim.key):
+            (self.probation if victim.key in self.probation else self.protected).remove(victim.key)
+            self.probation.push(candidate)
+
+    def __len__(self) -> int:
+        return len(self.window) + len(self.probation) + len(self.protected)
+
+
+POLICIES = {
+    "LRU": LRUCache,
+    "LRU (arrays)": ArrayLRUCache,
+    "SLRU": SLRUCache,
+    "2Q": TwoQueueCache,
+    "ARC": ARCCache,
+    "W-TinyLFU": WTinyLFUCache,
+}
+
+
+def _replay(cache: CachePolicy, trace) -> int:
+    # cache-aside: промах - put; возвращает число попаданий
+    hits = 0
+    missing = object()
+    for key in trace:
+        if cache.get(key, missing) is missing:
+            cache.put(key, key)
+        else:
+            hits += 1
+    return hits
+
+
+def test_common_interface():
+    trace = [(i * 7919) % 50 for i in range(2000)] + list(range(1000, 1100))
+    for name, factory in POLICIES.items():
+        cache = factory(20)
+        assert isinstance(cache, CachePolicy), f"Тест не пройден: {name} не реализует CachePolicy"
+        assert cache.get("missing") == -1, f"Тест не пройден: {name} промах должен вернуть -1"
+        cache.put("a", 1)
+        cache.put("a", 2)
+        assert cache.get("a") == 2, f"Тест не пройден: {name} put не обновил значение"
+        assert cache.get("b", None) is None, f"Тест не пройден: {name} get не вернул default"
+
+        for key in trace:
+            if cache.get(key) == -1:
+                cache.put(key, key * 2)
+            else:
+                assert cache.get(key) == key * 2, f"Тест не пройден: {name} вернул чужое значение"
+            assert len(cache) <= 20, f"Тест не пройден: {name} вырос больше capacity"
+        assert len(cache) == 20, f"Тест не пройден: {name} заполнен не полностью"
+
+def test_scan_resistance():
+    # горячие 10 ключей вперемешку с одноразовыми (в 2Q так они проходят через a1_out в am),
+    # затем скан из 1000 одноразовых ключей, затем снова горячие
+    hot = [key for round in range(20) for key in list(range(10)) + list(range(100 + 20*round, 120 + 20*round))]
+    scan = list(range(1000, 2000))
+    results = {}
+    for name, factory in POLICIES.items():
+        cache = factory(50)
+        _replay(cache, hot)
+        _replay(cache, scan)
+        results[name] = _replay(cache, range(10))
+    assert results["LRU"] == 0, "Тест не пройден: скан должен полностью вымыть LRU"
+    for name in ("SLRU", "2Q", "ARC", "W-TinyLFU"):
+        assert results[name] == 10, f"Тест не пройден: {name} потерял горячие ключи после скана"
+
+def test_arc_adapts():
+    cache = ARCCache(4)
+    for key in (1, 2, 3, 4):
+        cache.put(key, key)
+    assert cache.get(1) == 1 and 1 in cache.t2, "Тест не пройден: повторное обращение должно перевести ключ в t2"
+    cache.put(5, 5)
+    assert list(cache.b1.nodes) == [2], "Тест не пройден: вытесненный из t1 ключ должен стать призраком в b1"
+    assert cache.b1.nodes[2].value is None, "Тест не пройден: призрак не должен хранить значение"
+    cache.put(2, 2)
+    assert cache.p == 1 and 2 in cache.t2, "Тест не пройден: попадание в b1 должно увеличить p и вернуть ключ в t2"
+    assert len(cache) == 4, "Тест не пройден: неверный размер ARC"
+
+def test_count_min_sketch():
+    sketch = CountMinSketch(64, sample_factor=1000)
+    for _ in range(5):
+        sketch.increment("hot")
+    sketch.increment("cold")
+    assert sketch.frequency("hot") >= 5 and sketch.frequency("cold") >= 1, "Тест не пройден: оценка ниже истинной частоты"
+    assert sketch.frequency("never") <= 1, "Тест не пройден: слишком много коллизий в пустом скетче"
+    for _ in range(100):
+        sketch.increment("hot")
+    assert sketch.frequency("hot") == 15, "Тест не пройден: счётчик должен насыщаться на 15"
+
+    sketch = CountMinSketch(16, sample_factor=1)
+    for _ in range(15):
+        sketch.increment("hot")
+    # 16-е увеличение достигает sample_size = 16 и запускает старение
+    sketch.increment("hot")
+    assert sketch.frequency("hot") == 7 and sketch.additions == 8, "Тест не пройден: старение не уменьшило счётчики"
+
+
+# Запуск тестов
+if __name__ == "__main__":
+    test_common_interface()
+    test_scan_resistance()
+    test_arc_adapts()
+    test_count_min_sketch()
+
+    print("Все тесты пройдены!")
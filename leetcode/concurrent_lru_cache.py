@@ -0,0 +1,179 @@
+import importlib
+import threading
+from collections import deque
+from typing import Any, List
+
+# имя файла задачи начинается с цифры, поэтому обычный import не подходит
+LRUCache = importlib.import_module("146_lru_cache").LRUCache
+
+
+class _Shard:
+    __slots__ = ("cache", "lock", "reads")
+
+    def __init__(self, capacity: int, buffer_size: int):
+        self.cache = LRUCache(capacity)
+        self.lock = threading.Lock()
+        # буфер с потерями: при переполнении старые обращения просто вытесняются,
+        # это лишь чуть ухудшает точность порядка LRU, но не корректность
+        self.reads: deque = deque(maxlen=buffer_size)
+
+
+class ConcurrentLRUCache:
+    """
+    Потокобезопасный LRU-кэш из shards независимых LRUCache, у каждого свой Lock.
+    get не берёт лок: узел ищется в node_map, а само обращение записывается в буфер
+    чтений шарда. Буфер применяется к списку (move_to_head) пачкой под локом - при
+    его заполнении, если лок свободен, и перед каждой записью, как в Caffeine.
+    Поэтому горячие чтения не конкурируют за лок, а put вытесняет по актуальному порядку.
+    """
+
+    def __init__(self, capacity: int, shards: int = 16, buffer_size: int = 64):
+        if shards < 1 or shards & (shards - 1):
+            raise ValueError("shards must be a power of two")
+        if capacity < shards:
+            raise ValueError("capacity must be at least the number of shards")
+        self.capacity = capacity
+        self._shift = 64 - (shards.bit_length() - 1)
+        self._drain_threshold = buffer_size // 2
+        self._shards: List[_Shard] = [
+            _Shard(capacity // shards + (i < capacity % shards), buffer_size) for i in range(shards)
+        ]
+
+    def _shard(self, key: Any) -> _Shard:
+        if self._shift == 64:
+            return self._shards[0]
+        return self._shards[((hash(key) * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF) >> self._shift]
+
+    @staticmethod
+    def _drain(shard: _Shard) -> None:
+        # вызывается под локом шарда; обращения, дописанные во время слива, ждут следующего раза
+        reads, cache = shard.reads, shard.cache
+        node_map, move_to_head = cache.node_map, cache.dl_list.move_to_head
+        for _ in range(len(reads)):
+            node = reads.popleft()
+            # узел могли вытеснить после чтения - такие обращения пропускаем
+            if node_map.get(node.key) is node:
+                move_to_head(node)
+
+    def get(self, key: Any, default: Any = -1) -> Any:
+        shard = self._shard(key)
+        node = shard.cache.node_map.get(key)
+        if node is None:
+            return default
+        reads = shard.reads
+        reads.append(node)
+        if len(reads) >= self._drain_threshold and shard.lock.acquire(blocking=False):
+            try:
+                self._drain(shard)
+            finally:
+                shard.lock.release()
+        return node.value
+
+    def put(self, key: Any, value: Any) -> None:
+        shard = self._shard(key)
+        with shard.lock:
+            self._drain(shard)
+            shard.cache.put(key, value)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._shard(key).cache.node_map
+
+    def __len__(self) -> int:
+        return sum(shard.cache.dl_list.size for shard in self._shards)
+
+    def cleanup(self) -> None:
+        # применить все отложенные чтения, например перед обходом или в тестах
+        for shard in self._shards:
+            with shard.lock:
+                self._drain(shard)
+
+    def __str__(self) -> str:
+        return "\n".join(str(shard.cache) for shard in self._shards)
+
+
+def test_put_get():
+    cache = ConcurrentLRUCache(8, shards=4)
+    for i in range(100):
+        cache.put(i, i * 10)
+    assert len(cache) == 8, "Тест не пройден: кэш вырос больше capacity"
+    assert all(shard.cache.dl_list.size == 2 for shard in cache._shards), "Тест не пройден: неверная ёмкость шардов"
+    assert cache.get(99) == 990, "Тест не пройден: последний ключ должен остаться в кэше"
+    assert cache.get(0) == -1, "Тест не пройден: первый ключ должен быть вытеснен"
+    assert cache.get(0, None) is None, "Тест не пройден: get не вернул default"
+    assert 99 in cache and 0 not in cache, "Тест не пройден: неверная проверка наличия"
+
+    cache.put(99, 1)
+    assert cache.get(99) == 1, "Тест не пройден: put не обновил значение"
+
+    for shards, capacity in [(3, 10), (4, 2)]:
+        try:
+            ConcurrentLRUCache(capacity, shards=shards)
+            assert False, "Тест не пройден: ValueError должен был быть вызван при неверных параметрах"
+        except ValueError:
+            pass  # Ожидаемый результат
+
+def test_buffered_reads_keep_lru_order():
+    # один шард, чтобы порядок вытеснения совпадал с обычным LRUCache
+    cache = ConcurrentLRUCache(3, shards=1, buffer_size=64)
+    reference = LRUCache(3)
+    for key in (1, 2, 3):
+        cache.put(key, key)
+        reference.put(key, key)
+
+    # чтения ещё лежат в буфере, но put применяет их до вытеснения
+    for key in (1, 2):
+        assert cache.get(key) == reference.get(key)
+    assert len(cache._shards[0].reads) == 2, "Тест не пройден: чтения должны были попасть в буфер"
+    cache.put(4, 4)
+    reference.put(4, 4)
+    assert cache.get(3) == reference.get(3) == -1, "Тест не пройден: вытеснен не самый давний ключ"
+    assert cache.get(1) == 1 and cache.get(2) == 2, "Тест не пройден: прочитанные ключи не должны вытесняться"
+
+    # вытесненный узел из буфера не должен вернуться в список
+    cache = ConcurrentLRUCache(1, shards=1)
+    cache.put("a", 1)
+    cache.get("a")
+    cache.put("b", 2)
+    cache.cleanup()
+    assert len(cache) == 1 and "a" not in cache, "Тест не пройден: вытесненный узел вернулся после слива буфера"
+
+def test_concurrent_access():
+    cache = ConcurrentLRUCache(256, shards=8, buffer_size=16)
+    errors = []
+
+    def worker(seed: int):
+        try:
+            for i in range(5000):
+                key = (i * 31 + seed) % 512
+                value = cache.get(key)
+                assert value in (-1, key * 2), "Тест не пройден: прочитано чужое значение"
+                if value == -1:
+                    cache.put(key, key * 2)
+        except AssertionError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(seed,)) for seed in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors, errors[0] if errors else ""
+    cache.cleanup()
+    assert len(cache) == 256, "Тест не пройден: неверный размер после конкурентной работы"
+    for shard in cache._shards:
+        dl_list, nodes = shard.cache.dl_list, []
+        current = dl_list.head
+        while current:
+            nodes.append(current)
+            current = current.next
+        assert len(nodes) == dl_list.size == len(shard.cache.node_map), "Тест не пройден: список и словарь рассинхронизированы"
+
+
+# Запуск тестов
+if __name__ == "__main__":
+    test_put_get()
+    test_buffered_reads_keep_lru_order()
+    test_concurrent_access()
+
+    print("Все тесты пройдены!")
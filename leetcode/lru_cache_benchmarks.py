@@ -0,0 +1,211 @@
+import functools
+import gc
+import importlib
+import random
+import sys
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List
+
+from array_lru_cache import ArrayLRUCache
+from cache_policies import POLICIES, _replay
+from concurrent_lru_cache import ConcurrentLRUCache
+
+LRUCache = importlib.import_module("146_lru_cache").LRUCache
+
+
+def _zipf_keys(n: int, keys: int, s: float, seed: int) -> List[int]:
+    rng = random.Random(seed)
+    weights = [1 / (i ** s) for i in range(1, keys + 1)]
+    return rng.choices(range(keys), weights=weights, k=n)
+
+
+class SingleLockLRUCache:
+    # как LRUCache делят между потоками без шардирования: один лок и на get, и на put
+    def __init__(self, capacity: int):
+        self._cache = LRUCache(capacity)
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Any:
+        with self._lock:
+            return self._cache.get(key)
+
+    def put(self, key: Any, value: Any) -> None:
+        with self._lock:
+            self._cache.put(key, value)
+
+
+def bench_concurrent(capacity: int, keys: int, ops_per_thread: int, s: float = 1.0):
+    # cache-aside: промах - put; считаем ops/s и долю попаданий для 1..8 потоков
+    traces = [_zipf_keys(ops_per_thread, keys, s, seed) for seed in range(8)]
+    candidates = [
+        ("single lock", lambda: SingleLockLRUCache(capacity)),
+        ("sharded, 16 shards", lambda: ConcurrentLRUCache(capacity, shards=16)),
+    ]
+    print(f"capacity={capacity}, {keys} keys, zipf s={s}")
+    for name, factory in candidates:
+        results = []
+        for threads in (1, 2, 4, 8):
+            cache = factory()
+
+            def worker(trace: List[int]) -> int:
+                hits = 0
+                for key in trace:
+                    if cache.get(key) == -1:
+                        cache.put(key, key)
+                    else:
+                        hits += 1
+                return hits
+
+            with ThreadPoolExecutor(max_workers=threads) as pool:
+                start = time.perf_counter()
+                hits = sum(pool.map(worker, traces[:threads]))
+                elapsed = time.perf_counter() - start
+            ops = threads * ops_per_thread
+            results.append(f"{threads}t={ops / elapsed / 1000:.0f}k ops/s hit={hits / ops:.1%}")
+        print(f"{name:<20}" + "  ".join(results))
+
+
+def _full_scan_expire(cache, now: float) -> int:
+    # наивная очистка: обход всех записей в поиске истёкших
+    expired = [node for node in cache.node_map.values() if node.expires_at is not None and node.expires_at <= now]
+    for node in expired:
+        cache._remove(node)
+    return len(expired)
+
+
+def bench_expiry(sizes, expired: int):
+    # в кэше size долгоживущих записей и expired коротких; меряем одну очистку после их истечения
+    print(f"{'size':>10}{'expired':>9}{'timer wheel, ms':>17}{'full scan, ms':>15}")
+    for size in sizes:
+        timings = []
+        for expire in (lambda cache: cache.expire(), lambda cache: _full_scan_expire(cache, cache.clock())):
+            now = [0.0]
+            cache = LRUCache(size + expired, clock=lambda: now[0])
+            for i in range(size):
+                cache.put(i, i, ttl=3600 + i % 600)
+            for i in range(size, size + expired):
+                cache.put(i, i, ttl=1)
+            now[0] = 2.0
+            start = time.perf_counter()
+            assert expire(cache) == expired
+            timings.append(time.perf_counter() - start)
+        print(f"{size:>10}{expired:>9}{timings[0] * 1e3:>17.2f}{timings[1] * 1e3:>15.2f}")
+
+
+def _scan_trace(n: int, keys: int, capacity: int, s: float, seed: int) -> List[int]:
+    # zipf-трафик, который периодически прерывается сканом из 2*capacity одноразовых ключей
+    hot = _zipf_keys(n, keys, s, seed)
+    trace, scan_key, chunk = [], keys, max(1, 5 * capacity)
+    for start in range(0, n, chunk):
+        trace.extend(hot[start:start + chunk])
+        trace.extend(range(scan_key, scan_key + 2 * capacity))
+        scan_key += 2 * capacity
+    return trace
+
+
+def bench_policies(capacity: int, keys: int, n: int):
+    traces = {
+        "zipf": _zipf_keys(n, keys, 0.9, 1),
+        "zipf+scans": _scan_trace(n, keys, capacity, 0.9, 2),
+        # цикл чуть длиннее кэша - худший случай для чистого LRU
+        "loop": [i % (capacity + capacity // 2) for i in range(n)],
+    }
+    print(f"capacity={capacity}, {keys} keys, {n} requests per zipf trace")
+    print(f"{'policy':<12}" + "".join(f"{name:>26}" for name in traces))
+    for name, factory in POLICIES.items():
+        line = f"{name:<12}"
+        for trace in traces.values():
+            cache = factory(capacity)
+            start = time.perf_counter()
+            hits = _replay(cache, trace)
+            elapsed = time.perf_counter() - start
+            line += f"{hits / len(trace):>11.1%} hit {len(trace) / elapsed / 1000:>6.0f}k op/s"
+        print(line)
+
+
+def _fill_functools(n: int):
+    cached = functools.lru_cache(maxsize=n)(lambda key: -key)
+    for key in range(n):
+        cached(key)
+    return cached
+
+
+def bench_compact(n: int, capacity: int, ops: int):
+    # память на запись: n записей int -> отдельный int, с учётом самих объектов int ключей и значений
+    candidates = [
+        ("LRUCache (Node)", lambda size: LRUCache(size)),
+        ("ArrayLRUCache", lambda size: ArrayLRUCache(size)),
+        ("ArrayLRUCache 'q'", lambda size: ArrayLRUCache(size, value_typecode="q")),
+    ]
+    print(f"memory, {n} entries")
+    for name, factory in candidates:
+        gc.collect()
+        tracemalloc.start()
+        cache = factory(n)
+        for key in range(n):
+            cache.put(key, -key)
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        print(f"  {name:<22}{memory / n:>8.1f} bytes/entry")
+        del cache
+    gc.collect()
+    tracemalloc.start()
+    cached = _fill_functools(n)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"  {'functools.lru_cache':<22}{memory / n:>8.1f} bytes/entry")
+    del cached
+
+    # пропускная способность: cache-aside на zipf-трассе; lru_cache - вызов мемоизированной функции
+    trace = _zipf_keys(ops, capacity * 10, 0.9, 1)
+    print(f"throughput, capacity={capacity}, {ops} zipf requests")
+    for name, factory in candidates:
+        cache = factory(capacity)
+        start = time.perf_counter()
+        hits = 0
+        for key in trace:
+            if cache.get(key) == -1:
+                cache.put(key, key)
+            else:
+                hits += 1
+        elapsed = time.perf_counter() - start
+        print(f"  {name:<22}{ops / elapsed / 1000:>8.0f}k ops/s  hit={hits / ops:.1%}")
+    cached = functools.lru_cache(maxsize=capacity)(lambda key: key)
+    start = time.perf_counter()
+    for key in trace:
+        cached(key)
+    elapsed = time.perf_counter() - start
+    print(f"  {'functools.lru_cache':<22}{ops / elapsed / 1000:>8.0f}k ops/s  hit={cached.cache_info().hits / ops:.1%}")
+
+
+BENCHMARKS = {
+    "concurrent": lambda args: bench_concurrent(
+        int(args[0]) if args else 10_000,
+        int(args[1]) if len(args) > 1 else 100_000,
+        int(args[2]) if len(args) > 2 else 200_000,
+    ),
+    "expiry": lambda args: bench_expiry(
+        [int(n) for n in args[0].split(",")] if args else [10_000, 100_000, 1_000_000],
+        int(args[1]) if len(args) > 1 else 1000,
+    ),
+    "policies": lambda args: bench_policies(
+        int(args[0]) if args else 1000,
+        int(args[1]) if len(args) > 1 else 100_000,
+        int(args[2]) if len(args) > 2 else 300_000,
+    ),
+    "compact": lambda args: bench_compact(
+        int(args[0]) if args else 1_000_000,
+        int(args[1]) if len(args) > 1 else 10_000,
+        int(args[2]) if len(args) > 2 else 1_000_000,
+    ),
+}
+
+
+# Запуск бенчмарков: python lru_cache_benchmarks.py concurrent [capacity] [keys] [ops_per_thread]
+#                   | expiry [sizes через запятую] [expired] | policies [capacity] [keys] [n]
+#                   | compact [n] [capacity] [ops]
+if __name__ == "__main__":
+    BENCHMARKS[sys.argv[1] if len(sys.argv) > 1 else "concurrent"](sys.argv[2:])
@@ -0,0 +1,221 @@
+import os
+import random
+import tempfile
+import sys
+import time
+import tracemalloc
+from functools import reduce
+from typing import Callable
+
+import matrix_class
+from lazy_matrix import lazy
+from matrix_class import Matrix, iter_binary_rows, iter_csv_rows, matmul, np
+from parallel_matrix import parallel_multiply
+from sparse_matrix import COOMatrix
+
+
+def _timeit(func: Callable[[], object], repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _random_matrix(n: int, seed: int) -> Matrix:
+    rng = random.Random(seed)
+    return Matrix([[rng.random() for _ in range(n)] for _ in range(n)])
+
+
+def bench_backends(sizes, python_limit: int):
+    # чистый Python на больших размерах занимает минуты: после python_limit меряем только numpy
+    print(f"{'n':>6}{'python +, ms':>15}{'python *, ms':>15}{'numpy +, ms':>14}{'numpy *, ms':>14}{'speedup *':>11}")
+    for n in sizes:
+        m1, m2 = _random_matrix(n, 1), _random_matrix(n, 2)
+        n1, n2 = m1.to_numpy(), m2.to_numpy()
+        numpy_add = _timeit(lambda: n1 + n2) * 1e3
+        numpy_mul = _timeit(lambda: n1 * n2) * 1e3
+        if n <= python_limit:
+            python_add = _timeit(lambda: m1 + m2, repeat=1) * 1e3
+            python_mul = _timeit(lambda: m1 * m2, repeat=1) * 1e3
+            print(f"{n:>6}{python_add:>15.2f}{python_mul:>15.2f}{numpy_add:>14.3f}{numpy_mul:>14.3f}"
+                  f"{python_mul / numpy_mul:>10.0f}x")
+        else:
+            print(f"{n:>6}{'-':>15}{'-':>15}{numpy_add:>14.3f}{numpy_mul:>14.3f}{'-':>11}")
+
+
+def _naive_multiply(a, b):
+    # умножение i-j-k, как Matrix.__mul__ было устроено раньше
+    answer = [[0]*len(b[0]) for _ in range(len(a))]
+    for i in range(len(a)):
+        for j in range(len(b[0])):
+            for k in range(len(b)):
+                answer[i][j] += a[i][k] * b[k][j]
+    return answer
+
+
+def bench_crossover(sizes, cutoffs, naive_limit: int):
+    # время чистого Python: наивный i-j-k, блочное ядро без Strassen и Strassen с разными порогами
+    header = f"{'n':>6}{'naive, s':>10}{'tiled, s':>10}" + "".join(f"{f'cutoff {c}, s':>16}" for c in cutoffs)
+    print(header)
+    for n in sizes:
+        a, b = _random_matrix(n, 1).matrix, _random_matrix(n, 2).matrix
+        naive = f"{_timeit(lambda: _naive_multiply(a, b), repeat=1):>10.2f}" if n <= naive_limit else f"{'-':>10}"
+        tiled = _timeit(lambda: matmul(a, b, cutoff=n), repeat=1)
+        line = f"{n:>6}{naive}{tiled:>10.2f}"
+        for cutoff in cutoffs:
+            line += f"{_timeit(lambda: matmul(a, b, cutoff=cutoff), repeat=1):>16.2f}" if cutoff < n else f"{'-':>16}"
+        print(line)
+    print(f"default: TILE_SIZE={matrix_class.TILE_SIZE}, STRASSEN_CUTOFF={matrix_class.STRASSEN_CUTOFF}")
+
+
+def bench_sparse(n: int, nnz: int):
+    rng = random.Random(1)
+    row = [rng.randrange(n) for _ in range(nnz)]
+    col = [rng.randrange(n) for _ in range(nnz)]
+    data = [rng.random() for _ in range(nnz)]
+    vector = [rng.random() for _ in range(n)]
+
+    start = time.perf_counter()
+    csr = COOMatrix(n, n, row, col, data).to_csr()
+    build = time.perf_counter() - start
+    # tracemalloc замедляет сборку в разы, а вся память CSR - это три массива array
+    memory = sum(sys.getsizeof(values) for values in (csr.indptr, csr.indices, csr.data))
+
+    print(f"{n}x{n}, nnz={csr.nnz}: CSR {memory / 2**20:.1f} MiB (dense float64 would be {n * n * 8 / 2**30:.0f} GiB)")
+    print(f"{'COO -> CSR':<28}{build * 1e3:>10.1f} ms")
+    if np is not None:
+        print(f"{'dot, numpy':<28}{_timeit(lambda: csr._dot_numpy(vector)) * 1e3:>10.1f} ms")
+    print(f"{'dot, pure Python':<28}{_timeit(lambda: csr._dot_python(vector)) * 1e3:>10.1f} ms")
+    print(f"{'transpose':<28}{_timeit(csr.transpose, repeat=1) * 1e3:>10.1f} ms")
+    print(f"{'A + A':<28}{_timeit(lambda: csr + csr, repeat=1) * 1e3:>10.1f} ms")
+
+
+def _measure_peak(func: Callable[[], object]):
+    # время и пиковая память - в разных прогонах: tracemalloc сильно замедляет аллокации
+    elapsed = _timeit(func, repeat=1)
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def bench_lazy(n: int, terms: int, chain_n: int):
+    matrices = [_random_matrix(n, seed) for seed in range(terms)]
+    print(f"sum of {terms} matrices {n}x{n}")
+    for name, func in [
+        ("eager", lambda: reduce(lambda left, right: left + right, matrices)),
+        ("lazy", lambda: reduce(lambda left, right: left + right, matrices[1:], lazy(matrices[0])).evaluate()),
+    ]:
+        elapsed, peak = _measure_peak(func)
+        print(f"  {name:<8}{elapsed * 1e3:>10.1f} ms{peak / 2**20:>10.1f} MiB peak")
+
+    # слева направо цепочка считается через большие промежуточные произведения,
+    # оптимальные скобки начинают с узкой матрицы в конце
+    dims = [chain_n]*5 + [2]
+    rng = random.Random(3)
+    chain = [Matrix([[rng.random() for _ in range(dims[i + 1])] for _ in range(dims[i])]) for i in range(len(dims) - 1)]
+    print(f"chain product {' * '.join(f'{chain_matrix.rows}x{chain_matrix.cols}' for chain_matrix in chain)}")
+    for name, func in [
+        ("eager", lambda: reduce(lambda left, right: left * right, chain)),
+        ("lazy", lambda: reduce(lambda left, right: left * right, chain[1:], lazy(chain[0])).evaluate()),
+    ]:
+        elapsed, peak = _measure_peak(func)
+        print(f"  {name:<8}{elapsed * 1e3:>10.1f} ms{peak / 2**20:>10.1f} MiB peak")
+
+
+def bench_parallel(n: int, workers_list, use_numpy: bool):
+    a, b = _random_matrix(n, 1), _random_matrix(n, 2)
+    if use_numpy:
+        a, b = a.to_numpy(), b.to_numpy()
+    kernel = "numpy" if use_numpy else "pure Python"
+    print(f"{n}x{n}, {kernel} kernel, {os.cpu_count()} CPUs")
+    serial = _timeit(lambda: a * b, repeat=1)
+    print(f"{'serial':<12}{serial:>10.2f} s")
+    for workers in workers_list:
+        # первый вызов запускает общий пул процессов; меряем уже тёплый пул, как при повторных вызовах
+        parallel_multiply(a, b, workers=workers, use_numpy=use_numpy)
+        elapsed = _timeit(lambda: parallel_multiply(a, b, workers=workers, use_numpy=use_numpy), repeat=1)
+        print(f"{f'{workers} workers':<12}{elapsed:>10.2f} s{serial / elapsed:>8.2f}x")
+
+
+def bench_frozen(n: int, lookups: int):
+    matrix = _random_matrix(n, 1)
+    frozen = matrix.freeze()
+    print(f"{n}x{n}, {lookups} lookups in a set of 2 matrices")
+    for name, key, other in [
+        ("Matrix", matrix, _random_matrix(n, 2)),
+        ("FrozenMatrix", frozen, _random_matrix(n, 2).freeze()),
+    ]:
+        matrix_set = {key, other}
+        elapsed = _timeit(lambda: [key in matrix_set for _ in range(lookups)], repeat=1)
+        print(f"  {name:<14}{elapsed / lookups * 1e6:>12.1f} us/lookup")
+
+
+def bench_io(n: int):
+    # сумма всех элементов файла: построчный поток против чтения всего текста в память
+    matrix = _random_matrix(n, 1)
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path, binary_path = os.path.join(directory, "m.csv"), os.path.join(directory, "m.bin")
+        matrix.to_csv(csv_path)
+        matrix.to_binary(binary_path)
+        print(f"{n}x{n}: csv {os.path.getsize(csv_path) / 2**20:.1f} MiB, binary {os.path.getsize(binary_path) / 2**20:.1f} MiB")
+
+        def read_whole_csv():
+            with open(csv_path) as file:
+                return sum(float(value) for line in file.read().splitlines() for value in line.split(","))
+
+        for name, func in [
+            ("csv, whole text", read_whole_csv),
+            ("csv, iter_csv_rows", lambda: sum(map(sum, iter_csv_rows(csv_path)))),
+            ("binary, iter_binary_rows", lambda: sum(map(sum, iter_binary_rows(binary_path)))),
+            ("binary, from_binary", lambda: Matrix.from_binary(binary_path)),
+        ]:
+            elapsed, peak = _measure_peak(func)
+            print(f"  {name:<28}{elapsed * 1e3:>10.1f} ms{peak / 2**20:>10.2f} MiB peak")
+
+
+BENCHMARKS = {
+    "backends": lambda args: bench_backends(
+        [int(n) for n in args[0].split(",")] if args else [10, 50, 100, 200, 500, 1000, 2000],
+        int(args[1]) if len(args) > 1 else 200,
+    ),
+    "crossover": lambda args: bench_crossover(
+        [int(n) for n in args[0].split(",")] if args else [64, 128, 256, 512, 1024],
+        [int(c) for c in args[1].split(",")] if len(args) > 1 else [32, 64, 128, 256],
+        int(args[2]) if len(args) > 2 else 256,
+    ),
+    "sparse": lambda args: bench_sparse(
+        int(args[0]) if args else 100_000,
+        int(args[1]) if len(args) > 1 else 1_000_000,
+    ),
+    "lazy": lambda args: bench_lazy(
+        int(args[0]) if args else 300,
+        int(args[1]) if len(args) > 1 else 20,
+        int(args[2]) if len(args) > 2 else 200,
+    ),
+    "parallel": lambda args: bench_parallel(
+        int(args[0]) if args else 400,
+        [int(w) for w in args[1].split(",")] if len(args) > 1 else list(range(1, (os.cpu_count() or 1) + 1)),
+        len(args) > 2 and args[2] == "numpy",
+    ),
+    "frozen": lambda args: bench_frozen(
+        int(args[0]) if args else 500,
+        int(args[1]) if len(args) > 1 else 1000,
+    ),
+    "io": lambda args: bench_io(int(args[0]) if args else 1000),
+}
+
+
+# Запуск бенчмарков: python matrix_benchmarks.py backends [sizes через запятую] [python_limit]
+#                   | crossover [sizes] [cutoffs] [naive_limit] | sparse [n] [nnz]
+#                   | lazy [n] [terms] [chain_n]
+#                   | parallel [n] [workers через запятую] [python|numpy]
+#                   | frozen [n] [lookups] | io [n]
+if __name__ == "__main__":
+    name = sys.argv[1] if len(sys.argv) > 1 else "backends"
+    if name == "backends" and np is None:
+        raise SystemExit("numpy is required for the backends benchmark")
+    BENCHMARKS[name](sys.argv[2:])
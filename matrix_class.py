@@ -1,28 +1,203 @@
-from typing import List, Any
+import csv
+import struct
+import sys
+from array import array
+from contextlib import contextmanager
+from itertools import chain
+from operator import add, mul, sub
+from typing import List, Any, Callable, Iterator, Literal, Optional
+
+try:
+    import numpy as np
+except ImportError:  # numpy - необязательная зависимость, без неё работает только backend="python"
+    np = None
+
+
+# длина блока по k в _multiply_tiled и размер, начиная с которого matmul переходит на Strassen;
+# подобраны бенчмарком: python matrix_benchmarks.py crossover
+TILE_SIZE = 64
+STRASSEN_CUTOFF = 64
+
+
+def _multiply_tiled(a, b, tile : int = TILE_SIZE):
+    # B транспонируется один раз, дальше строка на строку через sum(map(mul, ...)) на уровне C;
+    # короткие срезы по k остаются в кэше, пока по ним проходят все строки A
+    columns = list(zip(*b))
+    answer = [[0]*len(columns) for _ in a]
+    for k in range(0, len(b), tile):
+        column_tiles = [column[k:k + tile] for column in columns]
+        for row, answer_row in zip(a, answer):
+            row_tile = row[k:k + tile]
+            for j, column_tile in enumerate(column_tiles):
+                answer_row[j] += sum(map(mul, row_tile, column_tile))
+    return answer
+
+
+def _combine(func, *matrices):
+    return [list(map(func, *rows)) for rows in zip(*matrices)]
+
+
+def _pad(a, rows : int, cols : int):
+    return [list(row) + [0]*(cols - len(row)) for row in a] + [[0]*cols for _ in range(rows - len(a))]
+
+
+def _strassen(a, b, cutoff : int):
+    n, m, p = len(a), len(b), len(b[0])
+    if min(n, m, p) <= cutoff:
+        return _multiply_tiled(a, b)
+    # 7 умножений половинного размера вместо 8; нечётные размеры дополняются нулями
+    hn, hm, hp = (n + 1) // 2, (m + 1) // 2, (p + 1) // 2
+    a, b = _pad(a, 2*hn, 2*hm), _pad(b, 2*hm, 2*hp)
+    a11, a12 = [row[:hm] for row in a[:hn]], [row[hm:] for row in a[:hn]]
+    a21, a22 = [row[:hm] for row in a[hn:]], [row[hm:] for row in a[hn:]]
+    b11, b12 = [row[:hp] for row in b[:hm]], [row[hp:] for row in b[:hm]]
+    b21, b22 = [row[:hp] for row in b[hm:]], [row[hp:] for row in b[hm:]]
+
+    m1 = _strassen(_combine(add, a11, a22), _combine(add, b11, b22), cutoff)
+    m2 = _strassen(_combine(add, a21, a22), b11, cutoff)
+    m3 = _strassen(a11, _combine(sub, b12, b22), cutoff)
+    m4 = _strassen(a22, _combine(sub, b21, b11), cutoff)
+    m5 = _strassen(_combine(add, a11, a12), b22, cutoff)
+    m6 = _strassen(_combine(sub, a21, a11), _combine(add, b11, b12), cutoff)
+    m7 = _strassen(_combine(sub, a12, a22), _combine(add, b21, b22), cutoff)
+
+    c11 = [list(map(lambda x1, x4, x5, x7: x1 + x4 - x5 + x7, *rows)) for rows in zip(m1, m4, m5, m7)]
+    c12 = _combine(add, m3, m5)
+    c21 = _combine(add, m2, m4)
+    c22 = [list(map(lambda x1, x2, x3, x6: x1 - x2 + x3 + x6, *rows)) for rows in zip(m1, m2, m3, m6)]
+    answer = [left + right for left, right in zip(c11, c12)] + [left + right for left, right in zip(c21, c22)]
+    return [row[:p] for row in answer[:n]]
+
+
+def _typecode(*matrices) -> str:
+    # двоичный формат и shared memory хранят сырые int64 или float64; значения должны в них помещаться
+    for matrix in matrices:
+        if matrix.backend == "numpy":
+            if matrix.matrix.dtype.kind not in "biu":
+                return "d"
+        elif not all(isinstance(value, int) for row in matrix.matrix for value in row):
+            return "d"
+    return "q"
+
+
+# заголовок двоичного формата: сигнатура, версия, typecode ("q" или "d"), rows, cols;
+# дальше строки подряд в little-endian
+_BINARY_HEADER = struct.Struct("<4sBcQQ")
+_BINARY_MAGIC = b"MTRX"
+
+
+def _read_binary_header(file):
+    header = file.read(_BINARY_HEADER.size)
+    if len(header) != _BINARY_HEADER.size:
+        raise ValueError("not a Matrix binary file")
+    magic, version, typecode, rows, cols = _BINARY_HEADER.unpack(header)
+    if magic != _BINARY_MAGIC or version != 1 or typecode not in (b"q", b"d"):
+        raise ValueError("not a Matrix binary file")
+    return typecode.decode(), rows, cols
+
+
+@contextmanager
+def _opened(target, mode : str, **kwargs):
+    # принимает путь или уже открытый файл; открытый файл не закрываем
+    if hasattr(target, "read" if "r" in mode else "write"):
+        yield target
+    else:
+        with open(target, mode, **kwargs) as file:
+            yield file
+
+
+def iter_csv_rows(source, converter : Callable[[str], Any] = float) -> Iterator[List[Any]]:
+    """
+    Построчное чтение матрицы из CSV: в памяти только текущая строка файла.
+    """
+    with _opened(source, "r", newline="") as file:
+        for row in csv.reader(file):
+            if row:
+                yield [converter(value) for value in row]
+
+
+def iter_binary_rows(source) -> Iterator[List[Any]]:
+    """
+    Построчное чтение двоичного формата Matrix.to_binary: в памяти только текущая строка.
+    """
+    with _opened(source, "rb") as file:
+        typecode, rows, cols = _read_binary_header(file)
+        for _ in range(rows):
+            row = array(typecode)
+            row.fromfile(file, cols)
+            if sys.byteorder == "big":
+                row.byteswap()
+            yield row.tolist()
+
+
+def matmul(a : List[List[Any]], b : List[List[Any]], cutoff : Optional[int] = None) -> List[List[Any]]:
+    """
+    Произведение списков списков без numpy: блочное умножение по транспонированной B,
+    а для матриц больше cutoff (по умолчанию STRASSEN_CUTOFF) - рекурсия Strassen.
+    """
+    if not a or not b or not b[0]:
+        return [[0]*(len(b[0]) if b else 0) for _ in a]
+    return _strassen(a, b, STRASSEN_CUTOFF if cutoff is None else cutoff)
+
 
 class Matrix():
-    def __init__(self, input_rows : List[List[Any]]):
+    """
+    Матрица поверх списка списков (backend="python") или непрерывного numpy.ndarray
+    (backend="numpy"): тогда +, -, *, == и hash считаются векторно, а * уходит в BLAS.
+    Индексация m[i][j] и итерация по строкам одинаковы для обоих вариантов.
+    """
+
+    def __init__(self, input_rows : List[List[Any]], backend : Literal["python", "numpy", None] = None):
+        if backend is None:
+            backend = "numpy" if np is not None and isinstance(input_rows, np.ndarray) else "python"
+        if backend == "numpy":
+            if np is None:
+                raise ImportError("backend='numpy' requires numpy")
+            input_rows = np.ascontiguousarray(input_rows)
+            if input_rows.ndim != 2:
+                raise Exception("not same sizes")
+        elif np is not None and isinstance(input_rows, np.ndarray):
+            input_rows = input_rows.tolist()
+
         rows = len(input_rows)
-        cols = len(input_rows[0])
+        cols = len(input_rows[0]) if rows else 0
 
         self.matrix : List[List[Any]] = input_rows
+        self.backend : str = backend
         self.cols : int = cols
         self.rows : int = rows
-        self.cur_row : int = 0
 
-        if not input_rows:
-            return None
-        for row in input_rows:
-            if len(row) != rows or len(row) != cols:
-                raise Exception("not same sizes")
-            cols = len(row)
+        if backend == "python":
+            for row in input_rows:
+                if len(row) != cols:
+                    raise Exception("not same sizes")
+
+    def _other(self, another):
+        # смешанная операция выполняется векторно: список другой матрицы переводится в ndarray
+        if self.backend == "numpy" or another.backend == "numpy":
+            return np.asarray(self.matrix), np.asarray(another.matrix)
+        return None
+
+    def to_numpy(self):
+        return self if self.backend == "numpy" else Matrix(self.matrix, backend="numpy")
+
+    def to_python(self):
+        return self if self.backend == "python" else Matrix(self.matrix.tolist())
+
+    def freeze(self):
+        return FrozenMatrix(self.matrix)
 
     # def __add__(self, another) -> Matrix:
     def __add__(self, another):
+        if not isinstance(another, Matrix):
+            return NotImplemented
         if self.cols != another.cols:
             raise Exception("cols dimension not same")
         if self.rows != another.rows:
             raise Exception("rows dimension not same")
+        arrays = self._other(another)
+        if arrays is not None:
+            return Matrix(arrays[0] + arrays[1])
         answer = [[0]*self.cols for _ in range(self.rows)]
         for i in range(self.rows):
             for j in range(self.cols):
@@ -31,10 +206,15 @@ class Matrix():
         return Matrix(answer)
     
     def __sub__(self, another):
+        if not isinstance(another, Matrix):
+            return NotImplemented
         if self.cols != another.cols:
             raise Exception("cols dimension not same")
         if self.rows != another.rows:
             raise Exception("rows dimension not same")
+        arrays = self._other(another)
+        if arrays is not None:
+            return Matrix(arrays[0] - arrays[1])
         answer = [[0]*self.cols for _ in range(self.rows)]
         for i in range(self.rows):
             for j in range(self.cols):
@@ -43,26 +223,28 @@ class Matrix():
         return Matrix(answer)
     
     def __mul__(self, another):
+        if not isinstance(another, Matrix):
+            return NotImplemented
         if self.cols != another.rows:
             raise Exception("wrong dimension")
-        answer = [[0]*another.cols for _ in range(self.rows)]
-
-        for i in range(self.rows):
-            for j in range(another.cols):
-                answer[i][j] = 0
-                for k in range(self.cols):
-                    answer[i][j] += self.matrix[i][k] * another[k][j]
-        
-        return Matrix(answer)
+        arrays = self._other(another)
+        if arrays is not None:
+            return Matrix(arrays[0] @ arrays[1])
+        return Matrix(matmul(self.matrix, another.matrix))
 
     def __getitem__(self, index):
         return self.matrix[index]
     
     def __eq__(self, another):
+        if not isinstance(another, Matrix):
+            return NotImplemented
         if self.cols != another.cols:
             raise Exception("cols dimension not same")
         if self.rows != another.rows:
             raise Exception("rows dimension not same")
+        arrays = self._other(another)
+        if arrays is not None:
+            return bool(np.array_equal(arrays[0], arrays[1]))
         for i in range(self.rows):
             for j in range(self.cols):
                 if self.matrix[i][j] != another.matrix[i][j]:
@@ -70,63 +252,326 @@ class Matrix():
         return True
     
     def __hash__(self):
+        # hash совпадает у равных матриц с разными backend: tolist() и tuple() работают на уровне C
+        if self.backend == "numpy":
+            return hash(tuple(self.matrix.ravel().tolist()))
         items = tuple(elem for row in self.matrix for elem in row)
         return hash(items)
 
     def __repr__(self):
+        if self.backend == "numpy":
+            return (f"Matrix: {str(self.matrix.tolist())}")
         return (f"Matrix: {str(self.matrix)}")
     
-    # def __iter__(self):
-    #     for row in self.matrix:
-    #         yield row
     def __iter__(self):
+        # каждый вызов - новый независимый итератор: вложенные и параллельные обходы не мешают друг другу
+        return iter(self.matrix)
+
+    def iter_rows(self) -> Iterator[List[Any]]:
+        return iter(self.matrix)
+
+    def iter_columns(self) -> Iterator[List[Any]]:
+        if self.backend == "numpy":
+            return iter(self.matrix.T)
+        return map(list, zip(*self.matrix))
+
+    def iter_elements(self) -> Iterator[Any]:
+        if self.backend == "numpy":
+            return iter(self.matrix.flat)
+        return chain.from_iterable(self.matrix)
+
+    @classmethod
+    def from_csv(cls, source, converter : Callable[[str], Any] = float, backend : Literal["python", "numpy"] = "python"):
+        if backend == "numpy":
+            return cls(np.loadtxt(source, delimiter=",", ndmin=2), backend="numpy")
+        return cls(list(iter_csv_rows(source, converter)))
+
+    def to_csv(self, target):
+        with _opened(target, "w", newline="") as file:
+            writer = csv.writer(file)
+            for row in self.matrix:
+                writer.writerow(row.tolist() if self.backend == "numpy" else row)
+
+    @classmethod
+    def from_binary(cls, source, backend : Literal["python", "numpy"] = "python"):
+        if backend != "numpy":
+            return cls(list(iter_binary_rows(source)))
+        with _opened(source, "rb") as file:
+            typecode, rows, cols = _read_binary_header(file)
+            # данные читаются прямо в буфер результата, без промежуточной копии файла
+            answer = np.empty((rows, cols), dtype="<i8" if typecode == "q" else "<f8")
+            if file.readinto(memoryview(answer).cast("B")) != answer.nbytes:
+                raise ValueError("truncated Matrix binary file")
+            return cls(answer.astype(answer.dtype.newbyteorder("="), copy=False), backend="numpy")
+
+    def to_binary(self, target):
+        typecode = _typecode(self)
+        with _opened(target, "wb") as file:
+            file.write(_BINARY_HEADER.pack(_BINARY_MAGIC, 1, typecode.encode(), self.rows, self.cols))
+            for row in self.matrix:
+                row = array(typecode, row.tolist() if self.backend == "numpy" else row)
+                if sys.byteorder == "big":
+                    row.byteswap()
+                row.tofile(file)
+
+
+class FrozenMatrix(Matrix):
+    """
+    Неизменяемая матрица: строки - кортежи (или read-only ndarray), поэтому копии делят
+    одно хранилище, а hash считается один раз и кэшируется. == сразу отвечает True для того же
+    объекта и False при разных hash, так что поиск в set/dict после первого hash - O(1).
+    hash numpy-варианта считается по байтам буфера вместе с shape и dtype, поэтому FrozenMatrix
+    равна только FrozenMatrix того же backend и dtype.
+    Арифметика возвращает обычную изменяемую Matrix.
+    """
+
+    def __init__(self, input_rows : List[List[Any]], backend : Literal["python", "numpy", None] = None):
+        if np is not None and isinstance(input_rows, np.ndarray) and backend != "python":
+            input_rows = np.array(input_rows)
+            input_rows.flags.writeable = False
+        else:
+            # tuple() от кортежа возвращает тот же объект: строки другой FrozenMatrix не копируются
+            input_rows = tuple(tuple(row) for row in input_rows)
+        super().__init__(input_rows, backend)
+        self._hash = None
+        self._frozen = True
+
+    def __setattr__(self, name, value):
+        if getattr(self, "_frozen", False):
+            raise AttributeError("FrozenMatrix is immutable")
+        super().__setattr__(name, value)
+
+    def freeze(self):
         return self
-    
-    def __next__(self):
-        if self.cur_row == self.rows:
-            self.cur_row=0
-            raise StopIteration
-        row = self.matrix[self.cur_row]
-        self.cur_row+=1
-        return row
 
+    def thaw(self) -> Matrix:
+        if self.backend == "numpy":
+            return Matrix(np.array(self.matrix))
+        return Matrix([list(row) for row in self.matrix])
 
-m1 = Matrix([[1, 2], [3, 4]])
-m2 = Matrix([[5, 6], [7, 8]])
+    def __copy__(self):
+        return self
 
-# Строковое представление
-print(m1)  # [[1, 2], [3, 4]]
-print(repr(m1))  # Matrix([[1, 2], [3, 4]])
+    def __deepcopy__(self, memo):
+        return self
 
-# Сложение матриц
-m3 = m1 + m2
-print(m3)  # [[6, 8], [10, 12]]
+    def __hash__(self):
+        if self._hash is None:
+            if self.backend == "numpy":
+                # одно копирование буфера на уровне C вместо Python-объекта на каждый элемент
+                value = hash((self.matrix.shape, self.matrix.dtype.str, self.matrix.tobytes()))
+            else:
+                value = super().__hash__()
+            object.__setattr__(self, "_hash", value)
+        return self._hash
 
-# Вычитание матриц
-m4 = m1 - m2
-print(m4)  # [[-4, -4], [-4, -4]]
+    def __eq__(self, another):
+        if self is another:
+            return True
+        if isinstance(another, FrozenMatrix):
+            if (self.rows, self.cols) != (another.rows, another.cols) or hash(self) != hash(another):
+                return False
+            if self.backend == another.backend == "python":
+                # сравнение кортежей кортежей целиком на уровне C
+                return self.matrix == another.matrix
+        return super().__eq__(another)
 
-# Умножение матриц
-m5 = m1 * m2
-print(m5)  # [[19, 22], [43, 50]]
+    def __repr__(self):
+        if self.backend == "numpy":
+            return "Frozen" + super().__repr__()
+        return (f"FrozenMatrix: {str([list(row) for row in self.matrix])}")
 
-# Сравнение матриц
-print(m1 == m2)  # False
-print(m1 == Matrix([[1, 2], [3, 4]]))  # True
 
-# Индексация
-print(m1[0][1])  # 2
+def test_numpy_backend():
+    if np is None:
+        print("numpy не установлен, тест numpy backend пропущен")
+        return
+    m1 = Matrix([[1, 2], [3, 4]], backend="numpy")
+    m2 = Matrix(np.array([[5, 6], [7, 8]]))
+    assert m1.backend == m2.backend == "numpy", "Тест не пройден: ndarray должен включать numpy backend"
 
-# Хэширование
-matrix_set = {m1, m2}
-print(m1 in matrix_set)  # True
+    assert m1 + m2 == Matrix([[6, 8], [10, 12]]), "Тест не пройден: неверное сложение"
+    assert m1 - m2 == Matrix([[-4, -4], [-4, -4]]), "Тест не пройден: неверное вычитание"
+    assert m1 * m2 == Matrix([[19, 22], [43, 50]]), "Тест не пройден: неверное умножение"
+    assert m1 * Matrix([[5, 6], [7, 8]]) == m1 * m2, "Тест не пройден: смешанное умножение"
+    assert m1[1][0] == 3, "Тест не пройден: неверная индексация"
+    assert [list(row) for row in m1] == [[1, 2], [3, 4]], "Тест не пройден: неверная итерация"
 
-for row in m5:
-    print(row)
+    # равные матрицы с разными backend равны и имеют одинаковый hash
+    python_m1 = m1.to_python()
+    assert python_m1.backend == "python" and python_m1 == m1, "Тест не пройден: неверная конвертация"
+    assert hash(python_m1) == hash(m1), "Тест не пройден: hash зависит от backend"
+    assert m1 in {python_m1}, "Тест не пройден: поиск в множестве"
+    assert repr(m1) == repr(python_m1), "Тест не пройден: repr зависит от backend"
 
+    rectangular = Matrix([[1, 2, 3], [4, 5, 6]])
+    assert (rectangular.to_numpy() * Matrix([[1], [1], [1]])).matrix.tolist() == [[6], [15]], \
+        "Тест не пройден: умножение прямоугольных матриц"
+    try:
+        Matrix([[1, 2], [3]])
+        assert False, "Тест не пройден: строки разной длины должны вызывать исключение"
+    except Exception as e:
+        assert str(e) == "not same sizes"
 
-for row in m5:
-    print(row)
-    
-for row in m5:
-    print(row)
\ No newline at end of file
+    print("Тест numpy backend прошел успешно!")
+
+
+def test_python_multiply():
+    m1 = Matrix([[1, 2], [3, 4]])
+    assert m1 * Matrix([[5, 6], [7, 8]]) == Matrix([[19, 22], [43, 50]]), "Тест не пройден: неверное умножение"
+    assert (Matrix([[1, 2, 3]]) * Matrix([[1], [2], [3]])).matrix == [[14]], "Тест не пройден: умножение строки на столбец"
+
+    # Strassen с маленьким порогом и нечётными размерами сверяем с наивным i-j-k
+    for rows, inner, cols in [(5, 5, 5), (7, 3, 9), (16, 16, 16), (13, 20, 11)]:
+        a = [[(i * 7 + j * 3) % 11 - 5 for j in range(inner)] for i in range(rows)]
+        b = [[(i * 5 + j * 2) % 13 - 6 for j in range(cols)] for i in range(inner)]
+        expected = [[sum(a[i][k] * b[k][j] for k in range(inner)) for j in range(cols)] for i in range(rows)]
+        for cutoff in (1, 2, 4, 100):
+            assert matmul(a, b, cutoff) == expected, f"Тест не пройден: matmul {rows}x{inner}x{cols}, cutoff={cutoff}"
+        assert (Matrix(a) * Matrix(b)).matrix == expected, "Тест не пройден: Matrix.__mul__ разошёлся с i-j-k"
+
+    print("Тест умножения без numpy прошел успешно!")
+
+
+def test_frozen_matrix():
+    m1 = Matrix([[1, 2], [3, 4]])
+    frozen = m1.freeze()
+    assert isinstance(frozen, FrozenMatrix) and frozen == m1 and m1 == frozen, "Тест не пройден: неверная заморозка"
+    assert hash(frozen) == hash(m1), "Тест не пройден: hash должен совпадать с изменяемой матрицей"
+    assert frozen._hash is not None, "Тест не пройден: hash не закэширован"
+    assert frozen.freeze() is frozen and FrozenMatrix(frozen.matrix).matrix[0] is frozen.matrix[0], \
+        "Тест не пройден: копии должны делить строки"
+    assert repr(frozen) == "FrozenMatrix: [[1, 2], [3, 4]]", "Тест не пройден: неверный repr"
+
+    try:
+        frozen.rows = 5
+        assert False, "Тест не пройден: AttributeError должен был быть вызван при изменении"
+    except AttributeError:
+        pass  # Ожидаемый результат
+    try:
+        frozen[0][0] = 5
+        assert False, "Тест не пройден: TypeError должен был быть вызван при изменении строки"
+    except TypeError:
+        pass  # Ожидаемый результат
+
+    assert frozen != Matrix([[1, 2], [3, 5]]).freeze(), "Тест не пройден: разные матрицы равны"
+    assert frozen * frozen == m1 * m1 and (frozen + frozen).backend == "python", "Тест не пройден: арифметика"
+    big = FrozenMatrix([[i * 100 + j for j in range(100)] for i in range(100)])
+    assert big * big == big.thaw() * big.thaw(), "Тест не пройден: Strassen по кортежам"
+
+    # вложенные обходы не мешают друг другу
+    assert [(a[0], b[0]) for a in frozen for b in frozen] == [(1, 1), (1, 3), (3, 1), (3, 3)], "Тест не пройден: обход"
+
+    matrix_set = {frozen, Matrix([[5, 6], [7, 8]]).freeze()}
+    assert frozen in matrix_set and m1.freeze() in matrix_set, "Тест не пройден: поиск в множестве"
+    thawed = frozen.thaw()
+    thawed.matrix[0][0] = 10
+    assert frozen[0][0] == 1, "Тест не пройден: thaw должен копировать строки"
+
+    if np is not None:
+        frozen_numpy = m1.to_numpy().freeze()
+        assert frozen_numpy.backend == "numpy" and not frozen_numpy.matrix.flags.writeable, "Тест не пройден: ndarray не read-only"
+        assert frozen_numpy == m1.to_numpy().freeze() and frozen_numpy == m1, "Тест не пройден: равные numpy-матрицы не равны"
+        assert hash(frozen_numpy) == hash(((2, 2), frozen_numpy.matrix.dtype.str, frozen_numpy.matrix.tobytes())), \
+            "Тест не пройден: hash numpy-матрицы должен считаться по байтам буфера"
+        as_float = Matrix(m1.to_numpy().matrix.astype(float)).freeze()
+        assert hash(as_float) != hash(frozen_numpy) and as_float != frozen_numpy and frozen_numpy != frozen, \
+            "Тест не пройден: FrozenMatrix разных dtype и backend должны различаться по hash"
+
+    print("Тест неизменяемой матрицы прошел успешно!")
+
+
+def test_iteration_and_io():
+    import io
+    import os
+    import tempfile
+
+    m1 = Matrix([[1, 2, 3], [4, 5, 6]])
+    # вложенные обходы одной матрицы независимы
+    pairs = [(a[0], b[0]) for a in m1 for b in m1]
+    assert pairs == [(1, 1), (1, 4), (4, 1), (4, 4)], "Тест не пройден: вложенные обходы мешают друг другу"
+    rows = iter(m1)
+    assert next(rows) == [1, 2, 3] and list(m1) == [[1, 2, 3], [4, 5, 6]] and next(rows) == [4, 5, 6], \
+        "Тест не пройден: итераторы должны быть независимыми"
+    assert list(m1.iter_columns()) == [[1, 4], [2, 5], [3, 6]], "Тест не пройден: неверный обход по столбцам"
+    assert list(m1.iter_elements()) == [1, 2, 3, 4, 5, 6], "Тест не пройден: неверный обход по элементам"
+
+    buffer = io.StringIO()
+    m1.to_csv(buffer)
+    buffer.seek(0)
+    assert list(iter_csv_rows(buffer, int)) == m1.matrix, "Тест не пройден: CSV построчно"
+    buffer.seek(0)
+    assert Matrix.from_csv(buffer) == m1, "Тест не пройден: CSV туда и обратно"
+
+    floats = Matrix([[0.5, -1.25], [1e300, 3.0]])
+    with tempfile.TemporaryDirectory() as directory:
+        for matrix in (m1, floats):
+            path = os.path.join(directory, "matrix.bin")
+            matrix.to_binary(path)
+            loaded = Matrix.from_binary(path)
+            assert loaded == matrix and loaded.matrix == matrix.matrix, "Тест не пройден: двоичный формат туда и обратно"
+            assert type(loaded[0][0]) is type(matrix[0][0]), "Тест не пройден: двоичный формат изменил тип значений"
+            if np is not None:
+                assert Matrix.from_binary(path, backend="numpy") == matrix, "Тест не пройден: двоичный формат в numpy"
+                matrix.to_numpy().to_binary(path)
+                assert Matrix.from_binary(path) == matrix, "Тест не пройден: запись из numpy"
+
+        path = os.path.join(directory, "matrix.csv")
+        floats.to_csv(path)
+        assert Matrix.from_csv(path) == floats, "Тест не пройден: CSV-файл туда и обратно"
+        if np is not None:
+            assert Matrix.from_csv(path, backend="numpy") == floats, "Тест не пройден: CSV в numpy"
+        try:
+            Matrix.from_binary(path)
+            assert False, "Тест не пройден: ValueError должен был быть вызван для чужого файла"
+        except ValueError:
+            pass  # Ожидаемый результат
+
+    print("Тест итерации и потокового ввода-вывода прошел успешно!")
+
+
+if __name__ == "__main__":
+    m1 = Matrix([[1, 2], [3, 4]])
+    m2 = Matrix([[5, 6], [7, 8]])
+
+    # Строковое представление
+    print(m1)  # [[1, 2], [3, 4]]
+    print(repr(m1))  # Matrix([[1, 2], [3, 4]])
+
+    # Сложение матриц
+    m3 = m1 + m2
+    print(m3)  # [[6, 8], [10, 12]]
+
+    # Вычитание матриц
+    m4 = m1 - m2
+    print(m4)  # [[-4, -4], [-4, -4]]
+
+    # Умножение матриц
+    m5 = m1 * m2
+    print(m5)  # [[19, 22], [43, 50]]
+
+    # Сравнение матриц
+    print(m1 == m2)  # False
+    print(m1 == Matrix([[1, 2], [3, 4]]))  # True
+
+    # Индексация
+    print(m1[0][1])  # 2
+
+    # Хэширование
+    matrix_set = {m1, m2}
+    print(m1 in matrix_set)  # True
+
+    for row in m5:
+        print(row)
+
+
+    for row in m5:
+        print(row)
+
+    for row in m5:
+        print(row)
+
+    test_numpy_backend()
+    test_python_multiply()
+    test_frozen_matrix()
+    test_iteration_and_io()
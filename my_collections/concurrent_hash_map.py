@@ -0,0 +1,182 @@
+import threading
+from typing import Any, Callable, Iterator, List, Tuple
+
+from my_hash_map import MyHashMap, _MISSING
+
+
+class ConcurrentHashMap:
+    """
+    Потокобезопасная хеш-таблица с lock striping: ключи делятся на segments независимых
+    MyHashMap, у каждого свой Lock. Потоки, попавшие в разные сегменты, не ждут друг друга,
+    а resize одного горячего сегмента не останавливает остальные.
+    """
+
+    def __init__(self, segments: int = 16, **map_kwargs):
+        if segments < 1 or segments & (segments - 1):
+            raise ValueError("segments must be a power of two")
+        self._shift = 64 - (segments.bit_length() - 1)
+        self._segments: List[MyHashMap] = [MyHashMap(**map_kwargs) for _ in range(segments)]
+        self._locks: List[threading.Lock] = [threading.Lock() for _ in range(segments)]
+
+    def _index(self, key: Any) -> int:
+        if self._shift == 64:
+            return 0
+        # сегмент берётся из старших бит (фибоначчиево хеширование): младшие биты хеша
+        # уже использует сам MyHashMap, и при совпадении сегменты забивали бы одни и те же бакеты
+        return ((hash(key) * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF) >> self._shift
+
+    def __getitem__(self, key: Any):
+        i = self._index(key)
+        with self._locks[i]:
+            return self._segments[i][key]
+
+    def get(self, key: Any, default: Any = None):
+        i = self._index(key)
+        with self._locks[i]:
+            return self._segments[i].get_many([key], default)[0]
+
+    def __setitem__(self, key: Any, value: Any):
+        i = self._index(key)
+        with self._locks[i]:
+            self._segments[i][key] = value
+
+    def __contains__(self, key: Any):
+        i = self._index(key)
+        with self._locks[i]:
+            return key in self._segments[i]
+
+    def __len__(self):
+        return sum(len(segment) for segment in self._segments)
+
+    def pop(self, key: Any, default: Any = _MISSING):
+        i = self._index(key)
+        with self._locks[i]:
+            return self._segments[i].pop_many([key], default)[0]
+
+    def compute_if_absent(self, key: Any, func: Callable[[Any], Any]):
+        # func вызывается под локом сегмента и не должна сама обращаться к этой таблице
+        i = self._index(key)
+        with self._locks[i]:
+            segment = self._segments[i]
+            try:
+                return segment[key]
+            except KeyError:
+                value = func(key)
+                segment[key] = value
+                return value
+
+    def get_or_set(self, key: Any, default: Any):
+        i = self._index(key)
+        with self._locks[i]:
+            segment = self._segments[i]
+            try:
+                return segment[key]
+            except KeyError:
+                segment[key] = default
+                return default
+
+    def merge(self, key: Any, value: Any, func: Callable[[Any, Any], Any]):
+        # как Map.merge в Java: нет ключа - кладём value, иначе func(old, value); None удаляет ключ
+        i = self._index(key)
+        with self._locks[i]:
+            segment = self._segments[i]
+            try:
+                old_value = segment[key]
+            except KeyError:
+                segment[key] = value
+                return value
+            new_value = func(old_value, value)
+            if new_value is None:
+                segment.pop(key)
+            else:
+                segment[key] = new_value
+            return new_value
+
+    def items(self) -> Iterator[Tuple[Any, Any]]:
+        # слабо согласованный обход: каждый сегмент копируется под своим локом
+        for lock, segment in zip(self._locks, self._segments):
+            with lock:
+                snapshot = list(segment.items())
+            yield from snapshot
+
+    def keys(self) -> Iterator[Any]:
+        for key, _ in self.items():
+            yield key
+
+    def values(self) -> Iterator[Any]:
+        for _, value in self.items():
+            yield value
+
+    def __str__(self):
+        return "{ " + ", ".join(f"{key}: {value}" for key, value in self.items()) + " }"
+
+
+def test_put_get_pop():
+    hashmap = ConcurrentHashMap(segments=4)
+
+    for i in range(1000):
+        hashmap[f"key{i}"] = i
+    assert len(hashmap) == 1000, "Тест не пройден: неверный размер после добавления 1000 элементов"
+    assert hashmap["key10"] == 10, "Тест не пройден: значение для 'key10' неверное"
+    assert "key999" in hashmap and "key1000" not in hashmap, "Тест не пройден: неверная проверка наличия"
+    assert hashmap.get("missing", "default") == "default", "Тест не пройден: get не вернул default"
+    assert sorted(hashmap.values()) == list(range(1000)), "Тест не пройден: неверные values"
+
+    assert hashmap.pop("key10") == 10, "Тест не пройден: pop должен вернуть удалённое значение"
+    assert hashmap.pop("key10", None) is None, "Тест не пройден: pop не вернул default"
+    try:
+        hashmap.pop("key10")
+        assert False, "Тест не пройден: KeyError не был вызван при удалении несуществующего ключа"
+    except KeyError:
+        pass  # Ожидаемый результат
+
+    # все сегменты должны получить ключи, а не только один
+    assert all(len(segment) > 0 for segment in hashmap._segments), "Тест не пройден: ключи легли не во все сегменты"
+
+    try:
+        ConcurrentHashMap(segments=3)
+        assert False, "Тест не пройден: число сегментов должно быть степенью двойки"
+    except ValueError:
+        pass  # Ожидаемый результат
+
+def test_atomic_operations():
+    hashmap = ConcurrentHashMap(segments=2, storage="open_addressing")
+
+    calls = []
+    assert hashmap.compute_if_absent("a", lambda key: calls.append(key) or 1) == 1
+    assert hashmap.compute_if_absent("a", lambda key: calls.append(key) or 2) == 1
+    assert calls == ["a"], "Тест не пройден: compute_if_absent вызвал функцию для существующего ключа"
+
+    assert hashmap.get_or_set("b", 5) == 5, "Тест не пройден: get_or_set не положил значение"
+    assert hashmap.get_or_set("b", 6) == 5, "Тест не пройден: get_or_set перезаписал значение"
+
+    assert hashmap.merge("c", 1, lambda old, new: old + new) == 1, "Тест не пройден: merge не положил значение"
+    assert hashmap.merge("c", 1, lambda old, new: old + new) == 2, "Тест не пройден: merge не объединил значения"
+    assert hashmap.merge("c", 1, lambda old, new: None) is None
+    assert "c" not in hashmap, "Тест не пройден: merge с None должен удалить ключ"
+
+def test_concurrent_counters():
+    hashmap = ConcurrentHashMap(segments=8)
+
+    def worker():
+        for i in range(2000):
+            hashmap.merge(i % 100, 1, lambda old, new: old + new)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # merge атомарен, поэтому ни одно увеличение счётчика не должно потеряться
+    assert len(hashmap) == 100, "Тест не пройден: неверное количество счётчиков"
+    assert all(value == 160 for value in hashmap.values()), "Тест не пройден: часть увеличений потерялась"
+
+
+# Запуск тестов
+if __name__ == "__main__":
+    test_put_get_pop()
+    test_atomic_operations()
+    test_concurrent_counters()
+
+    print("Все тесты пройдены!")
@@ -0,0 +1,469 @@
+import hashlib
+import mmap
+import os
+import pickle
+import struct
+import tempfile
+from typing import Any, Dict, Iterator, Tuple
+
+from my_hash_map import _next_power_of_two
+
+
+# файл слотов: заголовок + массив слотов (хеш, ссылка на запись в куче) по 16 байт
+_SLOTS_MAGIC = b"MYHMSLT1"
+_SLOTS_HEADER = struct.Struct("<8sQQQQQ")  # magic, capacity, size, used, heap_end, dirty
+_SLOTS_HEADER_SIZE = 64
+# байт сразу за заголовком: 1, если resize уже подменил этот файл слотов новым
+_SLOTS_REPLACED_OFFSET = _SLOTS_HEADER.size
+# файл кучи: заголовок + записи (длина ключа, длина значения, ключ, значение), только дописываются
+_HEAP_MAGIC = b"MYHMHEAP"
+_HEAP_HEADER_SIZE = 16
+_RECORD_HEADER = struct.Struct("<II")
+
+# ссылка 0 - пустой слот, 1 - tombstone; настоящие записи начинаются после заголовка кучи
+_EMPTY_REF = 0
+_DELETED_REF = 1
+
+
+def _encode_key(key: Any) -> bytes:
+    # hash() строк рандомизирован в каждом процессе, поэтому хешируем байты ключа сами
+    if isinstance(key, str):
+        return b"s" + key.encode()
+    if isinstance(key, bytes):
+        return b"b" + key
+    if isinstance(key, int) and not isinstance(key, bool):
+        return b"i" + str(key).encode()
+    raise TypeError(f"unsupported key type for MmapHashMap: {type(key).__name__}")
+
+
+def _decode_key(data: bytes) -> Any:
+    tag, body = data[:1], data[1:]
+    if tag == b"s":
+        return body.decode()
+    if tag == b"b":
+        return body
+    return int(body)
+
+
+def _stable_hash(data: bytes) -> int:
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "little")
+
+
+class MmapHashMap:
+    """
+    Персистентная хеш-таблица поверх двух memory-mapped файлов: <path>.slots с массивом
+    слотов фиксированного размера (open addressing, линейное пробирование) и <path>.heap -
+    append-only куча ключей и значений. Открытие не перестраивает таблицу, а страницы
+    подгружаются только при обращении к ним. Один писатель, сколько угодно читателей.
+    Ключи - str, bytes или int, значения - всё, что умеет pickle.
+    Слот, уже указывающий на сохранённую запись, до flush не меняется: обновление или удаление
+    такого ключа ждёт в _pending, поэтому после падения остаётся прошлая сохранённая версия,
+    а читатели до flush видят её же.
+    """
+
+    def __init__(self, path: str, capacity: int = 1024, load_factor: float = 0.6, readonly: bool = False):
+        if not 0 < load_factor < 1:
+            raise ValueError("load_factor must be in (0, 1)")
+        self.path = path
+        self.load_factor = load_factor
+        self.readonly = readonly
+        self._slots_path = path + ".slots"
+        self._heap_path = path + ".heap"
+        if not os.path.exists(self._slots_path):
+            if readonly:
+                raise FileNotFoundError(self._slots_path)
+            self._create(_next_power_of_two(capacity))
+        self._open()
+
+    def _create(self, capacity: int):
+        with open(self._heap_path, "wb") as heap_file:
+            heap_file.write(_HEAP_MAGIC.ljust(_HEAP_HEADER_SIZE, b"\0"))
+            heap_file.truncate(max(_HEAP_HEADER_SIZE, 1 << 16))
+            os.fsync(heap_file.fileno())
+        self._write_slots_file(self._slots_path, capacity, [], 0, _HEAP_HEADER_SIZE)
+
+    def _write_slots_file(self, slots_path: str, capacity: int, entries: Any, size: int, heap_end: int):
+        # новый файл слотов пишется целиком и только потом атомарно подменяет старый
+        tmp_path = slots_path + ".tmp"
+        with open(tmp_path, "wb") as slots_file:
+            slots_file.truncate(_SLOTS_HEADER_SIZE + 16 * capacity)
+            slots_file.write(_SLOTS_HEADER.pack(_SLOTS_MAGIC, capacity, size, size, heap_end, 0))
+        with open(tmp_path, "r+b") as slots_file:
+            mm = mmap.mmap(slots_file.fileno(), 0)
+            slots = memoryview(mm)[_SLOTS_HEADER_SIZE:].cast("Q")
+            mask = capacity - 1
+            for h, ref in entries:
+                i = h & mask
+                while slots[2 * i + 1] != _EMPTY_REF:
+                    i = (i + 1) & mask
+                slots[2 * i] = h
+                slots[2 * i + 1] = ref
+            slots.release()
+            mm.flush()
+            mm.close()
+            os.fsync(slots_file.fileno())
+        os.replace(tmp_path, slots_path)
+
+    def _open(self):
+        mode, access = ("rb", mmap.ACCESS_READ) if self.readonly else ("r+b", mmap.ACCESS_WRITE)
+        self._slots_file = open(self._slots_path, mode)
+        self._slots_mm = mmap.mmap(self._slots_file.fileno(), 0, access=access)
+        magic, capacity, size, used, heap_end, dirty = _SLOTS_HEADER.unpack_from(self._slots_mm, 0)
+        if magic != _SLOTS_MAGIC:
+            raise ValueError(f"{self._slots_path} is not a MmapHashMap slots file")
+        self.capacity = capacity
+        self._mask = capacity - 1
+        self._size = size
+        self._used = used
+        self._heap_end = heap_end
+        # граница кучи на диске: слоты со ссылками до неё меняются только в flush
+        self._flushed_end = heap_end
+        self._pending: Dict[int, int] = {}
+        self._dirty = bool(dirty)
+        self._slots = memoryview(self._slots_mm)[_SLOTS_HEADER_SIZE:].cast("Q")
+
+        self._heap_file = open(self._heap_path, mode)
+        self._heap_mm = mmap.mmap(self._heap_file.fileno(), 0, access=access)
+        if self._heap_mm[:len(_HEAP_MAGIC)] != _HEAP_MAGIC:
+            raise ValueError(f"{self._heap_path} is not a MmapHashMap heap file")
+        if self._dirty and not self.readonly:
+            self._recover()
+
+    def _recover(self):
+        # прошлый писатель упал между flush'ами: всё, что ссылается за сохранённый heap_end,
+        # могло не дойти до диска целиком - такие слоты превращаются в tombstone
+        slots = self._slots
+        size = used = 0
+        for i in range(self.capacity):
+            ref = slots[2 * i + 1]
+            if ref == _EMPTY_REF:
+                continue
+            used += 1
+            if ref == _DELETED_REF:
+                continue
+            if ref >= self._heap_end:
+                slots[2 * i + 1] = _DELETED_REF
+            else:
+                size += 1
+        self._size = size
+        self._used = used
+        self.flush()
+
+    def _refresh(self) -> int:
+        # читатель: писатель мог сохранить новые записи после того, как таблица была открыта
+        if self._slots_mm[_SLOTS_REPLACED_OFFSET]:
+            # писатель сделал resize: наш mmap смотрит на старый, уже удалённый файл слотов
+            self._close_files()
+            self._open()
+            return self._heap_end
+        heap_end = _SLOTS_HEADER.unpack_from(self._slots_mm, 0)[4]
+        if heap_end > self._heap_end:
+            if heap_end > len(self._heap_mm):
+                self._heap_mm.close()
+                self._heap_mm = mmap.mmap(self._heap_file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._heap_end = heap_end
+        return self._heap_end
+
+    def _close_files(self):
+        self._slots.release()
+        self._slots_mm.close()
+        self._slots_file.close()
+        self._heap_mm.close()
+        self._heap_file.close()
+
+    def _check_writable(self):
+        if self.readonly:
+            raise PermissionError("MmapHashMap is opened read-only")
+        if not self._dirty:
+            # флаг "грязный" должен оказаться на диске раньше любых изменений слотов
+            self._dirty = True
+            struct.pack_into("<Q", self._slots_mm, _SLOTS_HEADER.size - 8, 1)
+            self._slots_mm.flush(0, min(mmap.PAGESIZE, len(self._slots_mm)))
+
+    def _record_key(self, ref: int) -> bytes:
+        key_len, _ = _RECORD_HEADER.unpack_from(self._heap_mm, ref)
+        start = ref + _RECORD_HEADER.size
+        return self._heap_mm[start:start + key_len]
+
+    def _record_value(self, ref: int) -> Any:
+        key_len, value_len = _RECORD_HEADER.unpack_from(self._heap_mm, ref)
+        start = ref + _RECORD_HEADER.size + key_len
+        return pickle.loads(self._heap_mm[start:start + value_len])
+
+    def _ref(self, i: int) -> int:
+        return self._pending.get(i, self._slots[2 * i + 1])
+
+    def _set_ref(self, i: int, ref: int):
+        current = self._slots[2 * i + 1]
+        if current != _DELETED_REF and current < self._flushed_end:
+            # слот указывает на сохранённую запись: страницы mmap ОС может сбросить на диск когда угодно,
+            # поэтому новая ссылка ждёт flush, а до него в слоте остаётся прошлая версия
+            self._pending[i] = ref
+        else:
+            self._slots[2 * i + 1] = ref
+
+    def _find(self, key_bytes: bytes, h: int) -> int:
+        if self.readonly and self._slots_mm[_SLOTS_REPLACED_OFFSET]:
+            self._refresh()
+        slots = self._slots
+        mask = self._mask
+        heap_end = self._heap_end
+        pending = self._pending
+        i = h & mask
+        while True:
+            ref = slots[2 * i + 1]
+            if ref == _EMPTY_REF:
+                return -1
+            if pending:
+                ref = pending.get(i, ref)
+            if ref >= heap_end and self.readonly:
+                heap_end = self._refresh()
+            # ссылки за heap_end - недописанные записи, считаем их удалёнными
+            if ref != _DELETED_REF and ref < heap_end and slots[2 * i] == h and self._record_key(ref) == key_bytes:
+                return i
+            i = (i + 1) & mask
+
+    def _append_record(self, key_bytes: bytes, value: Any) -> int:
+        value_bytes = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        record = _RECORD_HEADER.pack(len(key_bytes), len(value_bytes)) + key_bytes + value_bytes
+        ref = self._heap_end
+        if ref + len(record) > len(self._heap_mm):
+            # куча растёт удвоением (разреженный файл), чтобы перемапливать её редко
+            new_size = _next_power_of_two(ref + len(record))
+            self._heap_mm.close()
+            self._heap_file.truncate(new_size)
+            self._heap_mm = mmap.mmap(self._heap_file.fileno(), 0)
+        self._heap_mm[ref:ref + len(record)] = record
+        self._heap_end = ref + len(record)
+        return ref
+
+    def _resize(self, new_capacity: int):
+        slots = self._slots
+        refs = [(slots[2 * i], self._ref(i)) for i in range(self.capacity) if slots[2 * i + 1] != _EMPTY_REF]
+        entries = [(h, ref) for h, ref in refs if ref != _DELETED_REF]
+        # хеши закешированы в слотах, поэтому при resize куча вообще не читается; новый файл слотов
+        # подменяет старый атомарно уже с отложенными ссылками, так что resize - это тоже flush
+        self._heap_mm.flush()
+        self._write_slots_file(self._slots_path, new_capacity, entries, len(entries), self._heap_end)
+        # читатели держат mmap старого файла (после os.replace - удалённого inode) и узнают
+        # о подмене по этому флагу; на диск его сбрасывать не нужно, страницы общие
+        self._slots_mm[_SLOTS_REPLACED_OFFSET] = 1
+        self._close_files()
+        self._open()
+        self._check_writable()
+
+    def __getitem__(self, key: Any):
+        key_bytes = _encode_key(key)
+        i = self._find(key_bytes, _stable_hash(key_bytes))
+        if i < 0:
+            raise KeyError(key)
+        return self._record_value(self._ref(i))
+
+    def __setitem__(self, key: Any, value: Any):
+        # ключ проверяется до _check_writable, чтобы неподдерживаемый тип не помечал файл грязным
+        key_bytes = _encode_key(key)
+        self._check_writable()
+        h = _stable_hash(key_bytes)
+        i = self._find(key_bytes, h)
+        ref = self._append_record(key_bytes, value)
+        if i >= 0:
+            self._set_ref(i, ref)
+            return
+
+        slots = self._slots
+        mask = self._mask
+        i = h & mask
+        while slots[2 * i + 1] != _EMPTY_REF and slots[2 * i + 1] != _DELETED_REF:
+            i = (i + 1) & mask
+        if slots[2 * i + 1] == _EMPTY_REF:
+            self._used += 1
+        slots[2 * i] = h
+        slots[2 * i + 1] = ref
+        self._size += 1
+        if self._used > self.load_factor * self.capacity:
+            self._resize(_next_power_of_two(int(self._size / self.load_factor) + 1) * 2)
+
+    def __contains__(self, key: Any):
+        key_bytes = _encode_key(key)
+        return self._find(key_bytes, _stable_hash(key_bytes)) >= 0
+
+    def __len__(self):
+        return self._size
+
+    def pop(self, key: Any):
+        key_bytes = _encode_key(key)
+        self._check_writable()
+        i = self._find(key_bytes, _stable_hash(key_bytes))
+        if i < 0:
+            raise KeyError(key)
+        value = self._record_value(self._ref(i))
+        self._set_ref(i, _DELETED_REF)
+        self._size -= 1
+        return value
+
+    def items(self) -> Iterator[Tuple[Any, Any]]:
+        if self.readonly:
+            self._refresh()
+        for i in range(self.capacity):
+            ref = self._ref(i)
+            if ref != _EMPTY_REF and ref != _DELETED_REF and ref < self._heap_end:
+                yield _decode_key(self._record_key(ref)), self._record_value(ref)
+
+    def flush(self):
+        # порядок важен: сначала записи кучи, потом новая граница кучи (флаг ещё грязный),
+        # потом отложенные ссылки в слотах и только в конце заголовок со сброшенным флагом
+        if self.readonly:
+            return
+        self._heap_mm.flush()
+        dirty = int(self._dirty)
+        self._slots_mm[:_SLOTS_HEADER.size] = _SLOTS_HEADER.pack(
+            _SLOTS_MAGIC, self.capacity, self._size, self._used, self._heap_end, dirty
+        )
+        if self._pending:
+            self._slots_mm.flush(0, min(mmap.PAGESIZE, len(self._slots_mm)))
+            for i, ref in self._pending.items():
+                self._slots[2 * i + 1] = ref
+            self._pending.clear()
+            self._slots_mm.flush()
+        self._flushed_end = self._heap_end
+        if dirty:
+            struct.pack_into("<Q", self._slots_mm, _SLOTS_HEADER.size - 8, 0)
+        self._slots_mm.flush()
+        self._dirty = False
+
+    def close(self):
+        self.flush()
+        self._close_files()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def test_put_get_pop_and_reopen():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "table")
+        with MmapHashMap(path, capacity=8) as hashmap:
+            for i in range(1000):
+                hashmap[f"key{i}"] = {"value": i}
+            hashmap[b"raw"] = [1, 2, 3]
+            hashmap[42] = "int key"
+            hashmap["key1"] = "new_value"
+            assert hashmap.pop("key2") == {"value": 2}, "Тест не пройден: pop должен вернуть удалённое значение"
+            assert hashmap.capacity > 8, "Тест не пройден: таблица слотов не выросла"
+
+        # повторное открытие ничего не перестраивает, а данные на месте
+        with MmapHashMap(path) as hashmap:
+            assert len(hashmap) == 1001, "Тест не пройден: неверный размер после повторного открытия"
+            assert hashmap["key999"] == {"value": 999}, "Тест не пройден: значение для 'key999' неверное"
+            assert hashmap["key1"] == "new_value", "Тест не пройден: обновление значения не сохранилось"
+            assert hashmap[b"raw"] == [1, 2, 3] and hashmap[42] == "int key"
+            assert "key2" not in hashmap, "Тест не пройден: удаление не сохранилось"
+            assert len(list(hashmap.items())) == 1001, "Тест не пройден: неверный items после повторного открытия"
+            try:
+                hashmap["key2"]
+                assert False, "Тест не пройден: KeyError не был вызван"
+            except KeyError:
+                pass  # Ожидаемый результат
+            try:
+                hashmap[1.5] = "float"
+                assert False, "Тест не пройден: TypeError не был вызван для неподдерживаемого ключа"
+            except TypeError:
+                pass  # Ожидаемый результат
+
+def test_readonly_reader():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "table")
+        writer = MmapHashMap(path)
+        writer["key"] = "value"
+        writer.flush()
+
+        reader = MmapHashMap(path, readonly=True)
+        assert reader["key"] == "value", "Тест не пройден: читатель не видит сохранённые данные"
+        try:
+            reader["key"] = "another"
+            assert False, "Тест не пройден: запись в read-only таблицу должна быть запрещена"
+        except PermissionError:
+            pass  # Ожидаемый результат
+
+        # resize подменяет файл слотов: читатель должен переоткрыть его и увидеть новые ключи
+        capacity = writer.capacity
+        for i in range(capacity):
+            writer[i] = i
+        writer["key"] = "updated"
+        writer.flush()
+        assert writer.capacity > capacity, "Тест не пройден: таблица слотов не выросла"
+        assert reader["key"] == "updated" and reader[capacity - 1] == capacity - 1, \
+            "Тест не пройден: читатель не видит ключи после resize писателя"
+        assert len(list(reader.items())) == capacity + 1, "Тест не пройден: неверный items у читателя после resize"
+        reader.close()
+
+        # неподдерживаемый ключ отвергается до того, как файл помечен грязным
+        for action in (lambda: writer.__setitem__(1.5, "float"), lambda: writer.pop(1.5)):
+            try:
+                action()
+                assert False, "Тест не пройден: TypeError не был вызван для неподдерживаемого ключа"
+            except TypeError:
+                pass  # Ожидаемый результат
+            assert not writer._dirty and _SLOTS_HEADER.unpack_from(writer._slots_mm, 0)[5] == 0, \
+                "Тест не пройден: неподдерживаемый ключ пометил файл грязным"
+        writer.close()
+
+def test_crash_recovery():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "table")
+        hashmap = MmapHashMap(path)
+        for i in range(100):
+            hashmap[i] = i
+        hashmap.flush()
+        for i in range(100, 200):
+            hashmap[i] = i
+        # "падение" процесса: файлы закрываются без flush, заголовок остаётся грязным
+        hashmap._close_files()
+
+        with MmapHashMap(path) as hashmap:
+            for i in range(100):
+                assert hashmap[i] == i, f"Тест не пройден: сохранённый ключ {i} потерялся после восстановления"
+            assert len(hashmap) == len(list(hashmap.items())), "Тест не пройден: размер не согласован с содержимым"
+            assert len(hashmap) == 100, "Тест не пройден: записи после последнего flush должны быть отброшены"
+
+def test_crash_after_update_keeps_flushed_value():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "table")
+        hashmap = MmapHashMap(path)
+        for key in "abc":
+            hashmap[key] = 1
+        hashmap.flush()
+        reader = MmapHashMap(path, readonly=True)
+
+        hashmap["a"] = 100
+        hashmap.pop("b")
+        hashmap["c"] = 300
+        assert hashmap["a"] == 100 and "b" not in hashmap, "Тест не пройден: писатель не видит свои изменения"
+        # до flush читатель видит прошлую сохранённую версию, а не теряет ключи
+        assert reader["a"] == 1 and reader["b"] == 1 and "c" in reader, "Тест не пройден: читатель потерял сохранённые ключи"
+        assert len(list(reader.items())) == 3, "Тест не пройден: неверный items у читателя"
+        # "падение" писателя без flush
+        hashmap._close_files()
+
+        with MmapHashMap(path) as hashmap:
+            assert hashmap["a"] == 1 and hashmap["b"] == 1 and hashmap["c"] == 1, \
+                "Тест не пройден: после падения должны остаться значения последнего flush"
+            assert len(hashmap) == 3, "Тест не пройден: неверный размер после восстановления"
+            hashmap["a"] = 200
+            hashmap.pop("b")
+        # после flush читатель видит новые записи, дописанные в кучу после его открытия
+        assert reader["a"] == 200 and "b" not in reader, "Тест не пройден: читатель не видит сохранённое обновление"
+        reader.close()
+
+
+# Запуск тестов
+if __name__ == "__main__":
+    test_put_get_pop_and_reopen()
+    test_readonly_reader()
+    test_crash_recovery()
+    test_crash_after_update_keeps_flushed_value()
+
+    print("Все тесты пройдены!")
@@ -0,0 +1,123 @@
+import random
+import sys
+import time
+import tracemalloc
+
+from my_array import MyList
+
+
+def bench_memory(n: int):
+    # значения вне кэша маленьких int, чтобы список объектов платил и за боксинг
+    print(f"{'storage':<22}{'n':>10}{'append, us':>12}{'extend, ms':>12}{'bytes/item':>12}")
+    for name, factory in [
+        ("list", list),
+        ("MyList", MyList),
+        ("MyList(dtype='i8')", lambda: MyList(dtype="i8")),
+    ]:
+        items = factory()
+        start = time.perf_counter()
+        for i in range(n):
+            items.append(i + 1000)
+        append_time = time.perf_counter() - start
+
+        items = factory()
+        start = time.perf_counter()
+        items.extend(range(1000, n + 1000))
+        extend_time = time.perf_counter() - start
+        del items
+
+        tracemalloc.start()
+        items = factory()
+        items.extend(range(1000, n + 1000))
+        memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del items
+
+        print(f"{name:<22}{n:>10}{append_time / n * 1e6:>12.3f}{extend_time * 1e3:>12.1f}{memory / n:>12.1f}")
+
+
+def bench_delete(n: int, remove_n: int):
+    # удаляем все чётные: remove в цикле - квадратичен, delete_where - один проход
+    print(f"{'method':<36}{'n':>10}{'time, ms':>12}")
+    for dtype in (None, "i8"):
+        for name, count, delete in [
+            ("repeated remove", remove_n, lambda items, count: [items.remove(i) for i in range(0, count, 2)]),
+            ("delete_where", remove_n, lambda items, count: items.delete_where(lambda x: x % 2 == 0)),
+            ("delete_where", n, lambda items, count: items.delete_where(lambda x: x % 2 == 0)),
+        ]:
+            items = MyList(dtype=dtype)
+            items.extend(range(count))
+            start = time.perf_counter()
+            delete(items, count)
+            elapsed = time.perf_counter() - start
+            assert len(items) == count // 2
+            print(f"{name + f' (dtype={dtype})':<36}{count:>10}{elapsed * 1e3:>12.1f}")
+
+
+def _typing_trace(n: int, size: int, seed: int = 1):
+    # набор текста: курсор иногда прыгает, дальше идут вставки и изредка backspace рядом с ним
+    rng = random.Random(seed)
+    cursor, trace = size // 2, []
+    for _ in range(n):
+        if rng.random() < 0.01:
+            cursor = rng.randrange(size + 1)
+        if rng.random() < 0.1 and cursor > 0:
+            cursor -= 1
+            size -= 1
+            trace.append((cursor, False))
+        else:
+            trace.append((cursor, True))
+            cursor += 1
+            size += 1
+    return trace
+
+
+def _random_trace(n: int, size: int, seed: int = 1):
+    rng = random.Random(seed)
+    trace = []
+    for _ in range(n):
+        if rng.random() < 0.5 and size > 0:
+            trace.append((rng.randrange(size), False))
+            size -= 1
+        else:
+            trace.append((rng.randrange(size + 1), True))
+            size += 1
+    return trace
+
+
+def bench_edits(size: int, n: int):
+    # документ из size символов (коды в u4), трассы правок по n операций
+    print(f"document {size} items, {n} edits per trace")
+    print(f"{'storage':<14}{'typing, us/edit':>18}{'random, us/edit':>18}")
+    traces = [_typing_trace(n, size), _random_trace(n, size)]
+    for storage in ("array", "gap_buffer", "rope"):
+        results = []
+        for trace in traces:
+            document = MyList(dtype="u4", storage=storage)
+            document.extend(range(size))
+            start = time.perf_counter()
+            for index, is_insert in trace:
+                if is_insert:
+                    document.insert(index, 120)
+                else:
+                    del document[index]
+            results.append((time.perf_counter() - start) / n * 1e6)
+        print(f"{storage:<14}{results[0]:>18.2f}{results[1]:>18.2f}")
+
+
+# Запуск бенчмарков: python benchmarks.py memory [n] | delete [n] [remove_n] | edits [size] [n]
+if __name__ == "__main__":
+    name = sys.argv[1] if len(sys.argv) > 1 else "memory"
+    args = sys.argv[2:]
+    if name == "memory":
+        bench_memory(int(args[0]) if args else 1_000_000)
+    elif name == "delete":
+        bench_delete(
+            int(args[0]) if args else 10_000_000,
+            int(args[1]) if len(args) > 1 else 20_000,
+        )
+    elif name == "edits":
+        bench_edits(
+            int(args[0]) if args else 1_000_000,
+            int(args[1]) if len(args) > 1 else 20_000,
+        )
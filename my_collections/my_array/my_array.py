@@ -1,58 +1,516 @@
+from array import array
+from itertools import chain, filterfalse, islice
 from pydantic import BaseModel
-from typing import List, Any, Optional
+from typing import List, Any, Callable, Literal, Optional, Tuple
 
 
-class MyList(BaseModel):
+# dtype в стиле NumPy -> typecode модуля array
+DTYPES = {
+    "i1": "b", "u1": "B",
+    "i2": "h", "u2": "H",
+    "i4": "i", "u4": "I",
+    "i8": "q", "u8": "Q",
+    "f4": "f", "f8": "d",
+}
+_FORMAT_KINDS = ("bhilq", "BHILQ", "fd")
+
+
+def _buffer_matches(view: memoryview, typecode: str) -> bool:
+    # NumPy отдаёт int64 как "l", array - как "q": сравниваем вид числа и размер, а не букву
+    fmt = view.format.lstrip("@=")
+    if len(fmt) != 1 or view.itemsize != array(typecode).itemsize:
+        return False
+    return any(typecode in kind and fmt in kind for kind in _FORMAT_KINDS)
+
+
+def _allocate(dtype: Optional[str], n: int):
+    if dtype is None:
+        return [None]*n
+    typecode = DTYPES[dtype]
+    return array(typecode, bytes(n * array(typecode).itemsize))
+
+
+def _to_storage(dtype: Optional[str], items: Any):
+    if dtype is None:
+        return list(items)
+    typecode = DTYPES[dtype]
+    if isinstance(items, array) and items.typecode == typecode:
+        return items
+    try:
+        view = memoryview(items)
+    except TypeError:
+        view = None
+    if view is not None and view.c_contiguous and _buffer_matches(view, typecode):
+        # совместимый непрерывный буфер (array, NumPy) копируется целиком, без Python-цикла
+        chunk = array(typecode)
+        chunk.frombytes(view.cast("B"))
+        return chunk
+    return array(typecode, items)
+
+
+class _EditBuffer:
+    # общая часть движков MyList (и самого MyList с хранилищем "array"): срезы, remove/pop,
+    # delete_where поверх примитивов _get, _set, _range, _insert, _delete, _replace и атрибута
+    # dtype, которые реализует каждый движок
+    __slots__ = ()
+
+    def _index(self, index: int) -> int:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("No such index")
+        return index
+
+    def __getitem__(self, index: Any):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step == 1:
+                return self._range(start, max(start, stop))
+            return _to_storage(self.dtype, self)[index]
+        return self._get(self._index(index))
+
+    def __setitem__(self, index: Any, item: Any):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            chunk = _to_storage(self.dtype, item)
+            if step == 1:
+                self._replace(start, max(start, stop), chunk)
+            else:
+                live = _to_storage(self.dtype, self)
+                live[index] = chunk
+                self._replace(0, len(self), live)
+            return
+        self._set(self._index(index), item)
+
+    def __delitem__(self, index: Any):
+        if not isinstance(index, slice):
+            self._delete(self._index(index))
+            return
+        start, stop, step = index.indices(len(self))
+        if step == 1:
+            self._replace(start, max(start, stop), _allocate(self.dtype, 0))
+        else:
+            live = _to_storage(self.dtype, self)
+            del live[index]
+            self._replace(0, len(self), live)
+
+    def append(self, item: Any):
+        self._insert(len(self), item)
+
+    def extend(self, items: Any):
+        self._replace(len(self), len(self), _to_storage(self.dtype, items))
+
+    def insert(self, index: int, item: Any):
+        if index < 0:
+            index = max(index + len(self), 0)
+        self._insert(min(index, len(self)), item)
+
+    def remove(self, item: Any):
+        for index, current in enumerate(self):
+            if current == item:
+                self._delete(index)
+                return
+        raise ValueError("No such element")
+
+    def pop(self, index: int = -1):
+        index = self._index(index)
+        item = self._get(index)
+        self._delete(index)
+        return item
+
+    def delete_where(self, predicate: Callable[[Any], bool]) -> int:
+        kept = _to_storage(self.dtype, filterfalse(predicate, self))
+        removed = len(self) - len(kept)
+        if removed:
+            self._replace(0, len(self), kept)
+        return removed
+
+
+class GapBuffer(_EditBuffer):
+    """
+    Gap buffer: элементы лежат в одном буфере с «дырой» в месте последней правки.
+    Вставка и удаление у курсора - O(1), перенос курсора на d позиций - один срез длины d.
+    """
+
+    __slots__ = ("dtype", "_buffer", "_gap_start", "_gap_end")
+
+    def __init__(self, dtype: Optional[str] = None, capacity: int = 16):
+        self.dtype = dtype
+        self._buffer = _allocate(dtype, capacity)
+        self._gap_start = 0
+        self._gap_end = capacity
+
+    def __len__(self):
+        return len(self._buffer) - (self._gap_end - self._gap_start)
+
+    def _clear(self, start: int, stop: int):
+        # в списке объектов дыра не должна держать ссылки на удалённые или перенесённые элементы
+        if self.dtype is None and start < stop:
+            self._buffer[start:stop] = [None]*(stop - start)
+
+    def _move_gap(self, index: int):
+        buffer, gap_start, gap_end = self._buffer, self._gap_start, self._gap_end
+        if index < gap_start:
+            shift = gap_start - index
+            buffer[gap_end - shift:gap_end] = buffer[index:gap_start]
+            self._clear(index, min(gap_start, gap_end - shift))
+            self._gap_start, self._gap_end = index, gap_end - shift
+        elif index > gap_start:
+            shift = index - gap_start
+            buffer[gap_start:index] = buffer[gap_end:gap_end + shift]
+            self._clear(max(gap_end, index), gap_end + shift)
+            self._gap_start, self._gap_end = index, gap_end + shift
+
+    def _ensure_gap(self, n: int):
+        gap = self._gap_end - self._gap_start
+        if gap < n:
+            # новая дыра вставляется на месте старой: хвост сдвигается одним memmove
+            extra = max(len(self._buffer), n - gap)
+            self._buffer[self._gap_start:self._gap_start] = _allocate(self.dtype, extra)
+            self._gap_end += extra
+
+    def _physical(self, index: int) -> int:
+        return index if index < self._gap_start else index + self._gap_end - self._gap_start
+
+    def _get(self, index: int):
+        return self._buffer[self._physical(index)]
+
+    def _set(self, index: int, item: Any):
+        self._buffer[self._physical(index)] = item
+
+    def _range(self, start: int, stop: int):
+        if stop <= self._gap_start:
+            return self._buffer[start:stop]
+        if start >= self._gap_start:
+            return self._buffer[self._physical(start):self._physical(stop)]
+        return self._buffer[start:self._gap_start] + self._buffer[self._gap_end:self._physical(stop)]
+
+    def _insert(self, index: int, item: Any):
+        self._move_gap(index)
+        self._ensure_gap(1)
+        self._buffer[self._gap_start] = item
+        self._gap_start += 1
+
+    def _delete(self, index: int):
+        self._move_gap(index + 1)
+        self._gap_start = index
+        self._clear(index, index + 1)
+
+    def _replace(self, start: int, stop: int, chunk):
+        self._move_gap(stop)
+        self._gap_start = start
+        self._clear(start, stop)
+        self._ensure_gap(len(chunk))
+        if len(chunk):
+            self._buffer[start:start + len(chunk)] = chunk
+            self._gap_start += len(chunk)
+
+    def compact(self):
+        self._move_gap(len(self))
+        del self._buffer[self._gap_start:]
+        self._gap_end = self._gap_start
+
+    def __iter__(self):
+        return chain(islice(self._buffer, self._gap_start), islice(self._buffer, self._gap_end, None))
+
+
+class ChunkedList(_EditBuffer):
+    """
+    Rope из кусков по load..2*load элементов (B-дерево глубины 2) и дерево Фенвика по их длинам:
+    поиск позиции - O(log n), вставка и удаление сдвигают только один кусок, а не весь хвост.
+    Кусок, ставший меньше load // 2 после удалений, сливается с соседом, поэтому кусков
+    остаётся O(n / load) и дерево не вырождается.
+    """
+
+    __slots__ = ("dtype", "load", "_chunks", "_tree", "_len")
+
+    def __init__(self, dtype: Optional[str] = None, load: int = 256):
+        if load < 1:
+            raise ValueError("load must be positive")
+        self.dtype = dtype
+        self.load = load
+        self._chunks = [_allocate(dtype, 0)]
+        self._len = 0
+        self._rebuild()
+
+    def __len__(self):
+        return self._len
+
+    def _rebuild(self):
+        # дерево Фенвика строится за O(число кусков); нужно, только когда куски делятся или исчезают
+        tree = [0] + [len(chunk) for chunk in self._chunks]
+        for i in range(1, len(tree)):
+            parent = i + (i & -i)
+            if parent < len(tree):
+                tree[parent] += tree[i]
+        self._tree = tree
+
+    def _add(self, chunk_index: int, delta: int):
+        tree = self._tree
+        i = chunk_index + 1
+        while i < len(tree):
+            tree[i] += delta
+            i += i & -i
+
+    def _locate(self, index: int) -> Tuple[int, int]:
+        # (номер куска, смещение в нём); index == len - позиция сразу за последним элементом
+        if index == self._len:
+            return len(self._chunks) - 1, len(self._chunks[-1])
+        tree = self._tree
+        pos = 0
+        step = 1 << (len(tree) - 1).bit_length() - 1
+        while step:
+            next_pos = pos + step
+            if next_pos < len(tree) and tree[next_pos] <= index:
+                pos = next_pos
+                index -= tree[next_pos]
+            step >>= 1
+        return pos, index
+
+    def _get(self, index: int):
+        chunk_index, offset = self._locate(index)
+        return self._chunks[chunk_index][offset]
+
+    def _set(self, index: int, item: Any):
+        chunk_index, offset = self._locate(index)
+        self._chunks[chunk_index][offset] = item
+
+    def _range(self, start: int, stop: int):
+        chunk_index, offset = self._locate(start)
+        items = chain.from_iterable(islice(self._chunks, chunk_index, None))
+        return _to_storage(self.dtype, islice(items, offset, offset + stop - start))
+
+    def _split(self, items) -> list:
+        # равные куски от load до 2*load элементов; короче - только если всех элементов меньше load
+        count = max(1, len(items) // self.load)
+        bounds = [len(items) * i // count for i in range(count + 1)]
+        return [items[bounds[i]:bounds[i + 1]] for i in range(count)]
+
+    def _merge(self, chunk_index: int) -> bool:
+        # слить мелкий кусок с соседом; True, если куски изменились и дерево нужно перестроить
+        chunks = self._chunks
+        if len(chunks) < 2 or len(chunks[chunk_index]) >= max(1, self.load // 2):
+            return False
+        if chunk_index == len(chunks) - 1:
+            chunk_index -= 1
+        merged = chunks[chunk_index] + chunks[chunk_index + 1]
+        chunks[chunk_index:chunk_index + 2] = self._split(merged) if len(merged) > 2*self.load else [merged]
+        return True
+
+    def _insert(self, index: int, item: Any):
+        chunk_index, offset = self._locate(index)
+        chunk = self._chunks[chunk_index]
+        chunk.insert(offset, item)
+        self._len += 1
+        if len(chunk) > 2*self.load:
+            self._chunks[chunk_index:chunk_index + 1] = self._split(chunk)
+            self._rebuild()
+        else:
+            self._add(chunk_index, 1)
+
+    def _delete(self, index: int):
+        chunk_index, offset = self._locate(index)
+        chunk = self._chunks[chunk_index]
+        del chunk[offset]
+        self._len -= 1
+        if self._merge(chunk_index):
+            self._rebuild()
+        else:
+            self._add(chunk_index, -1)
+
+    def _replace(self, start: int, stop: int, chunk):
+        # затронутые куски склеиваются, правятся одним срезом и режутся заново по load
+        first, offset = self._locate(start)
+        last = self._locate(stop - 1)[0] if stop > start else first
+        merged = self._chunks[first][:]
+        for piece in self._chunks[first + 1:last + 1]:
+            merged += piece
+        if len(chunk):
+            merged[offset:offset + stop - start] = chunk
+        else:
+            del merged[offset:offset + stop - start]
+        pieces = [merged] if len(merged) <= 2*self.load else self._split(merged)
+        if not merged and len(self._chunks) > last - first + 1:
+            pieces = []
+        self._chunks[first:last + 1] = pieces
+        if pieces:
+            # после _split мельче load может быть только единственный кусок
+            self._merge(first)
+        self._len += len(chunk) - (stop - start)
+        self._rebuild()
+
+    def compact(self):
+        # после удалений куски мельчают: перекладываем всё в полные куски по load
+        items = _allocate(self.dtype, 0)
+        for chunk in self._chunks:
+            items += chunk
+        self._chunks = self._split(items) or [items]
+        self._rebuild()
+
+    def __iter__(self):
+        return chain.from_iterable(self._chunks)
+
+
+class MyList(BaseModel, _EditBuffer):
     my_list: List = []
     size: int = 2
     cur_size: int = 0
+    # None - список Python-объектов, иначе компактный типизированный буфер array (см. DTYPES)
+    dtype: Optional[str] = None
+    # "array" - непрерывный буфер; "gap_buffer" - правки у курсора за O(1);
+    # "rope" - правки в случайных позициях за O(log n), куски по chunk_size элементов
+    storage: Literal["array", "gap_buffer", "rope"] = "array"
+    chunk_size: int = 256
+    engine: Optional[Any] = None
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.my_list = [None]*self.size
-    
-    def __getitem__(self, index: int):
+        if self.dtype is not None and self.dtype not in DTYPES:
+            raise ValueError(f"unsupported dtype {self.dtype!r}, expected one of {list(DTYPES)}")
+        if self.storage == "gap_buffer":
+            self.engine = GapBuffer(self.dtype, self.size)
+        elif self.storage == "rope":
+            self.engine = ChunkedList(self.dtype, self.chunk_size)
+        else:
+            self.my_list = _allocate(self.dtype, self.size)
+
+    # хранилище "array": MyList сам реализует примитивы _EditBuffer над my_list[:cur_size],
+    # а срезы, insert, pop и delete_where берёт из общей части, как и движки
+
+    def _grow(self, min_size: int):
+        # один extend на уровне C вместо поэлементного копирования
+        new_size = max(int(self.size*1.5), min_size)
+        self.my_list.extend(_allocate(self.dtype, new_size - self.size))
+        self.size = new_size
+
+    def _get(self, index: int):
         return self.my_list[index]
 
-    def __setitem__(self, index: int, item: Any):
+    def _set(self, index: int, item: Any):
         self.my_list[index] = item
 
+    def _range(self, start: int, stop: int):
+        return self.my_list[start:stop]
+
+    def _insert(self, index: int, item: Any):
+        if self.cur_size == self.size:
+            self._grow(self.size + 1)
+        if index < self.cur_size:
+            self.my_list[index + 1:self.cur_size + 1] = self.my_list[index:self.cur_size]
+        self.my_list[index] = item
+        self.cur_size += 1
+
+    def _replace(self, start: int, stop: int, chunk):
+        # [start, stop) заменяется на chunk: хвост сдвигается одним срезом (memmove),
+        # освободившиеся ячейки обнуляются, чтобы список объектов не держал ссылки
+        new_size = self.cur_size - (stop - start) + len(chunk)
+        if new_size > self.size:
+            self._grow(new_size)
+        if start + len(chunk) != stop:
+            self.my_list[start + len(chunk):new_size] = self.my_list[stop:self.cur_size]
+        if len(chunk):
+            self.my_list[start:start + len(chunk)] = chunk
+        if new_size < self.cur_size:
+            self.my_list[new_size:self.cur_size] = _allocate(self.dtype, self.cur_size - new_size)
+        self.cur_size = new_size
+
+    def _delete(self, index: int):
+        self._replace(index, index + 1, ())
+
+    def _new(self, chunk) -> "MyList":
+        result = self.__class__(dtype=self.dtype, storage=self.storage, chunk_size=self.chunk_size, size=0)
+        result.extend(chunk)
+        return result
+
+    def __getitem__(self, index: Any):
+        if self.engine is not None:
+            item = self.engine[index]
+        else:
+            item = _EditBuffer.__getitem__(self, index)
+        return self._new(item) if isinstance(index, slice) else item
+
+    def __setitem__(self, index: Any, item: Any):
+        if self.engine is not None:
+            self.engine[index] = item
+        else:
+            _EditBuffer.__setitem__(self, index, item)
+
+    def __delitem__(self, index: Any):
+        if self.engine is not None:
+            del self.engine[index]
+        else:
+            _EditBuffer.__delitem__(self, index)
+
     def __len__(self):
+        if self.engine is not None:
+            return len(self.engine)
         return self.cur_size
-     
+
     def append(self, item: Any):
+        if self.engine is not None:
+            self.engine.append(item)
+            return
+        # самая частая операция: без вызова _insert и сдвига хвоста
         if self.cur_size == self.size:
-            new_array = [None]*(int(self.size*1.5))
-            for index, num in enumerate(self.my_list):
-                new_array[index] = num
-            self.my_list = new_array
-            self.size = len(self.my_list)
-
+            self._grow(self.size + 1)
         self.my_list[self.cur_size] = item
         self.cur_size += 1
-    
+
+    def extend(self, items: Any):
+        if self.engine is not None:
+            self.engine.extend(items)
+        else:
+            _EditBuffer.extend(self, items)
+
+    def insert(self, index: int, item: Any):
+        # как list.insert: индекс за границами прижимается к началу или концу
+        if self.engine is not None:
+            self.engine.insert(index, item)
+        else:
+            _EditBuffer.insert(self, index, item)
+
+    def delete_where(self, predicate: Callable[[Any], bool]) -> int:
+        # один линейный проход вместо remove в цикле (каждый remove - свой сдвиг хвоста)
+        if self.engine is not None:
+            return self.engine.delete_where(predicate)
+        return _EditBuffer.delete_where(self, predicate)
+
+    def compact(self):
+        if self.engine is not None:
+            self.engine.compact()
+            return
+        # отдаёт неиспользуемую ёмкость буфера: size становится равным числу элементов
+        del self.my_list[self.cur_size:]
+        self.size = self.cur_size
+
     def remove(self, item: Any):
-        self.cur_size -= 1
-        for index, num in enumerate(self.my_list):
-            if num == item:
-                del self.my_list[index]
-                return
-        self.cur_size += 1
-        raise ValueError("No such element")
+        if self.engine is not None:
+            self.engine.remove(item)
+            return
+        # поиск в непрерывном буфере - list.index/array.index на уровне C
+        try:
+            index = self.my_list.index(item, 0, self.cur_size)
+        except ValueError:
+            raise ValueError("No such element")
+        self._delete(index)
 
     def pop(self, index: int=-1):
-        self.cur_size -= 1
-        if index == -1 and self.cur_size!=-1:
-            self.my_list[self.cur_size] = None
-            return
-        for i, num in enumerate(self.my_list):
-            if i == index:
-                del self.my_list[index]
-                return
-        self.cur_size += 1
-        raise IndexError("No such index")
+        if self.engine is not None:
+            return self.engine.pop(index)
+        return _EditBuffer.pop(self, index)
 
-    def __iter__(self):
-        for i in range(self.cur_size):
-            yield self.my_list[i]
+    def as_memoryview(self) -> memoryview:
+        # zero-copy доступ к данным, например np.asarray(my_list.as_memoryview());
+        # пока view жив, array не даст себя перевыделить (BufferError), так что view не повиснет
+        if self.dtype is None or self.engine is not None:
+            raise TypeError("only typed MyList with array storage exposes a buffer")
+        return memoryview(self.my_list)[:self.cur_size]
+
+    def __buffer__(self, flags: int) -> memoryview:
+        # PEP 688 (Python 3.12+): memoryview(my_list) и np.asarray(my_list) без копирования
+        return self.as_memoryview()
 
+    def __iter__(self):
+        if self.engine is not None:
+            return iter(self.engine)
+        return islice(self.my_list, self.cur_size)
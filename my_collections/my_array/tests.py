@@ -1,3 +1,6 @@
+import random
+from array import array
+
 from my_array import MyList
 
 
@@ -137,6 +140,224 @@ def test_resize():
     
     print("Тест на увеличение размера прошел успешно!")
 
+def test_typed_append_and_extend():
+    my_list = MyList(dtype="i8")
+
+    for i in range(10):
+        my_list.append(i)
+    assert list(my_list) == list(range(10)), "Тест не пройден: неверные элементы типизированного списка"
+    assert my_list.my_list.typecode == "q", "Тест не пройден: i8 должен храниться в array('q')"
+    assert len(my_list.my_list) == my_list.size, "Тест не пройден: size рассинхронизирован с буфером"
+
+    my_list.extend([10, 11])
+    my_list.extend(range(12, 15))
+    my_list.extend(array("q", [15, 16]))
+    my_list.extend(memoryview(array("l", [17, 18])))
+    assert list(my_list) == list(range(19)), "Тест не пройден: extend из iterable или буфера работает неверно"
+
+    try:
+        my_list.append(1.5)
+        assert False, "Тест не пройден: TypeError должен был быть вызван при добавлении float в i8"
+    except TypeError:
+        pass  # Ожидаемый результат
+
+    floats = MyList(dtype="f8")
+    floats.extend(memoryview(array("d", [0.5, 1.5])))
+    floats.extend([2.5])
+    assert list(floats) == [0.5, 1.5, 2.5], "Тест не пройден: extend для f8 работает неверно"
+
+    try:
+        MyList(dtype="i3")
+        assert False, "Тест не пройден: ValueError должен был быть вызван для неизвестного dtype"
+    except ValueError:
+        pass  # Ожидаемый результат
+
+    print("Тест типизированного списка прошел успешно!")
+
+def test_typed_remove_and_pop():
+    for dtype in (None, "i4"):
+        my_list = MyList(dtype=dtype)
+        my_list.extend(range(10))
+
+        my_list.remove(3)
+        assert my_list.pop(0) == 0, "Тест не пройден: pop(0) должен вернуть удалённый элемент"
+        assert my_list.pop() == 9, "Тест не пройден: pop() должен вернуть последний элемент"
+        assert my_list.pop(-2) == 7, "Тест не пройден: pop(-2) должен вернуть предпоследний элемент"
+        assert list(my_list) == [1, 2, 4, 5, 6, 8], "Тест не пройден: неверные элементы после удалений"
+        # удаление не должно рассинхронизировать размер буфера и size
+        assert len(my_list.my_list) == my_list.size, "Тест не пройден: size рассинхронизирован с буфером"
+
+        my_list.append(10)
+        assert my_list[-1] == 10, "Тест не пройден: append после удалений работает неверно"
+
+    print("Тест удаления в типизированном списке прошел успешно!")
+
+def test_buffer_protocol():
+    my_list = MyList(dtype="f8")
+    my_list.extend([1.0, 2.0, 3.0])
+
+    view = my_list.as_memoryview()
+    assert view.format == "d" and view.tolist() == [1.0, 2.0, 3.0], "Тест не пройден: неверный memoryview"
+
+    # изменения через view видны в списке - данные не копировались
+    view[0] = 10.0
+    assert my_list[0] == 10.0, "Тест не пройден: memoryview должен смотреть на те же данные"
+    view.release()
+
+    try:
+        MyList().as_memoryview()
+        assert False, "Тест не пройден: TypeError должен был быть вызван для списка объектов"
+    except TypeError:
+        pass  # Ожидаемый результат
+
+    print("Тест buffer protocol прошел успешно!")
+
+def test_slices_and_insert():
+    for dtype in (None, "i8"):
+        my_list = MyList(dtype=dtype)
+        my_list.extend(range(10))
+
+        assert list(my_list[2:5]) == [2, 3, 4], "Тест не пройден: неверный срез [2:5]"
+        assert list(my_list[::-3]) == [9, 6, 3, 0], "Тест не пройден: неверный срез с шагом"
+        assert my_list[2:5].dtype == dtype, "Тест не пройден: срез должен сохранять dtype"
+
+        my_list[2:5] = [20, 30]
+        assert list(my_list) == [0, 1, 20, 30, 5, 6, 7, 8, 9], "Тест не пройден: присваивание среза меньшей длины"
+        my_list[0:1] = [-1, -2, -3]
+        assert list(my_list) == [-1, -2, -3, 1, 20, 30, 5, 6, 7, 8, 9], "Тест не пройден: присваивание среза большей длины"
+        del my_list[1:3]
+        assert list(my_list) == [-1, 1, 20, 30, 5, 6, 7, 8, 9], "Тест не пройден: удаление среза"
+        del my_list[::2]
+        assert list(my_list) == [1, 30, 6, 8], "Тест не пройден: удаление среза с шагом"
+
+        my_list.insert(0, 100)
+        my_list.insert(2, 200)
+        my_list.insert(100, 300)
+        assert list(my_list) == [100, 1, 200, 30, 6, 8, 300], "Тест не пройден: неверный insert"
+
+        try:
+            my_list[::2] = [1]
+            assert False, "Тест не пройден: ValueError должен был быть вызван при несовпадении длины среза"
+        except ValueError:
+            pass  # Ожидаемый результат
+
+    # случайные операции сверяем со встроенным list
+    rng = random.Random(12)
+    my_list, expected = MyList(dtype="i4"), []
+    for _ in range(500):
+        start, stop = sorted(rng.randrange(len(expected) + 1) for _ in range(2))
+        values = [rng.randrange(1000) for _ in range(rng.randrange(4))]
+        operation = rng.randrange(3)
+        if operation == 0:
+            my_list[start:stop] = values
+            expected[start:stop] = values
+        elif operation == 1:
+            del my_list[start:stop]
+            del expected[start:stop]
+        else:
+            my_list.insert(start, values[0] if values else 0)
+            expected.insert(start, values[0] if values else 0)
+        assert list(my_list) == expected, "Тест не пройден: MyList разошёлся со встроенным list"
+        assert len(my_list.my_list) == my_list.size, "Тест не пройден: size рассинхронизирован с буфером"
+
+    print("Тест срезов и insert прошел успешно!")
+
+def test_delete_where_and_compact():
+    for dtype in (None, "u2"):
+        my_list = MyList(dtype=dtype)
+        my_list.extend(range(100))
+
+        assert my_list.delete_where(lambda x: x % 3 == 0) == 34, "Тест не пройден: delete_where вернул неверное число"
+        assert list(my_list) == [x for x in range(100) if x % 3], "Тест не пройден: неверные элементы после delete_where"
+        assert my_list.delete_where(lambda x: x > 1000) == 0, "Тест не пройден: delete_where удалил лишнее"
+
+        my_list.compact()
+        assert my_list.size == len(my_list) == len(my_list.my_list) == 66, "Тест не пройден: compact не освободил ёмкость"
+        my_list.append(1000)
+        assert my_list[-1] == 1000 and len(my_list) == 67, "Тест не пройден: append после compact"
+
+    my_list = MyList()
+    my_list.compact()
+    my_list.append(1)
+    assert list(my_list) == [1], "Тест не пройден: append после compact пустого списка"
+
+    print("Тест delete_where и compact прошел успешно!")
+
+def test_edit_storages():
+    for storage in ("gap_buffer", "rope"):
+        for dtype in (None, "i4"):
+            my_list = MyList(storage=storage, dtype=dtype, chunk_size=4)
+            my_list.extend(range(10))
+            my_list.insert(3, 100)
+            my_list.remove(5)
+            assert my_list.pop(0) == 0 and my_list.pop() == 9, "Тест не пройден: неверный pop"
+            assert list(my_list) == [1, 2, 100, 3, 4, 6, 7, 8], f"Тест не пройден: неверные элементы ({storage})"
+            assert isinstance(my_list[1:3], MyList) and my_list[1:3].storage == storage, "Тест не пройден: срез должен сохранять storage"
+
+            # случайные правки сверяем со встроенным list
+            rng = random.Random(7)
+            expected = list(my_list)
+            for _ in range(1000):
+                start = rng.randrange(len(expected) + 1)
+                stop = min(len(expected), start + rng.randrange(4))
+                operation = rng.randrange(4)
+                if operation == 0:
+                    values = [rng.randrange(100) for _ in range(rng.randrange(8))]
+                    my_list[start:stop] = values
+                    expected[start:stop] = values
+                elif operation == 1:
+                    del my_list[start:stop]
+                    del expected[start:stop]
+                elif operation == 2:
+                    my_list.insert(start, start)
+                    expected.insert(start, start)
+                elif expected:
+                    index = rng.randrange(len(expected))
+                    assert my_list.pop(index) == expected.pop(index), "Тест не пройден: pop вернул не тот элемент"
+                assert list(my_list) == expected, f"Тест не пройден: {storage} разошёлся со встроенным list"
+
+            assert [my_list[i] for i in range(len(expected))] == expected, "Тест не пройден: неверная индексация"
+            assert my_list.delete_where(lambda x: x % 2 == 0) == sum(1 for x in expected if x % 2 == 0)
+            my_list.compact()
+            assert list(my_list) == [x for x in expected if x % 2], "Тест не пройден: compact изменил элементы"
+
+            try:
+                my_list.as_memoryview()
+                assert False, "Тест не пройден: TypeError должен был быть вызван для не-array хранилища"
+            except TypeError:
+                pass  # Ожидаемый результат
+
+    # набор текста подряд не двигает дыру gap buffer
+    my_list = MyList(storage="gap_buffer")
+    my_list.extend("hello world")
+    for i, char in enumerate("big "):
+        my_list.insert(6 + i, char)
+    my_list.pop(9)
+    assert "".join(my_list) == "hello bigworld", "Тест не пройден: неверный текст после правок"
+    assert my_list.engine._gap_start == 9, "Тест не пройден: дыра должна оставаться у курсора"
+
+    # куски rope не должны вырастать больше 2 * chunk_size
+    my_list = MyList(storage="rope", chunk_size=8)
+    for i in range(1000):
+        my_list.insert(i // 2, i)
+    assert max(len(chunk) for chunk in my_list.engine._chunks) <= 16, "Тест не пройден: кусок rope не разделился"
+
+    # после удалений мелкие куски сливаются с соседями, а не копятся
+    rng = random.Random(3)
+    expected = list(my_list)
+    for _ in range(900):
+        index = rng.randrange(len(expected))
+        assert my_list.pop(index) == expected.pop(index), "Тест не пройден: pop вернул не тот элемент"
+    del my_list[10:60]
+    del expected[10:60]
+    chunks = my_list.engine._chunks
+    assert list(my_list) == expected, "Тест не пройден: rope разошёлся со встроенным list после удалений"
+    assert min(len(chunk) for chunk in chunks) >= 4 and max(len(chunk) for chunk in chunks) <= 16, \
+        "Тест не пройден: мелкие куски rope не слились с соседями"
+    assert len(chunks) <= len(expected) // 4, "Тест не пройден: слишком много кусков после удалений"
+
+    print("Тест gap buffer и rope прошел успешно!")
+
 if __name__ == "__main__":
     test_append()
     test_remove()
@@ -144,4 +365,10 @@ if __name__ == "__main__":
     test_iter_and_indexing()
     test_empty_list()
     test_resize()
+    test_typed_append_and_extend()
+    test_typed_remove_and_pop()
+    test_buffer_protocol()
+    test_slices_and_insert()
+    test_delete_where_and_compact()
+    test_edit_storages()
     print("Все тесты пройдены!")
@@ -0,0 +1,150 @@
+import asyncio
+import queue
+import sys
+import threading
+import time
+import tracemalloc
+from collections import deque as builtin_deque
+
+from blocking_deque import AsyncDeque, BlockingDeque
+from my_deque import LinkedDeque, MyDeque
+
+
+def bench_push_pop(n: int, linked_n: int):
+    print(f"{'deque':<18}{'n':>10}{'append, us':>12}{'popleft, us':>13}{'bytes/item':>12}")
+    for name, factory, count in [
+        ("collections.deque", builtin_deque, n),
+        ("MyDeque", MyDeque, n),
+        # pydantic Node на каждый элемент - меряем на меньшем объёме
+        ("LinkedDeque", LinkedDeque, linked_n),
+    ]:
+        deque = factory()
+        start = time.perf_counter()
+        for i in range(count):
+            deque.append(i)
+        append_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(count):
+            deque.popleft()
+        popleft_time = time.perf_counter() - start
+
+        # один и тот же объект на все позиции, чтобы мерить только накладные расходы деки
+        item = object()
+        tracemalloc.start()
+        deque = factory()
+        for _ in range(count):
+            deque.append(item)
+        memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del deque
+
+        print(
+            f"{name:<18}{count:>10}{append_time / count * 1e6:>12.3f}"
+            f"{popleft_time / count * 1e6:>13.3f}{memory / count:>12.1f}"
+        )
+
+
+class PollingDeque:
+    # как очередь работала раньше: MyDeque под локом, потребитель крутится на is_empty()
+    def __init__(self, maxsize: int = 0):
+        self._deque = MyDeque()
+        self._lock = threading.Lock()
+
+    def put(self, item):
+        with self._lock:
+            self._deque.append(item)
+
+    def get(self):
+        while True:
+            with self._lock:
+                if not self._deque.is_empty():
+                    return self._deque.popleft()
+
+
+def _run_threads(work_queue, n: int, producers: int, consumers: int, batch: int):
+    def producer():
+        for i in range(n // producers):
+            work_queue.put(i)
+
+    def consumer():
+        while True:
+            items = work_queue.get_many(batch) if batch > 1 else [work_queue.get()]
+            if None in items:
+                # лишние стоп-маркеры предназначены другим потребителям
+                for _ in range(items.count(None) - 1):
+                    work_queue.put(None)
+                return
+
+    threads = [threading.Thread(target=consumer) for _ in range(consumers)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    producer_threads = [threading.Thread(target=producer) for _ in range(producers)]
+    for thread in producer_threads:
+        thread.start()
+    for thread in producer_threads:
+        thread.join()
+    for _ in range(consumers):
+        work_queue.put(None)
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start
+
+
+async def _run_tasks(work_queue, n: int, producers: int, consumers: int, batch: int):
+    async def producer():
+        for i in range(n // producers):
+            await work_queue.put(i)
+
+    async def consumer():
+        while True:
+            items = await work_queue.get_many(batch) if batch > 1 else [await work_queue.get()]
+            if None in items:
+                for _ in range(items.count(None) - 1):
+                    await work_queue.put(None)
+                return
+
+    start = time.perf_counter()
+    tasks = [asyncio.create_task(consumer()) for _ in range(consumers)]
+    await asyncio.gather(*(producer() for _ in range(producers)))
+    for _ in range(consumers):
+        await work_queue.put(None)
+    await asyncio.gather(*tasks)
+    return time.perf_counter() - start
+
+
+def bench_pipeline(n: int, producers: int, consumers: int, maxsize: int = 1024):
+    print(f"{producers} producers, {consumers} consumers, {n} items, maxsize={maxsize}")
+    for name, factory, batch in [
+        ("threads: busy-poll MyDeque", lambda: PollingDeque(maxsize), 1),
+        ("threads: queue.Queue", lambda: queue.Queue(maxsize), 1),
+        ("threads: BlockingDeque.get", lambda: BlockingDeque(maxsize), 1),
+        ("threads: BlockingDeque.get_many(64)", lambda: BlockingDeque(maxsize), 64),
+    ]:
+        elapsed = _run_threads(factory(), n, producers, consumers, batch)
+        print(f"{name:<40}{n / elapsed / 1000:>10.0f}k items/s")
+    for name, factory, batch in [
+        ("asyncio: asyncio.Queue", lambda: asyncio.Queue(maxsize), 1),
+        ("asyncio: AsyncDeque.get", lambda: AsyncDeque(maxsize), 1),
+        ("asyncio: AsyncDeque.get_many(64)", lambda: AsyncDeque(maxsize), 64),
+    ]:
+        elapsed = asyncio.run(_run_tasks(factory(), n, producers, consumers, batch))
+        print(f"{name:<40}{n / elapsed / 1000:>10.0f}k items/s")
+
+
+# Запуск бенчмарков: python benchmarks.py push_pop [n] [linked_n] | pipeline [n] [producers] [consumers]
+if __name__ == "__main__":
+    name = sys.argv[1] if len(sys.argv) > 1 else "push_pop"
+    args = sys.argv[2:]
+    if name == "push_pop":
+        bench_push_pop(
+            int(args[0]) if args else 1_000_000,
+            int(args[1]) if len(args) > 1 else 100_000,
+        )
+    elif name == "pipeline":
+        bench_pipeline(
+            int(args[0]) if args else 400_000,
+            int(args[1]) if len(args) > 1 else 4,
+            int(args[2]) if len(args) > 2 else 4,
+        )
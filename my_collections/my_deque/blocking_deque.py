@@ -0,0 +1,145 @@
+import asyncio
+import queue
+import threading
+from typing import Any, Callable, List, Optional
+
+from my_deque import MyDeque
+
+
+class BlockingDeque:
+    """
+    Ограниченная очередь поверх MyDeque для потоков: put ждёт свободного места, get - элемента,
+    оба с таймаутом. Ошибки по таймауту те же, что у queue.Queue: queue.Full и queue.Empty.
+    maxsize=0 - без ограничения.
+    """
+
+    def __init__(self, maxsize: int = 0):
+        self.maxsize = maxsize
+        self._deque = MyDeque()
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+
+    def __len__(self):
+        return len(self._deque)
+
+    def qsize(self):
+        return len(self._deque)
+
+    def empty(self):
+        return self._deque.is_empty()
+
+    def full(self):
+        return 0 < self.maxsize <= len(self._deque)
+
+    @staticmethod
+    def _wait(condition: threading.Condition, predicate: Callable[[], bool], block: bool, timeout: Optional[float]):
+        if block:
+            return condition.wait_for(predicate, timeout)
+        return predicate()
+
+    def put(self, item: Any, block: bool = True, timeout: Optional[float] = None):
+        with self._not_full:
+            if not self._wait(self._not_full, lambda: not self.full(), block, timeout):
+                raise queue.Full
+            self._deque.append(item)
+            self._not_empty.notify()
+
+    def get(self, block: bool = True, timeout: Optional[float] = None):
+        with self._not_empty:
+            if not self._wait(self._not_empty, lambda: not self._deque.is_empty(), block, timeout):
+                raise queue.Empty
+            item = self._deque.popleft()
+            self._not_full.notify()
+            return item
+
+    def get_many(self, n: int, block: bool = True, timeout: Optional[float] = None) -> List[Any]:
+        # ждём хотя бы один элемент, а потом забираем до n за одно пробуждение
+        with self._not_empty:
+            if not self._wait(self._not_empty, lambda: not self._deque.is_empty(), block, timeout):
+                raise queue.Empty
+            items = [self._deque.popleft() for _ in range(min(n, len(self._deque)))]
+            self._not_full.notify(len(items))
+            return items
+
+
+class AsyncDeque:
+    """
+    Ограниченная очередь поверх MyDeque для asyncio: put/get/get_many - корутины, которые
+    засыпают на future, пока нет места или элементов. Без блокировок: всё работает внутри
+    одного event loop. Таймауты - через asyncio.wait_for, как у asyncio.Queue.
+    """
+
+    def __init__(self, maxsize: int = 0):
+        self.maxsize = maxsize
+        self._deque = MyDeque()
+        self._getters = MyDeque()
+        self._putters = MyDeque()
+
+    def __len__(self):
+        return len(self._deque)
+
+    def qsize(self):
+        return len(self._deque)
+
+    def empty(self):
+        return self._deque.is_empty()
+
+    def full(self):
+        return 0 < self.maxsize <= len(self._deque)
+
+    @staticmethod
+    def _wakeup_next(waiters: MyDeque):
+        # отменённые ожидающие остаются в деке и просто пропускаются
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                break
+
+    async def _wait(self, waiters: MyDeque, is_blocked: Callable[[], bool]):
+        while is_blocked():
+            waiter = asyncio.get_running_loop().create_future()
+            waiters.append(waiter)
+            try:
+                await waiter
+            except BaseException:
+                waiter.cancel()
+                # нас уже разбудили, но задачу отменили - будим следующего вместо себя
+                if not waiter.cancelled() and not is_blocked():
+                    self._wakeup_next(waiters)
+                raise
+
+    def put_nowait(self, item: Any):
+        if self.full():
+            raise asyncio.QueueFull
+        self._deque.append(item)
+        self._wakeup_next(self._getters)
+
+    def get_nowait(self):
+        if self._deque.is_empty():
+            raise asyncio.QueueEmpty
+        item = self._deque.popleft()
+        self._wakeup_next(self._putters)
+        return item
+
+    # корутину ожидания создаём, только если действительно придётся ждать
+    async def put(self, item: Any):
+        if self.full():
+            await self._wait(self._putters, self.full)
+        self.put_nowait(item)
+
+    async def get(self):
+        if self._deque.is_empty():
+            await self._wait(self._getters, self._deque.is_empty)
+        return self.get_nowait()
+
+    async def get_many(self, n: int) -> List[Any]:
+        if self._deque.is_empty():
+            await self._wait(self._getters, self._deque.is_empty)
+        items = [self._deque.popleft() for _ in range(min(n, len(self._deque)))]
+        for _ in items:
+            if not self._putters:
+                break
+            self._wakeup_next(self._putters)
+        return items
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Any, List, Optional
+from typing import Any, Iterable, List, Optional
 
 
 class Node(BaseModel):
@@ -11,7 +11,8 @@ class Node(BaseModel):
     next: Node=None
 
 
-class MyDeque(BaseModel):
+# первая версия деки на двусвязном списке pydantic Node - оставлена для сравнения в бенчмарках
+class LinkedDeque(BaseModel):
     tail: Node=None
     head: Node=None
     _size: int=0
@@ -102,4 +103,159 @@ class MyDeque(BaseModel):
         while cur:
             values.append(cur.val)
             cur = cur.next
-        return "[" + ", ".join(list(map(str,values))) + "]"
\ No newline at end of file
+        return "[" + ", ".join(list(map(str,values))) + "]"
+
+
+# блоки фиксированного размера, как в collections.deque из CPython
+_BLOCK_SHIFT = 6
+_BLOCK_SIZE = 1 << _BLOCK_SHIFT
+_BLOCK_MASK = _BLOCK_SIZE - 1
+
+
+class MyDeque:
+    """
+    Дека на кольцевом буфере из блоков по _BLOCK_SIZE элементов. Элемент i лежит в позиции
+    (head + i) по модулю ёмкости, поэтому индексация O(1). Блоки выделяются по мере
+    заполнения и освобождаются, когда опустеют; при нехватке места удваивается только
+    карта блоков, сами элементы не копируются.
+    """
+    __slots__ = ("maxlen", "_blocks", "_mask", "_head", "_size")
+
+    def __init__(self, iterable: Iterable[Any] = (), maxlen: Optional[int] = None):
+        if maxlen is not None and maxlen < 0:
+            raise ValueError("maxlen must be non-negative")
+        self.maxlen = maxlen
+        self._blocks: List[Optional[List[Any]]] = [None, None]
+        self._mask = 2 * _BLOCK_SIZE - 1
+        self._head = 0
+        self._size = 0
+        self.extend(iterable)
+
+    def is_empty(self):
+        return self._size == 0
+
+    def __len__(self):
+        return self._size
+
+    def size(self):
+        return self._size
+
+    def __validate(self):
+        if self._size == 0:
+            raise IndexError("pop from empty deque")
+
+    def _grow(self):
+        # один блок всегда остаётся свободным, поэтому левый и правый концы никогда не делят
+        # блок "через круг", и кольцо можно развернуть перестановкой целых блоков
+        blocks = self._blocks
+        first = self._head >> _BLOCK_SHIFT
+        self._blocks = blocks[first:] + blocks[:first] + [None] * len(blocks)
+        self._mask = len(self._blocks) * _BLOCK_SIZE - 1
+        self._head &= _BLOCK_MASK
+
+    def append(self, item: Any):
+        if self._size == self.maxlen:
+            if not self.maxlen:
+                return
+            self.popleft()
+        if self._size >= self._mask + 1 - _BLOCK_SIZE:
+            self._grow()
+        pos = (self._head + self._size) & self._mask
+        block = self._blocks[pos >> _BLOCK_SHIFT]
+        if block is None:
+            block = self._blocks[pos >> _BLOCK_SHIFT] = [None] * _BLOCK_SIZE
+        block[pos & _BLOCK_MASK] = item
+        self._size += 1
+
+    def appendleft(self, item: Any):
+        if self._size == self.maxlen:
+            if not self.maxlen:
+                return
+            self.pop()
+        if self._size >= self._mask + 1 - _BLOCK_SIZE:
+            self._grow()
+        pos = (self._head - 1) & self._mask
+        block = self._blocks[pos >> _BLOCK_SHIFT]
+        if block is None:
+            block = self._blocks[pos >> _BLOCK_SHIFT] = [None] * _BLOCK_SIZE
+        block[pos & _BLOCK_MASK] = item
+        self._head = pos
+        self._size += 1
+
+    def pop(self):
+        self.__validate()
+        self._size -= 1
+        pos = (self._head + self._size) & self._mask
+        block = self._blocks[pos >> _BLOCK_SHIFT]
+        offset = pos & _BLOCK_MASK
+        item = block[offset]
+        block[offset] = None
+        if offset == 0 and self._size:
+            self._blocks[pos >> _BLOCK_SHIFT] = None
+        return item
+
+    def popleft(self):
+        self.__validate()
+        pos = self._head
+        block = self._blocks[pos >> _BLOCK_SHIFT]
+        offset = pos & _BLOCK_MASK
+        item = block[offset]
+        block[offset] = None
+        self._size -= 1
+        self._head = (pos + 1) & self._mask
+        if offset == _BLOCK_MASK and self._size:
+            self._blocks[pos >> _BLOCK_SHIFT] = None
+        return item
+
+    def peeklast(self):
+        self.__validate()
+        pos = (self._head + self._size - 1) & self._mask
+        return self._blocks[pos >> _BLOCK_SHIFT][pos & _BLOCK_MASK]
+
+    def peek(self):
+        self.__validate()
+        pos = self._head
+        return self._blocks[pos >> _BLOCK_SHIFT][pos & _BLOCK_MASK]
+
+    def __getitem__(self, index: int):
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("deque index out of range")
+        pos = (self._head + index) & self._mask
+        return self._blocks[pos >> _BLOCK_SHIFT][pos & _BLOCK_MASK]
+
+    def extend(self, iterable: Iterable[Any]):
+        if iterable is self:
+            iterable = list(iterable)
+        append = self.append
+        for item in iterable:
+            append(item)
+
+    def extendleft(self, iterable: Iterable[Any]):
+        if iterable is self:
+            iterable = list(iterable)
+        appendleft = self.appendleft
+        for item in iterable:
+            appendleft(item)
+
+    def rotate(self, n: int = 1):
+        # как collections.deque.rotate: положительное n сдвигает элементы вправо
+        if self._size <= 1:
+            return
+        n %= self._size
+        if n > self._size // 2:
+            n -= self._size
+        for _ in range(n):
+            self.appendleft(self.pop())
+        for _ in range(-n):
+            self.append(self.popleft())
+
+    def __iter__(self):
+        blocks, mask, head = self._blocks, self._mask, self._head
+        for i in range(self._size):
+            pos = (head + i) & mask
+            yield blocks[pos >> _BLOCK_SHIFT][pos & _BLOCK_MASK]
+
+    def __str__(self):
+        return "[" + ", ".join(map(str, self)) + "]"
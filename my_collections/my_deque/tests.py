@@ -1,3 +1,10 @@
+import asyncio
+import queue
+import random
+import threading
+from collections import deque as builtin_deque
+
+from blocking_deque import AsyncDeque, BlockingDeque
 from my_deque import MyDeque
 
 def test_deque_operations():
@@ -67,6 +74,175 @@ def test_deque_operations():
 
     print("Все тесты пройдены!")
 
+def test_indexing_and_block_boundaries():
+    deque = MyDeque()
+
+    # несколько тысяч элементов, чтобы пройти через много блоков и удвоений карты
+    for i in range(1000):
+        deque.append(i)
+        deque.appendleft(-i - 1)
+    assert len(deque) == 2000, "Тест не пройден: размер деки должен быть 2000"
+    assert deque[0] == -1000 and deque[-1] == 999, "Тест не пройден: неверные крайние элементы"
+    assert deque[1000] == 0, "Тест не пройден: неверный элемент в середине"
+    assert list(deque) == list(range(-1000, 1000)), "Тест не пройден: неверный порядок элементов"
+
+    try:
+        deque[2000]
+        assert False, "Тест не пройден: IndexError должен быть вызван для индекса за границей"
+    except IndexError:
+        pass  # Ожидаемый результат
+
+def test_random_operations_match_builtin_deque():
+    rnd = random.Random(0)
+    deque = MyDeque()
+    expected = builtin_deque()
+
+    for i in range(20000):
+        operation = rnd.random()
+        if operation < 0.3:
+            deque.append(i)
+            expected.append(i)
+        elif operation < 0.6:
+            deque.appendleft(i)
+            expected.appendleft(i)
+        elif expected and operation < 0.8:
+            assert deque.pop() == expected.pop(), "Тест не пройден: pop разошёлся с collections.deque"
+        elif expected:
+            assert deque.popleft() == expected.popleft(), "Тест не пройден: popleft разошёлся с collections.deque"
+    assert list(deque) == list(expected), "Тест не пройден: содержимое разошлось с collections.deque"
+
+def test_rotate_and_extend():
+    deque = MyDeque([1, 2, 3, 4, 5])
+
+    deque.rotate(2)
+    assert list(deque) == [4, 5, 1, 2, 3], "Тест не пройден: rotate(2) должен сдвинуть вправо"
+    deque.rotate(-3)
+    assert list(deque) == [2, 3, 4, 5, 1], "Тест не пройден: rotate(-3) должен сдвинуть влево"
+
+    deque.extend([6, 7])
+    deque.extendleft([0, -1])
+    assert list(deque) == [-1, 0, 2, 3, 4, 5, 1, 6, 7], "Тест не пройден: неверный extend/extendleft"
+
+    deque.extend(deque)
+    assert len(deque) == 18, "Тест не пройден: extend самой себя должен удвоить деку"
+
+def test_maxlen():
+    deque = MyDeque(range(5), maxlen=3)
+    assert list(deque) == [2, 3, 4], "Тест не пройден: должны остаться последние maxlen элементов"
+
+    deque.appendleft(1)
+    assert list(deque) == [1, 2, 3], "Тест не пройден: appendleft должен вытеснить элемент справа"
+
+    deque = MyDeque(maxlen=0)
+    deque.append(1)
+    assert deque.is_empty(), "Тест не пройден: дека с maxlen=0 всегда пуста"
+
+def test_blocking_deque():
+    deque = BlockingDeque(maxsize=2)
+
+    deque.put(1)
+    deque.put(2)
+    assert deque.full(), "Тест не пройден: очередь должна быть полной"
+    try:
+        deque.put(3, timeout=0.01)
+        assert False, "Тест не пройден: queue.Full должен быть вызван по таймауту"
+    except queue.Full:
+        pass  # Ожидаемый результат
+
+    assert deque.get_many(10) == [1, 2], "Тест не пройден: get_many должен забрать всё, что есть"
+    try:
+        deque.get(timeout=0.01)
+        assert False, "Тест не пройден: queue.Empty должен быть вызван по таймауту"
+    except queue.Empty:
+        pass  # Ожидаемый результат
+    try:
+        deque.get(block=False)
+        assert False, "Тест не пройден: queue.Empty должен быть вызван без ожидания"
+    except queue.Empty:
+        pass  # Ожидаемый результат
+
+def test_blocking_deque_producers_consumers():
+    deque = BlockingDeque(maxsize=8)
+    received = []
+    lock = threading.Lock()
+
+    def producer(start: int):
+        for i in range(start, start + 1000):
+            deque.put(i)
+
+    def consumer():
+        while True:
+            items = deque.get_many(16)
+            with lock:
+                received.extend(items)
+            if None in items:
+                # лишние стоп-маркеры предназначены другим потребителям
+                for _ in range(items.count(None) - 1):
+                    deque.put(None)
+                return
+
+    producers = [threading.Thread(target=producer, args=(i * 1000,)) for i in range(4)]
+    consumers = [threading.Thread(target=consumer) for _ in range(2)]
+    for thread in producers + consumers:
+        thread.start()
+    for thread in producers:
+        thread.join()
+    for _ in consumers:
+        deque.put(None)
+    for thread in consumers:
+        thread.join()
+
+    assert sorted(item for item in received if item is not None) == list(range(4000)), \
+        "Тест не пройден: элементы потерялись или задублировались"
+
+def test_async_deque():
+    async def scenario():
+        deque = AsyncDeque(maxsize=2)
+        await deque.put(1)
+        await deque.put(2)
+        try:
+            await asyncio.wait_for(deque.put(3), timeout=0.01)
+            assert False, "Тест не пройден: put в полную очередь должен ждать"
+        except asyncio.TimeoutError:
+            pass  # Ожидаемый результат
+
+        # отменённый put не должен потерять место в очереди
+        assert await deque.get() == 1, "Тест не пройден: неверный элемент из get"
+        await deque.put(3)
+        assert await deque.get_many(10) == [2, 3], "Тест не пройден: get_many должен забрать всё, что есть"
+
+        received = []
+
+        async def producer(start: int):
+            for i in range(start, start + 500):
+                await deque.put(i)
+
+        async def consumer():
+            while True:
+                items = await deque.get_many(8)
+                received.extend(items)
+                if None in items:
+                    for _ in range(items.count(None) - 1):
+                        await deque.put(None)
+                    return
+
+        consumers = [asyncio.create_task(consumer()) for _ in range(3)]
+        await asyncio.gather(*(producer(i * 500) for i in range(4)))
+        for _ in consumers:
+            await deque.put(None)
+        await asyncio.gather(*consumers)
+        assert sorted(item for item in received if item is not None) == list(range(2000)), \
+            "Тест не пройден: элементы потерялись или задублировались"
+
+    asyncio.run(scenario())
+
 # Запуск тестов
 if __name__ == "__main__":
     test_deque_operations()
+    test_indexing_and_block_boundaries()
+    test_random_operations_match_builtin_deque()
+    test_rotate_and_extend()
+    test_maxlen()
+    test_blocking_deque()
+    test_blocking_deque_producers_consumers()
+    test_async_deque()
@@ -1,5 +1,9 @@
+import math
+import time
+from array import array
+from collections.abc import ItemsView, KeysView, ValuesView
 from pydantic import BaseModel
-from typing import List, Optional, Tuple, Any
+from typing import List, Optional, Tuple, Any, Literal, Dict
 
 
 class Node(BaseModel):
@@ -10,68 +14,765 @@ class Node(BaseModel):
     #     self.value = value
 
 
+# маркеры слотов open addressing таблицы: пустой слот и "надгробие" удалённого ключа
+_EMPTY = object()
+_DELETED = object()
+_MISSING = object()
+
+
+def _check_all_present(hashmap: Any, keys: List[Any]):
+    # pop_many без default атомарен: отсутствующий (или повторённый) ключ вызывает KeyError
+    # до того, как из таблицы что-либо удалено
+    seen = set()
+    for key in keys:
+        if key in seen or key not in hashmap:
+            raise KeyError(key)
+        seen.add(key)
+
+
+def _mixed_hash(key: Any) -> int:
+    # hash() от int - само число, и ключи с одинаковыми младшими битами (i << 32, выровненные id)
+    # иначе легли бы в одну цепочку пробирования. Фибоначчиево умножение, как в ConcurrentHashMap._index,
+    # а домашний слот берётся из старших битов; сдвиг на 1 - чтобы хеш влез в знаковый array("q")
+    return ((hash(key) * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF) >> 1
+
+
+def _next_power_of_two(n: int) -> int:
+    capacity = 8
+    while capacity < n:
+        capacity *= 2
+    return capacity
+
+
+def _as_sized_items(items: Any):
+    # для bulk-операций нужен размер входа заранее, чтобы выделить таблицу один раз
+    if hasattr(items, "items"):
+        items = items.items()
+    if not hasattr(items, "__len__"):
+        items = list(items)
+    return items
+
+
+# ленивые представления как у dict: ничего не копируют, len() и `in` идут в саму таблицу,
+# итерация падает с RuntimeError, если таблицу структурно изменили во время обхода
+class HashMapKeysView(KeysView):
+    __slots__ = ()
+
+    def __iter__(self):
+        for key, _ in self._mapping._iter_items():
+            yield key
+
+
+class HashMapValuesView(ValuesView):
+    __slots__ = ()
+
+    def __iter__(self):
+        for _, value in self._mapping._iter_items():
+            yield value
+
+    def __contains__(self, value: Any):
+        for item in self:
+            if item is value or item == value:
+                return True
+        return False
+
+
+class HashMapItemsView(ItemsView):
+    __slots__ = ()
+
+    def __iter__(self):
+        return self._mapping._iter_items()
+
+
+class HashMapStats:
+    """
+    Счётчики качества хеширования. Обновляются на каждом поиске ключа одним сравнением
+    и парой сложений, поэтому их можно держать включёнными в проде. Длина пробирования
+    считается для одиночных операций; bulk-методы её не пишут.
+    """
+    __slots__ = ("lookups", "total_probes", "max_probes", "resizes", "resize_seconds")
+
+    def __init__(self):
+        self.lookups = 0
+        self.total_probes = 0
+        self.max_probes = 0
+        self.resizes = 0
+        self.resize_seconds = 0.0
+
+    def record_lookup(self, probes: int):
+        self.lookups += 1
+        self.total_probes += probes
+        if probes > self.max_probes:
+            self.max_probes = probes
+
+    def record_resize(self, seconds: float):
+        self.resizes += 1
+        self.resize_seconds += seconds
+
+    def record_rehash_step(self, seconds: float):
+        self.resize_seconds += seconds
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "lookups": self.lookups,
+            "avg_probes": self.total_probes / self.lookups if self.lookups else 0.0,
+            "max_probes": self.max_probes,
+            "resizes": self.resizes,
+            "resize_seconds": self.resize_seconds,
+        }
+
+
+def _check_growth_policy(load_factor: float, growth_factor: float, min_load_factor: Optional[float]):
+    if growth_factor <= 1:
+        raise ValueError("growth_factor must be greater than 1")
+    if min_load_factor is None:
+        min_load_factor = load_factor / (2 * growth_factor)
+    # гистерезис: сразу после роста нагрузка равна load_factor / growth_factor,
+    # и она не должна оказаться ниже порога сжатия, иначе таблица начнёт "дрожать"
+    if not 0 <= min_load_factor < load_factor / growth_factor:
+        raise ValueError("min_load_factor must be in [0, load_factor / growth_factor)")
+    return growth_factor, min_load_factor
+
+
+class OpenAddressingHashMap:
+    """
+    Хеш-таблица с открытой адресацией и линейным пробированием.
+    Вместо Node на каждую запись - три параллельных массива (хеши, ключи, значения),
+    хеш ключа перемешивается (_mixed_hash) и кешируется, удаление оставляет tombstone, размер хранится счётчиком.
+    """
+    __slots__ = (
+        "capacity", "load_factor", "growth_factor", "min_load_factor",
+        "_mask", "_shift", "_hashes", "_keys", "_values", "_size", "_used", "_version", "stats",
+    )
+
+    def __init__(
+        self,
+        capacity: int = 8,
+        load_factor: float = 0.75,
+        growth_factor: float = 2.0,
+        min_load_factor: Optional[float] = None,
+        collect_stats: bool = False,
+    ):
+        if not 0 < load_factor < 1:
+            raise ValueError("load_factor must be in (0, 1)")
+        self.load_factor = load_factor
+        # ёмкость всегда степень двойки, поэтому growth_factor округляется вверх до неё
+        self.growth_factor, self.min_load_factor = _check_growth_policy(load_factor, growth_factor, min_load_factor)
+        self._version = 0
+        self.stats = HashMapStats() if collect_stats else None
+        self._allocate(_next_power_of_two(capacity))
+        self._size = 0
+
+    def _allocate(self, capacity: int):
+        self.capacity = capacity
+        self._mask = capacity - 1
+        # домашний слот - старшие биты 63-битного перемешанного хеша
+        self._shift = 63 - (capacity.bit_length() - 1)
+        self._hashes = array("q", bytes(8 * capacity))
+        self._keys = [_EMPTY] * capacity
+        self._values = [None] * capacity
+        # занятые слоты вместе с tombstone - именно они удлиняют пробирование
+        self._used = 0
+        self._version += 1
+
+    def _find(self, key: Any, h: int) -> int:
+        mask = self._mask
+        keys = self._keys
+        hashes = self._hashes
+        home = h >> self._shift
+        i = home
+        while True:
+            k = keys[i]
+            if k is _EMPTY:
+                found = -1
+                break
+            if k is not _DELETED and hashes[i] == h and (k is key or k == key):
+                found = i
+                break
+            i = (i + 1) & mask
+        if self.stats is not None:
+            # число проб - расстояние от "домашнего" слота, считать его в цикле не нужно
+            self.stats.record_lookup(((i - home) & mask) + 1)
+        return found
+
+    def _resize(self, new_capacity: int):
+        start = time.perf_counter()
+        old_hashes, old_keys, old_values = self._hashes, self._keys, self._values
+        self._allocate(new_capacity)
+        mask, shift = self._mask, self._shift
+        hashes, keys, values = self._hashes, self._keys, self._values
+        for i, k in enumerate(old_keys):
+            if k is _EMPTY or k is _DELETED:
+                continue
+            h = old_hashes[i]
+            j = h >> shift
+            # ключи уникальны, поэтому сравнивать не нужно - только найти пустой слот
+            while keys[j] is not _EMPTY:
+                j = (j + 1) & mask
+            hashes[j] = h
+            keys[j] = k
+            values[j] = old_values[i]
+        self._used = self._size
+        if self.stats is not None:
+            self.stats.record_resize(time.perf_counter() - start)
+
+    def __getitem__(self, key: Any):
+        i = self._find(key, _mixed_hash(key))
+        if i < 0:
+            raise KeyError(key)
+        return self._values[i]
+
+    def __setitem__(self, key: Any, value: Any):
+        h = _mixed_hash(key)
+        mask = self._mask
+        keys = self._keys
+        hashes = self._hashes
+        home = h >> self._shift
+        i = home
+        tombstone = -1
+        while True:
+            k = keys[i]
+            if k is _EMPTY:
+                break
+            if k is _DELETED:
+                if tombstone < 0:
+                    tombstone = i
+            elif hashes[i] == h and (k is key or k == key):
+                self._values[i] = value
+                if self.stats is not None:
+                    self.stats.record_lookup(((i - home) & mask) + 1)
+                return
+            i = (i + 1) & mask
+
+        if self.stats is not None:
+            self.stats.record_lookup(((i - home) & mask) + 1)
+        if tombstone >= 0:
+            i = tombstone
+        else:
+            self._used += 1
+        hashes[i] = h
+        keys[i] = key
+        self._values[i] = value
+        self._size += 1
+        self._version += 1
+        if self._used > self.load_factor * self.capacity:
+            # если таблицу забили tombstone'ы, достаточно перестроить её того же размера
+            if self._size > self.load_factor * self.capacity / 2:
+                self._resize(_next_power_of_two(int(self.capacity * self.growth_factor)))
+            else:
+                self._resize(self.capacity)
+
+    def __contains__(self, key: Any):
+        return self._find(key, _mixed_hash(key)) >= 0
+
+    def __len__(self):
+        return self._size
+
+    def pop(self, key: Any):
+        i = self._find(key, _mixed_hash(key))
+        if i < 0:
+            raise KeyError(key)
+        value = self._values[i]
+        self._values[i] = None
+        self._size -= 1
+        self._version += 1
+        if self._keys[(i + 1) & self._mask] is _EMPTY:
+            # за слотом цепочка пробирования обрывается - tombstone не нужен
+            self._keys[i] = _EMPTY
+            self._used -= 1
+        else:
+            self._keys[i] = _DELETED
+        self._maybe_shrink()
+        return value
+
+    def _maybe_shrink(self):
+        if self._size < self.min_load_factor * self.capacity and self.capacity > 8:
+            new_capacity = _next_power_of_two(int(self._size * self.growth_factor / self.load_factor))
+            if new_capacity < self.capacity:
+                self._resize(new_capacity)
+
+    def reserve(self, n: int):
+        # после reserve(n) вставка n новых ключей не вызовет ни одного resize
+        if self._used + n > self.load_factor * self.capacity:
+            self._resize(_next_power_of_two(math.ceil((self._size + n) / self.load_factor) + 1))
+
+    def update(self, items: Any):
+        items = _as_sized_items(items)
+        self.reserve(len(items))
+        mask, shift = self._mask, self._shift
+        hashes, keys, values = self._hashes, self._keys, self._values
+        added = 0
+        used = 0
+        for key, value in items:
+            h = _mixed_hash(key)
+            i = h >> shift
+            tombstone = -1
+            while True:
+                k = keys[i]
+                if k is _EMPTY:
+                    break
+                if k is _DELETED:
+                    if tombstone < 0:
+                        tombstone = i
+                elif hashes[i] == h and (k is key or k == key):
+                    break
+                i = (i + 1) & mask
+            if k is _EMPTY or k is _DELETED:
+                if tombstone >= 0:
+                    i = tombstone
+                else:
+                    used += 1
+                hashes[i] = h
+                keys[i] = key
+                added += 1
+            values[i] = value
+        self._size += added
+        self._used += used
+        if added:
+            self._version += 1
+
+    def get_many(self, keys: Any, default: Any = _MISSING) -> List[Any]:
+        mask, shift = self._mask, self._shift
+        hashes, slots, values = self._hashes, self._keys, self._values
+        result = []
+        for key in keys:
+            h = _mixed_hash(key)
+            i = h >> shift
+            while True:
+                k = slots[i]
+                if k is _EMPTY:
+                    if default is _MISSING:
+                        raise KeyError(key)
+                    result.append(default)
+                    break
+                if k is not _DELETED and hashes[i] == h and (k is key or k == key):
+                    result.append(values[i])
+                    break
+                i = (i + 1) & mask
+        return result
+
+    def pop_many(self, keys: Any, default: Any = _MISSING) -> List[Any]:
+        if default is _MISSING:
+            keys = list(keys)
+            _check_all_present(self, keys)
+        mask = self._mask
+        slots, values = self._keys, self._values
+        find = self._find
+        result = []
+        for key in keys:
+            i = find(key, _mixed_hash(key))
+            if i < 0:
+                result.append(default)
+                continue
+            result.append(values[i])
+            values[i] = None
+            self._size -= 1
+            self._version += 1
+            if slots[(i + 1) & mask] is _EMPTY:
+                slots[i] = _EMPTY
+                self._used -= 1
+            else:
+                slots[i] = _DELETED
+        # сжатие проверяется один раз на весь пакет
+        self._maybe_shrink()
+        return result
+
+    def get_stats(self) -> Dict[str, Any]:
+        # гистограмма длин пробирования: сколько проб нужно, чтобы найти каждый ключ
+        histogram = {}
+        mask, shift = self._mask, self._shift
+        hashes = self._hashes
+        for i, k in enumerate(self._keys):
+            if k is _EMPTY or k is _DELETED:
+                continue
+            probes = ((i - (hashes[i] >> shift)) & mask) + 1
+            histogram[probes] = histogram.get(probes, 0) + 1
+        result = {
+            "size": self._size,
+            "capacity": self.capacity,
+            "load_factor": self._size / self.capacity,
+            "tombstones": self._used - self._size,
+            "probe_length_histogram": dict(sorted(histogram.items())),
+        }
+        if self.stats is not None:
+            result.update(self.stats.as_dict())
+        return result
+
+    def _iter_items(self):
+        version = self._version
+        keys, values = self._keys, self._values
+        for i, k in enumerate(keys):
+            if k is _EMPTY or k is _DELETED:
+                continue
+            if self._version != version:
+                raise RuntimeError("hash map changed during iteration")
+            yield k, values[i]
+        if self._version != version:
+            raise RuntimeError("hash map changed during iteration")
+
+    def keys(self):
+        return HashMapKeysView(self)
+
+    def values(self):
+        return HashMapValuesView(self)
+
+    def items(self):
+        return HashMapItemsView(self)
+
+    def __str__(self):
+        return "{ " + ", ".join(f"{key}: {value}" for key, value in self._iter_items()) + " }"
+
+
 class MyHashMap(BaseModel):
     buckets_size: int = 10
     load_factor: float = 0.75
     buckets: List[List[Node]] = []
+    storage: Literal["chaining", "open_addressing"] = "chaining"
+    engine: Optional[Any] = None
+    # политика размера: рост в growth_factor раз, сжатие при нагрузке ниже min_load_factor
+    # (None - load_factor / (2 * growth_factor), 0 - никогда не сжимать)
+    growth_factor: float = 2.0
+    min_load_factor: Optional[float] = None
+    min_buckets_size: int = 8
+    cur_size: int = 0
+    # инкрементальный resize (как в Redis): старая таблица живёт рядом с новой,
+    # и каждая операция переносит не больше rehash_step бакетов
+    incremental_resize: bool = False
+    rehash_step: int = 2
+    old_buckets: Optional[List[List[Node]]] = None
+    rehash_index: int = 0
+    # счётчик структурных изменений - по нему views ловят изменение таблицы во время обхода
+    version: int = 0
+    # опциональная статистика качества хеширования, см. get_stats
+    collect_stats: bool = False
+    stats: Optional[Any] = None
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.buckets = [[] for _ in range(self.buckets_size)]
+        self.growth_factor, self.min_load_factor = _check_growth_policy(
+            self.load_factor, self.growth_factor, self.min_load_factor
+        )
+        if self.storage == "open_addressing":
+            self.engine = OpenAddressingHashMap(
+                capacity=self.buckets_size,
+                load_factor=self.load_factor,
+                growth_factor=self.growth_factor,
+                min_load_factor=self.min_load_factor,
+                collect_stats=self.collect_stats,
+            )
+        else:
+            self.buckets = [[] for _ in range(self.buckets_size)]
+            if self.collect_stats:
+                self.stats = HashMapStats()
 
     def _hash(self, key: Any):
         return hash(key) % self.buckets_size
 
     def _resize(self, new_len: int):
+        if self.incremental_resize:
+            start = time.perf_counter()
+            # новый resize не может начаться, пока не перенесён предыдущий
+            self._finish_rehash()
+            self.old_buckets = self.buckets
+            self.rehash_index = 0
+            self.version += 1
+            self.buckets_size = new_len
+            self.buckets = [[] for _ in range(new_len)]
+            if self.stats is not None:
+                self.stats.record_resize(time.perf_counter() - start)
+            return
+        self._rebuild(new_len)
+
+    def _rebuild(self, new_len: int):
+        start = time.perf_counter()
+        self._finish_rehash()
         all_nodes = [node for bucket in self.buckets for node in bucket]
+        self.version += 1
         self.buckets_size = new_len
         self.buckets = [[] for _ in range(new_len)]
         for node in all_nodes:
             index = self._hash(node.key)
             self.buckets[index].append(node)
+        if self.stats is not None:
+            self.stats.record_resize(time.perf_counter() - start)
+
+    def _rehash(self, steps: int):
+        old_buckets = self.old_buckets
+        index = self.rehash_index
+        # пустые бакеты почти бесплатны, но их тоже ограничиваем, чтобы шаг был O(1)
+        empty_visits = steps * 10
+        while steps > 0 and index < len(old_buckets):
+            bucket = old_buckets[index]
+            if bucket:
+                for node in bucket:
+                    self.buckets[self._hash(node.key)].append(node)
+                # бакет заменяется новым списком, а не очищается: _iter_items держит ссылки
+                # на неперенесённые списки и дочитывает их после шага переноса
+                old_buckets[index] = []
+                steps -= 1
+            else:
+                empty_visits -= 1
+                if empty_visits == 0:
+                    break
+            index += 1
+        if index == len(old_buckets):
+            self.old_buckets = None
+            self.rehash_index = 0
+        else:
+            self.rehash_index = index
+
+    def _finish_rehash(self):
+        if self.old_buckets is not None:
+            self._rehash(len(self.old_buckets))
+
+    def _rehash_step(self):
+        if self.stats is None:
+            self._rehash(self.rehash_step)
+        else:
+            start = time.perf_counter()
+            self._rehash(self.rehash_step)
+            self.stats.record_rehash_step(time.perf_counter() - start)
+
+    def _locate(self, key: Any) -> Tuple[Optional[List[Node]], int]:
+        stats = self.stats
+        if self.old_buckets is not None:
+            self._rehash_step()
+        bucket = self.buckets[self._hash(key)]
+        for i, item in enumerate(bucket):
+            if item.key == key:
+                if stats is not None:
+                    stats.record_lookup(i + 1)
+                return bucket, i
+        probes = len(bucket)
+        if self.old_buckets is not None:
+            bucket = self.old_buckets[hash(key) % len(self.old_buckets)]
+            for i, item in enumerate(bucket):
+                if item.key == key:
+                    if stats is not None:
+                        stats.record_lookup(probes + i + 1)
+                    return bucket, i
+            probes += len(bucket)
+        if stats is not None:
+            stats.record_lookup(probes)
+        return None, -1
+
+    def _lookup(self, key: Any) -> Tuple[Optional[List[Node]], int]:
+        # поиск в обеих таблицах для bulk-операций: без шага переноса и без статистики,
+        # поэтому бакеты не двигаются, пока bulk-операция идёт по ключам
+        h = hash(key)
+        bucket = self.buckets[h % self.buckets_size]
+        for i, item in enumerate(bucket):
+            if item.key == key:
+                return bucket, i
+        if self.old_buckets is not None:
+            bucket = self.old_buckets[h % len(self.old_buckets)]
+            for i, item in enumerate(bucket):
+                if item.key == key:
+                    return bucket, i
+        return None, -1
 
     def __getitem__(self, key: Any):
-        index = self._hash(key)
-        for item in self.buckets[index]:
-            if item.key == key:
-                return item.value
-        raise KeyError
+        if self.engine is not None:
+            return self.engine[key]
+        bucket, i = self._locate(key)
+        if bucket is None:
+            raise KeyError
+        return bucket[i].value
     
     def __setitem__(self, key: Any, value: Any):
-        index = self._hash(key)
-        for item in self.buckets[index]:
-            if item.key == key:
-                item.value = value
-                return
-            
+        if self.engine is not None:
+            self.engine[key] = value
+            return
+        bucket, i = self._locate(key)
+        if bucket is not None:
+            bucket[i].value = value
+            return
+
+        # во время переноса новые ключи всегда идут в новую таблицу
         new_node = Node(key=key, value=value)
-        self.buckets[index].append(new_node)
-        if len(self) > self.load_factor * self.buckets_size:
-            self._resize(self.buckets_size*2)
+        self.buckets[self._hash(key)].append(new_node)
+        self.cur_size += 1
+        self.version += 1
+        if self.cur_size > self.load_factor * self.buckets_size:
+            self._resize(max(self.buckets_size + 1, int(self.buckets_size * self.growth_factor)))
 
     def __contains__(self, key: Any):
-        index = self._hash(key)
-        for item in self.buckets[index]:
-            if item.key == key:
-                return True
-        return False
+        if self.engine is not None:
+            return key in self.engine
+        bucket, _ = self._locate(key)
+        return bucket is not None
 
     def __len__(self):
-        return sum([len(bucket) for bucket in self.buckets])            
+        if self.engine is not None:
+            return len(self.engine)
+        return self.cur_size
 
     def pop(self, key: Any):
-        index = self._hash(key)
-        for i, item in enumerate(self.buckets[index]):
-            if item.key == key:
-                self.buckets[index].pop(i)
-                return
-        raise KeyError
+        if self.engine is not None:
+            return self.engine.pop(key)
+        bucket, i = self._locate(key)
+        if bucket is None:
+            raise KeyError
+        self.cur_size -= 1
+        self.version += 1
+        value = bucket.pop(i).value
+        self._maybe_shrink()
+        return value
+
+    def _maybe_shrink(self):
+        if self.cur_size < self.min_load_factor * self.buckets_size:
+            new_len = max(self.min_buckets_size, math.ceil(self.cur_size * self.growth_factor / self.load_factor))
+            if new_len < self.buckets_size:
+                self._resize(new_len)
+
+    @classmethod
+    def from_items(cls, items: Any, **kwargs) -> "MyHashMap":
+        items = _as_sized_items(items)
+        load_factor = kwargs.get("load_factor", cls.model_fields["load_factor"].default)
+        kwargs.setdefault("buckets_size", max(1, math.ceil(len(items) / load_factor)))
+        hashmap = cls(**kwargs)
+        hashmap.update(items)
+        return hashmap
+
+    def reserve(self, n: int):
+        if self.engine is not None:
+            self.engine.reserve(n)
+            return
+        if self.cur_size + n > self.load_factor * self.buckets_size:
+            # bulk-вызов и так синхронный, поэтому перестраиваем таблицу сразу, без переноса по шагам
+            self._rebuild(math.ceil((self.cur_size + n) / self.load_factor))
+
+    def update(self, items: Any):
+        if self.engine is not None:
+            self.engine.update(items)
+            return
+        items = _as_sized_items(items)
+        self.reserve(len(items))
+        # во время инкрементального переноса пакет делает один шаг, как одиночная операция,
+        # а ключи ищет в обеих таблицах - без остановки на перенос всей таблицы
+        if self.old_buckets is not None:
+            self._rehash_step()
+        buckets = self.buckets
+        buckets_size = self.buckets_size
+        lookup = self._lookup
+        added = 0
+        for key, value in items:
+            bucket, i = lookup(key)
+            if bucket is not None:
+                bucket[i].value = value
+            else:
+                buckets[hash(key) % buckets_size].append(Node(key=key, value=value))
+                added += 1
+        self.cur_size += added
+        if added:
+            self.version += 1
+
+    def get_many(self, keys: Any, default: Any = _MISSING) -> List[Any]:
+        if self.engine is not None:
+            return self.engine.get_many(keys, default)
+        if self.old_buckets is not None:
+            self._rehash_step()
+        lookup = self._lookup
+        result = []
+        for key in keys:
+            bucket, i = lookup(key)
+            if bucket is not None:
+                result.append(bucket[i].value)
+            elif default is _MISSING:
+                raise KeyError(key)
+            else:
+                result.append(default)
+        return result
+
+    def pop_many(self, keys: Any, default: Any = _MISSING) -> List[Any]:
+        if self.engine is not None:
+            return self.engine.pop_many(keys, default)
+        if default is _MISSING:
+            keys = list(keys)
+            _check_all_present(self, keys)
+        elif self.old_buckets is not None:
+            # _check_all_present уже сделал шаги переноса через _locate
+            self._rehash_step()
+        lookup = self._lookup
+        result = []
+        removed = 0
+        for key in keys:
+            bucket, i = lookup(key)
+            if bucket is not None:
+                result.append(bucket.pop(i).value)
+                removed += 1
+            else:
+                result.append(default)
+        self.cur_size -= removed
+        if removed:
+            self.version += 1
+        self._maybe_shrink()
+        return result
     
+    def get_stats(self) -> Dict[str, Any]:
+        if self.engine is not None:
+            return self.engine.get_stats()
+        # гистограмма длин цепочек: сколько бакетов содержат 0, 1, 2, ... узлов. Во время
+        # инкрементального переноса учитываются ещё не перенесённые old_buckets[rehash_index:]:
+        # бакеты до rehash_index уже пусты. Перенос тут не делаем - это только чтение
+        histogram = {}
+        buckets = self.buckets
+        if self.old_buckets is not None:
+            buckets = buckets + self.old_buckets[self.rehash_index:]
+        for bucket in buckets:
+            histogram[len(bucket)] = histogram.get(len(bucket), 0) + 1
+        result = {
+            "size": self.cur_size,
+            "capacity": self.buckets_size,
+            "load_factor": self.cur_size / self.buckets_size,
+            "chain_length_histogram": dict(sorted(histogram.items())),
+        }
+        if self.stats is not None:
+            result.update(self.stats.as_dict())
+        return result
+
+    def _iter_items(self):
+        if self.engine is not None:
+            yield from self.engine._iter_items()
+            return
+        version = self.version
+        buckets = self.buckets
+        if self.old_buckets is None:
+            for bucket in buckets:
+                for node in bucket:
+                    if self.version != version:
+                        raise RuntimeError("hash map changed during iteration")
+                    yield node.key, node.value
+        else:
+            # идёт инкрементальный перенос, и поиски во время обхода двигают узлы из старой
+            # таблицы в новую, не меняя version. Снимок: длины новых бакетов (перенесённые узлы
+            # дописываются в конец) и списки неперенесённых старых бакетов (_rehash их не очищает)
+            lengths = [len(bucket) for bucket in buckets]
+            old_buckets = self.old_buckets[self.rehash_index:]
+            for bucket, length in zip(buckets, lengths):
+                for node in bucket[:length]:
+                    if self.version != version:
+                        raise RuntimeError("hash map changed during iteration")
+                    yield node.key, node.value
+            for bucket in old_buckets:
+                for node in bucket:
+                    if self.version != version:
+                        raise RuntimeError("hash map changed during iteration")
+                    yield node.key, node.value
+        if self.version != version:
+            raise RuntimeError("hash map changed during iteration")
+
+    def keys(self):
+        return HashMapKeysView(self)
+
+    def values(self):
+        return HashMapValuesView(self)
+
     def items(self):
-        return [(node.key, node.value) for bucket in self.buckets for node in bucket]
+        return HashMapItemsView(self)
 
     def __str__(self):
-        return "{ " + ", ".join([f"{key}: {value}" for key, value in self.items()]) + " }"
+        return "{ " + ", ".join(f"{key}: {value}" for key, value in self._iter_items()) + " }"
 
     # def __repr__(self):
     #     return "{ " + ", ".join([f"{key}: {value}" for key, value in self.items()]) + " }"
@@ -244,6 +945,186 @@ def test_key_error_on_getitem():
 
 
 
+def test_incremental_resize():
+    hashmap = MyHashMap(buckets_size=4, load_factor=0.75, incremental_resize=True, rehash_step=1)
+
+    for i in range(3):
+        hashmap[f"key{i}"] = i
+    hashmap["key3"] = 3
+    # порог превышен: новая таблица создана, старая ещё не перенесена
+    assert hashmap.buckets_size == 8, "Тест не пройден: resize не сработал"
+    assert hashmap.old_buckets is not None, "Тест не пройден: старая таблица должна жить до конца переноса"
+
+    # пока идёт перенос, ключи ищутся в обеих таблицах
+    for i in range(4):
+        assert hashmap[f"key{i}"] == i, f"Тест не пройден: 'key{i}' потерялся во время переноса"
+    hashmap["key0"] = "new_value"
+    assert hashmap["key0"] == "new_value", "Тест не пройден: обновление во время переноса не сработало"
+
+    for i in range(4, 1000):
+        hashmap[f"key{i}"] = i
+    hashmap.pop("key500")
+    assert len(hashmap) == 999, "Тест не пройден: неверный размер после вставок с инкрементальным resize"
+    assert len(hashmap.items()) == 999, "Тест не пройден: items должен учитывать обе таблицы"
+    for i in range(1, 1000):
+        assert (f"key{i}" in hashmap) == (i != 500), f"Тест не пройден: неверное наличие 'key{i}'"
+
+    hashmap._finish_rehash()
+    assert hashmap.old_buckets is None, "Тест не пройден: перенос должен завершиться"
+    assert sum(len(bucket) for bucket in hashmap.buckets) == 999, "Тест не пройден: узлы потерялись при переносе"
+
+    # bulk-операции и обход работают с обеими таблицами и не переносят всю таблицу разом
+    hashmap = MyHashMap(buckets_size=4, load_factor=0.75, incremental_resize=True, rehash_step=1)
+    hashmap.update((f"key{i}", i) for i in range(100))
+    for i in range(100, 130):
+        hashmap[f"key{i}"] = i
+    assert hashmap.old_buckets is not None, "Тест не пройден: перенос должен ещё идти"
+    rehash_index = hashmap.rehash_index
+    hashmap.update([("key0", "new"), ("new_key", -1)])
+    assert hashmap.get_many(["key0", "key120", "missing"], None) == ["new", 120, None], "Тест не пройден: get_many во время переноса"
+    assert hashmap.pop_many(["key1", "key129", "missing"], None) == [1, 129, None], "Тест не пройден: pop_many во время переноса"
+    assert hashmap.pop_many(["key2", "key128"]) == [2, 128], "Тест не пройден: pop_many без default во время переноса"
+    assert hashmap.old_buckets is not None and hashmap.rehash_index - rehash_index < 20, \
+        "Тест не пройден: bulk-операция не должна переносить всю таблицу"
+    expected = {f"key{i}": i for i in range(130) if i not in (1, 2, 128, 129)}
+    expected.update(key0="new", new_key=-1)
+    # поиски во время обхода двигают перенос, но каждый ключ должен встретиться ровно один раз
+    seen = []
+    for key, value in hashmap.items():
+        seen.append((key, value))
+        hashmap[f"key{len(seen) % 100 + 3}"]
+    assert len(seen) == len(expected) and dict(seen) == expected, "Тест не пройден: обход во время переноса потерял или повторил ключи"
+
+
+def test_growth_policy():
+    hashmap = MyHashMap(buckets_size=8, load_factor=0.5, growth_factor=4)
+
+    for i in range(5):
+        hashmap[f"key{i}"] = i
+    assert hashmap.buckets_size == 32, "Тест не пройден: таблица должна вырасти в growth_factor раз"
+
+    # сразу после сжатия вставка не должна снова растить таблицу (гистерезис)
+    hashmap = MyHashMap(buckets_size=8, load_factor=0.5)
+    for i in range(1000):
+        hashmap[f"key{i}"] = i
+    for i in range(990):
+        hashmap.pop(f"key{i}")
+    shrunk_size = hashmap.buckets_size
+    assert shrunk_size < 100, "Тест не пройден: таблица не сжалась после удаления почти всех ключей"
+    hashmap["key0"] = 0
+    assert hashmap.buckets_size == shrunk_size, "Тест не пройден: таблица выросла сразу после сжатия"
+    for i in range(990, 1000):
+        assert hashmap[f"key{i}"] == i, f"Тест не пройден: 'key{i}' потерялся при сжатии"
+
+    # min_load_factor=0 отключает сжатие
+    hashmap = MyHashMap(buckets_size=8, load_factor=0.5, min_load_factor=0)
+    for i in range(100):
+        hashmap[i] = i
+    buckets_size = hashmap.buckets_size
+    for i in range(100):
+        hashmap.pop(i)
+    assert hashmap.buckets_size == buckets_size, "Тест не пройден: при min_load_factor=0 таблица не должна сжиматься"
+
+    try:
+        MyHashMap(load_factor=0.5, min_load_factor=0.3)
+        assert False, "Тест не пройден: порог сжатия выше нагрузки после роста должен быть запрещён"
+    except ValueError:
+        pass  # Ожидаемый результат
+
+def test_open_addressing_shrink():
+    hashmap = OpenAddressingHashMap(load_factor=0.5)
+
+    for i in range(10000):
+        hashmap[i] = i
+    grown_capacity = hashmap.capacity
+    for i in range(9990):
+        hashmap.pop(i)
+    assert hashmap.capacity < grown_capacity // 100, "Тест не пройден: open addressing таблица не сжалась"
+    assert len(hashmap) == 10, "Тест не пройден: неверный размер после сжатия"
+    for i in range(9990, 10000):
+        assert hashmap[i] == i, f"Тест не пройден: ключ {i} потерялся при сжатии"
+
+
+def test_bulk_operations():
+    for storage in ("chaining", "open_addressing"):
+        snapshot = {f"key{i}": i for i in range(1000)}
+        hashmap = MyHashMap.from_items(snapshot, storage=storage)
+        assert len(hashmap) == 1000, f"Тест не пройден ({storage}): from_items загрузил не все ключи"
+        if storage == "chaining":
+            assert hashmap.buckets_size >= 1000 / hashmap.load_factor, "Тест не пройден: таблица не была предвыделена"
+
+        # update принимает и пары, и генераторы; существующие ключи обновляются
+        hashmap.update((f"key{i}", -i) for i in range(990, 1010))
+        assert len(hashmap) == 1010, f"Тест не пройден ({storage}): неверный размер после update"
+        assert hashmap["key995"] == -995, f"Тест не пройден ({storage}): update не обновил существующий ключ"
+
+        # результаты возвращаются в порядке входных ключей
+        assert hashmap.get_many(["key5", "key1009", "key0"]) == [5, -1009, 0], \
+            f"Тест не пройден ({storage}): get_many вернул неверные значения"
+        assert hashmap.get_many(["key5", "missing"], default=None) == [5, None], \
+            f"Тест не пройден ({storage}): get_many не подставил default"
+        try:
+            hashmap.get_many(["missing"])
+            assert False, f"Тест не пройден ({storage}): KeyError не был вызван в get_many"
+        except KeyError:
+            pass  # Ожидаемый результат
+
+        popped = hashmap.pop_many([f"key{i}" for i in range(1000)])
+        assert popped[:3] == [0, 1, 2], f"Тест не пройден ({storage}): pop_many вернул неверные значения"
+        assert len(hashmap) == 10, f"Тест не пройден ({storage}): неверный размер после pop_many"
+        assert "key0" not in hashmap and "key1000" in hashmap, f"Тест не пройден ({storage}): pop_many удалил не те ключи"
+        assert hashmap.pop_many(["key0", "key1000"], default=None) == [None, -1000], \
+            f"Тест не пройден ({storage}): pop_many не подставил default"
+
+        # пакет с отсутствующим или повторённым ключом без default ничего не удаляет
+        for batch in (["key1001", "missing", "key1002"], ["key1003", "key1003"]):
+            try:
+                hashmap.pop_many(iter(batch))
+                assert False, f"Тест не пройден ({storage}): KeyError не был вызван в pop_many"
+            except KeyError:
+                pass  # Ожидаемый результат
+        assert len(hashmap) == 9 and all(f"key{i}" in hashmap for i in range(1001, 1010)), \
+            f"Тест не пройден ({storage}): pop_many удалил часть пакета перед KeyError"
+
+
+def test_lazy_views():
+    for storage in ("chaining", "open_addressing"):
+        hashmap = MyHashMap(storage=storage)
+        for i in range(100):
+            hashmap[f"key{i}"] = i
+
+        keys, values, items = hashmap.keys(), hashmap.values(), hashmap.items()
+        assert len(keys) == len(values) == len(items) == 100, f"Тест не пройден ({storage}): неверный len у views"
+        assert sorted(keys) == sorted(f"key{i}" for i in range(100)), f"Тест не пройден ({storage}): неверные keys"
+        assert sorted(values) == list(range(100)), f"Тест не пройден ({storage}): неверные values"
+        assert ("key7", 7) in items and ("key7", 8) not in items, f"Тест не пройден ({storage}): неверный `in` у items"
+        assert "key7" in keys and 7 in values, f"Тест не пройден ({storage}): неверный `in` у keys/values"
+        assert keys & {"key1", "nope"} == {"key1"}, f"Тест не пройден ({storage}): keys должен работать как множество"
+
+        # views живые: видят изменения, сделанные после их создания
+        hashmap["key100"] = 100
+        assert len(keys) == 101 and "key100" in keys, f"Тест не пройден ({storage}): view не видит новый ключ"
+
+        # обновление значения во время обхода разрешено, как у dict
+        for key in hashmap.keys():
+            hashmap[key] = 0
+        assert set(hashmap.values()) == {0}, f"Тест не пройден ({storage}): значения не обновились при обходе"
+
+        try:
+            for key in hashmap.keys():
+                hashmap[key + "_new"] = 1
+            assert False, f"Тест не пройден ({storage}): RuntimeError не был вызван при вставке во время обхода"
+        except RuntimeError:
+            pass  # Ожидаемый результат
+
+        try:
+            for key, _ in hashmap.items():
+                hashmap.pop(key)
+            assert False, f"Тест не пройден ({storage}): RuntimeError не был вызван при удалении во время обхода"
+        except RuntimeError:
+            pass  # Ожидаемый результат
+
+
 class Pair(BaseModel):
     first: Any
     second: Any
@@ -265,6 +1146,11 @@ class Pair(BaseModel):
         # return hash(tuple([self.first, self.second]))
 
 
+class CollidingPair(Pair):
+    def __hash__(self):
+        return 42
+
+
 def test_custom_class_as_key():
     hashmap = MyHashMap()
 
@@ -345,6 +1231,142 @@ def test_equality_custom_class():
 
 
 
+def test_open_addressing_put_get_pop():
+    hashmap = MyHashMap(storage="open_addressing")
+
+    hashmap["key1"] = "value1"
+    hashmap["key2"] = "value2"
+    hashmap["key1"] = "new_value"
+    assert hashmap["key1"] == "new_value", "Тест не пройден: обновление значения для 'key1' неверное"
+    assert len(hashmap) == 2, "Тест не пройден: длина хеш-таблицы должна быть 2"
+    assert hashmap.buckets == [], "Тест не пройден: при open addressing бакеты не должны создаваться"
+
+    assert hashmap.pop("key1") == "new_value", "Тест не пройден: pop должен вернуть удалённое значение"
+    assert "key1" not in hashmap, "Тест не пройден: 'key1' должен быть удалён"
+    assert len(hashmap) == 1, "Тест не пройден: длина хеш-таблицы должна быть 1"
+    assert list(hashmap.items()) == [("key2", "value2")], "Тест не пройден: неверный items после pop"
+
+    try:
+        hashmap.pop("key1")
+        assert False, "Тест не пройден: KeyError не был вызван при удалении несуществующего ключа"
+    except KeyError:
+        pass  # Ожидаемый результат
+
+def test_open_addressing_resize_and_tombstones():
+    hashmap = OpenAddressingHashMap(capacity=8, load_factor=0.5)
+
+    for i in range(1000):
+        hashmap[f"key{i}"] = i
+    assert len(hashmap) == 1000, "Тест не пройден: неверный размер после добавления 1000 элементов"
+    assert hashmap.capacity >= 2000, "Тест не пройден: таблица должна вырасти с учётом load_factor"
+
+    for i in range(0, 1000, 2):
+        hashmap.pop(f"key{i}")
+    for i in range(1000):
+        assert (f"key{i}" in hashmap) == (i % 2 == 1), f"Тест не пройден: неверное наличие 'key{i}'"
+
+    # постоянная вставка/удаление не должна бесконечно раздувать таблицу tombstone'ами
+    capacity = hashmap.capacity
+    for i in range(100000):
+        hashmap[i] = i
+        hashmap.pop(i)
+    assert hashmap.capacity == capacity, "Тест не пройден: таблица выросла из-за tombstone'ов"
+    assert len(hashmap) == 500, "Тест не пройден: неверный размер после вставок и удалений"
+
+def test_open_addressing_colliding_hashes():
+    hashmap = OpenAddressingHashMap()
+
+    # все ключи с одинаковым хешем попадают в одну цепочку пробирования
+    pairs = [CollidingPair(first=i, second=0) for i in range(50)]
+    for i, pair in enumerate(pairs):
+        hashmap[pair] = i
+    for i, pair in enumerate(pairs):
+        assert hashmap[pair] == i, "Тест не пройден: неверное значение для ключа с коллизией"
+
+    hashmap.pop(pairs[10])
+    assert pairs[10] not in hashmap, "Тест не пройден: ключ с коллизией должен быть удалён"
+    assert hashmap[pairs[49]] == 49, "Тест не пройден: удаление сломало цепочку пробирования"
+
+def test_open_addressing_aligned_int_keys():
+    # у int хеш - само число: без перемешивания ключи i << 32 делили бы домашний слот,
+    # и вставка n ключей стала бы квадратичной
+    for keys in ([i << 32 for i in range(4000)], [i * 4096 for i in range(4000)], [-(i << 40) for i in range(4000)]):
+        hashmap = OpenAddressingHashMap(collect_stats=True)
+        for key in keys:
+            hashmap[key] = key
+        hashmap.update((key, -key) for key in keys[:100])
+        assert hashmap.get_many(keys[:100]) == [-key for key in keys[:100]], "Тест не пройден: update/get_many по выровненным ключам"
+        assert all(hashmap[key] == key for key in keys[100:]), "Тест не пройден: неверное значение для выровненного ключа"
+        stats = hashmap.get_stats()
+        assert stats["avg_probes"] < 3, "Тест не пройден: выровненные int-ключи собираются в одну цепочку пробирования"
+        assert max(stats["probe_length_histogram"]) < 64, "Тест не пройден: слишком длинная цепочка пробирования"
+
+def test_open_addressing_custom_class_as_key():
+    hashmap = MyHashMap(storage="open_addressing")
+
+    pair1 = Pair(first="a", second=1)
+    pair3 = Pair(first="a", second=1)
+    hashmap[pair1] = "value1"
+    hashmap[pair3] = "value3"
+
+    assert len(hashmap) == 1, "Тест не пройден: равные ключи должны занимать один слот"
+    assert hashmap[pair1] == "value3", "Тест не пройден: значение для pair1 не обновилось"
+
+
+def test_hash_stats():
+    for storage in ("chaining", "open_addressing"):
+        hashmap = MyHashMap(storage=storage, collect_stats=True)
+        for i in range(1000):
+            hashmap[f"key{i}"] = i
+        for i in range(1000):
+            hashmap[f"key{i}"]
+
+        stats = hashmap.get_stats()
+        assert stats["size"] == 1000, f"Тест не пройден ({storage}): неверный size в статистике"
+        assert 0 < stats["load_factor"] <= hashmap.load_factor, f"Тест не пройден ({storage}): неверный load_factor"
+        assert stats["lookups"] == 2000, f"Тест не пройден ({storage}): неверное число поисков"
+        assert stats["resizes"] > 0 and stats["resize_seconds"] > 0, f"Тест не пройден ({storage}): resize не учтён"
+        assert stats["avg_probes"] < 3, f"Тест не пройден ({storage}): слишком длинное пробирование для str"
+        histogram_key = "chain_length_histogram" if storage == "chaining" else "probe_length_histogram"
+        histogram = stats[histogram_key]
+        if storage == "chaining":
+            assert sum(length * count for length, count in histogram.items()) == 1000
+        else:
+            assert sum(histogram.values()) == 1000, "Тест не пройден: гистограмма должна покрывать все ключи"
+
+    # без collect_stats счётчиков нет, но структура таблицы всё равно видна
+    stats = MyHashMap().get_stats()
+    assert "lookups" not in stats and stats["size"] == 0, "Тест не пройден: счётчики не должны собираться по умолчанию"
+
+def test_hash_stats_during_incremental_resize():
+    hashmap = MyHashMap(buckets_size=4, load_factor=0.75, incremental_resize=True, rehash_step=1)
+    for i in range(100):
+        hashmap[f"key{i}"] = i
+    assert hashmap.old_buckets is not None, "Тест не пройден: перенос должен ещё идти"
+
+    old_buckets, rehash_index = hashmap.old_buckets, hashmap.rehash_index
+    histogram = hashmap.get_stats()["chain_length_histogram"]
+    assert hashmap.old_buckets is old_buckets and hashmap.rehash_index == rehash_index, "Тест не пройден: get_stats не должен переносить бакеты"
+    assert sum(histogram.values()) == hashmap.buckets_size + len(old_buckets) - rehash_index, \
+        "Тест не пройден: гистограмма должна покрывать живую таблицу и неперенесённые бакеты"
+    assert sum(length * count for length, count in histogram.items()) == 100, "Тест не пройден: гистограмма потеряла узлы"
+    for i in range(100):
+        assert hashmap[f"key{i}"] == i, f"Тест не пройден: 'key{i}' потерялся после get_stats"
+
+def test_hash_stats_detect_degenerate_hashing():
+    for storage in ("chaining", "open_addressing"):
+        hashmap = MyHashMap(storage=storage, collect_stats=True)
+        # у CollidingPair один хеш на все ключи - таблица вырождается в список
+        for i in range(100):
+            hashmap[CollidingPair(first=i, second=0)] = i
+        stats = hashmap.get_stats()
+        assert stats["max_probes"] >= 99, f"Тест не пройден ({storage}): вырожденный хеш не виден в max_probes"
+        if storage == "chaining":
+            assert 100 in stats["chain_length_histogram"], "Тест не пройден: все ключи должны быть в одной цепочке"
+        else:
+            assert max(stats["probe_length_histogram"]) == 100, "Тест не пройден: последний ключ требует 100 проб"
+
+
 # Запуск тестов
 if __name__ == "__main__":
     test_put_and_get()
@@ -355,10 +1377,14 @@ if __name__ == "__main__":
     test_resize()
     test_items()
     test_empty_hash_map()
-    # test_resize_down()    
+    test_resize_down()
     test_mixed_operations()
     test_large_number_of_elements()
     test_key_error_on_getitem()
+    test_incremental_resize()
+    test_growth_policy()
+    test_bulk_operations()
+    test_lazy_views()
 
 
     test_custom_class_as_key()
@@ -366,5 +1392,15 @@ if __name__ == "__main__":
     test_hash_custom_class()
     test_equality_custom_class()
 
+    test_open_addressing_put_get_pop()
+    test_open_addressing_resize_and_tombstones()
+    test_open_addressing_colliding_hashes()
+    test_open_addressing_custom_class_as_key()
+    test_open_addressing_aligned_int_keys()
+    test_open_addressing_shrink()
+    test_hash_stats()
+    test_hash_stats_during_incremental_resize()
+    test_hash_stats_detect_degenerate_hashing()
+
 
     print("Все тесты пройдены!")
\ No newline at end of file
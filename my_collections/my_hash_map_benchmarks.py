@@ -0,0 +1,266 @@
+import gc
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List
+
+from concurrent_hash_map import ConcurrentHashMap
+from mmap_hash_map import MmapHashMap
+from my_hash_map import MyHashMap, OpenAddressingHashMap
+
+
+def _fill(factory: Callable[[], Any], keys: List[str]):
+    table = factory()
+    # значение - тот же объект ключа, чтобы не аллоцировать ничего кроме самой таблицы
+    for key in keys:
+        table[key] = key
+    assert len(table) == len(keys)
+    return table
+
+
+def _measure_insert(factory: Callable[[], Any], keys: List[str]):
+    # время и память меряются в разных прогонах: tracemalloc сильно замедляет аллокации
+    start = time.perf_counter()
+    _fill(factory, keys)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    table = _fill(factory, keys)
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del table
+    return elapsed, memory
+
+
+def bench_insert(n: int, chaining_n: int):
+    # ключи создаются заранее, чтобы память строк не попадала в замер таблицы
+    keys = [f"key{i}" for i in range(n)]
+    candidates = [
+        ("dict", dict, keys),
+        ("OpenAddressingHashMap", OpenAddressingHashMap, keys),
+        ("OpenAddressingHashMap+stats", lambda: OpenAddressingHashMap(collect_stats=True), keys),
+        ("MyHashMap(open_addressing)", lambda: MyHashMap(storage="open_addressing"), keys),
+        # pydantic Node на каждую запись медленный и тяжёлый - меряем на меньшем объёме
+        ("MyHashMap(chaining)", MyHashMap, keys[:chaining_n]),
+    ]
+    print(f"{'storage':<28}{'n':>10}{'total, s':>12}{'us/insert':>12}{'bytes/entry':>14}")
+    for name, factory, sample in candidates:
+        elapsed, memory = _measure_insert(factory, sample)
+        print(
+            f"{name:<28}{len(sample):>10}{elapsed:>12.3f}"
+            f"{elapsed / len(sample) * 1e6:>12.3f}{memory / len(sample):>14.1f}"
+        )
+
+
+def _percentile(sorted_values: List[int], q: float) -> int:
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * q))]
+
+
+def bench_insert_latency(n: int):
+    keys = [f"key{i}" for i in range(n)]
+    candidates = [
+        ("eager resize", lambda: MyHashMap()),
+        ("incremental resize", lambda: MyHashMap(incremental_resize=True)),
+    ]
+    for name, factory in candidates:
+        table = factory()
+        latencies = []
+        # паузы сборщика мусора на миллионах Node перекрыли бы паузы самого resize
+        gc.disable()
+        for key in keys:
+            start = time.perf_counter_ns()
+            table[key] = key
+            latencies.append(time.perf_counter_ns() - start)
+        gc.enable()
+        latencies.sort()
+        print(
+            f"{name}: p50={_percentile(latencies, 0.5) / 1000:.1f}us "
+            f"p99={_percentile(latencies, 0.99) / 1000:.1f}us "
+            f"p999={_percentile(latencies, 0.999) / 1000:.1f}us "
+            f"max={latencies[-1] / 1000:.1f}us"
+        )
+        # гистограмма по степеням двойки в микросекундах
+        histogram = {}
+        for latency in latencies:
+            bucket = 1 << max(0, (latency // 1000).bit_length())
+            histogram[bucket] = histogram.get(bucket, 0) + 1
+        for bucket in sorted(histogram):
+            print(f"    < {bucket:>8}us: {histogram[bucket]}")
+
+
+def bench_memory_over_time(n: int, cycles: int):
+    candidates = [
+        ("chaining, no shrink", lambda: MyHashMap(min_load_factor=0)),
+        ("chaining, shrink", MyHashMap),
+        ("open_addressing, no shrink", lambda: OpenAddressingHashMap(min_load_factor=0)),
+        ("open_addressing, shrink", OpenAddressingHashMap),
+    ]
+    keys = [f"key{i}" for i in range(n)]
+    for name, factory in candidates:
+        tracemalloc.start()
+        table = factory()
+        timeline = []
+        # всплеск нагрузки: n ключей, затем в таблице остаётся только 1%
+        for _ in range(cycles):
+            for key in keys:
+                table[key] = key
+            timeline.append(tracemalloc.get_traced_memory()[0])
+            for key in keys[n // 100:]:
+                table.pop(key)
+            timeline.append(tracemalloc.get_traced_memory()[0])
+        tracemalloc.stop()
+        del table
+        print(f"{name:<28}" + " ".join(f"{memory / 2**20:>8.1f}MB" for memory in timeline))
+
+
+def bench_bulk_load(n: int, chaining_n: int):
+    snapshot = {f"key{i}": i for i in range(n)}
+    chaining_snapshot = dict(list(snapshot.items())[:chaining_n])
+    print(f"{'storage':<28}{'n':>10}{'loop, s':>10}{'bulk, s':>10}{'get_many, s':>13}{'pop_many, s':>13}")
+    for name, storage, sample in [
+        ("MyHashMap(open_addressing)", "open_addressing", snapshot),
+        ("MyHashMap(chaining)", "chaining", chaining_snapshot),
+    ]:
+        start = time.perf_counter()
+        table = MyHashMap(storage=storage)
+        for key, value in sample.items():
+            table[key] = value
+        loop = time.perf_counter() - start
+
+        start = time.perf_counter()
+        table = MyHashMap.from_items(sample, storage=storage)
+        bulk = time.perf_counter() - start
+
+        keys = list(sample)
+        start = time.perf_counter()
+        table.get_many(keys)
+        get_many = time.perf_counter() - start
+
+        start = time.perf_counter()
+        table.pop_many(keys)
+        pop_many = time.perf_counter() - start
+        print(f"{name:<28}{len(sample):>10}{loop:>10.3f}{bulk:>10.3f}{get_many:>13.3f}{pop_many:>13.3f}")
+
+
+def bench_iteration_memory(n: int):
+    keys = [f"key{i}" for i in range(n)]
+    table = MyHashMap.from_items(((key, key) for key in keys), storage="open_addressing")
+    for name, dump in [
+        # так работал items() раньше: сначала список всех пар, потом обход
+        ("materialized list", lambda: sum(1 for _ in list(table.items()))),
+        ("lazy items() view", lambda: sum(1 for _ in table.items())),
+    ]:
+        tracemalloc.start()
+        start = time.perf_counter()
+        assert dump() == n
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{name:<20} n={n} time={elapsed:.3f}s peak={peak / 2**20:.1f}MB")
+
+
+class SingleLockHashMap:
+    # то, как таблицу делили между потоками раньше: один лок на все операции
+    def __init__(self, **map_kwargs):
+        self._map = MyHashMap(**map_kwargs)
+        self._lock = threading.Lock()
+
+    def __getitem__(self, key: Any):
+        with self._lock:
+            return self._map[key]
+
+    def __setitem__(self, key: Any, value: Any):
+        with self._lock:
+            self._map[key] = value
+
+
+def bench_concurrent_reads(n: int, ops_per_thread: int, read_ratio: float = 0.9):
+    keys = [f"key{i}" for i in range(n)]
+    candidates = [
+        ("single lock", lambda: SingleLockHashMap(storage="open_addressing")),
+        ("striped, 16 segments", lambda: ConcurrentHashMap(segments=16, storage="open_addressing")),
+    ]
+    for name, factory in candidates:
+        table = factory()
+        for key in keys:
+            table[key] = key
+
+        def worker(seed: int):
+            rnd = random.Random(seed)
+            ops = [(rnd.choice(keys), rnd.random() < read_ratio) for _ in range(ops_per_thread)]
+            start = time.perf_counter()
+            for key, is_read in ops:
+                if is_read:
+                    table[key]
+                else:
+                    table[key] = key
+            return time.perf_counter() - start
+
+        results = []
+        for threads in (1, 2, 4, 8):
+            with ThreadPoolExecutor(max_workers=threads) as pool:
+                start = time.perf_counter()
+                list(pool.map(worker, range(threads)))
+                elapsed = time.perf_counter() - start
+            results.append(f"{threads}t={threads * ops_per_thread / elapsed / 1000:.0f}k ops/s")
+        print(f"{name:<22}" + "  ".join(results))
+
+
+def bench_persistent_reopen(n: int):
+    keys = [f"key{i}" for i in range(n)]
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "table")
+        start = time.perf_counter()
+        with MmapHashMap(path, capacity=2 * n) as table:
+            for i, key in enumerate(keys):
+                table[key] = i
+        print(f"one-time build of the mmap file: {time.perf_counter() - start:.3f}s")
+
+        # страницы файла после сборки лежат в page cache, поэтому это "тёплое" открытие
+        start = time.perf_counter()
+        table = MmapHashMap(path, readonly=True)
+        opened = time.perf_counter() - start
+        for key in keys:
+            table[key]
+        print(f"mmap reopen: open={opened * 1000:.2f}ms open+{n} lookups={time.perf_counter() - start:.3f}s")
+        table.close()
+
+    start = time.perf_counter()
+    table = MyHashMap.from_items(((key, i) for i, key in enumerate(keys)), storage="open_addressing")
+    rebuilt = time.perf_counter() - start
+    table.get_many(keys)
+    print(f"rebuild in memory: build={rebuilt:.3f}s build+{n} lookups={time.perf_counter() - start:.3f}s")
+
+
+BENCHMARKS = {
+    "insert": lambda args: bench_insert(
+        int(args[0]) if args else 1_000_000,
+        int(args[1]) if len(args) > 1 else 100_000,
+    ),
+    "latency": lambda args: bench_insert_latency(int(args[0]) if args else 500_000),
+    "bulk": lambda args: bench_bulk_load(
+        int(args[0]) if args else 5_000_000,
+        int(args[1]) if len(args) > 1 else 100_000,
+    ),
+    "views": lambda args: bench_iteration_memory(int(args[0]) if args else 10_000_000),
+    "concurrent": lambda args: bench_concurrent_reads(
+        int(args[0]) if args else 100_000,
+        int(args[1]) if len(args) > 1 else 200_000,
+    ),
+    "persistent": lambda args: bench_persistent_reopen(int(args[0]) if args else 1_000_000),
+    "memory": lambda args: bench_memory_over_time(
+        int(args[0]) if args else 200_000,
+        int(args[1]) if len(args) > 1 else 3,
+    ),
+}
+
+
+# Запуск бенчмарков: python my_hash_map_benchmarks.py <insert|latency|memory|bulk|views|concurrent|persistent> [n] ...
+if __name__ == "__main__":
+    name = sys.argv[1] if len(sys.argv) > 1 else "insert"
+    BENCHMARKS[name](sys.argv[2:])
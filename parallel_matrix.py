@@ -0,0 +1,180 @@
+import os
+from array import array
+from concurrent.futures import Executor, ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Tuple
+
+from matrix_class import Matrix, _typecode, matmul, np
+
+
+# состояние процесса-воркера: сегменты shared memory текущего умножения подключаются
+# при первой его задаче и живут до следующего умножения; задачи передают имена и границы строк
+_worker: Dict[str, object] = {}
+# пулы процессов по числу воркеров: создание пула и запуск процессов дороже самого умножения
+# матриц среднего размера, поэтому пул создаётся один раз и переиспользуется между вызовами
+_pools: Dict[int, ProcessPoolExecutor] = {}
+
+
+def _numpy_dtype(typecode: str):
+    return np.int64 if typecode == "q" else np.float64
+
+
+def _to_shared(matrix: Matrix, typecode: str) -> shared_memory.SharedMemory:
+    itemsize = array(typecode).itemsize
+    block = shared_memory.SharedMemory(create=True, size=max(matrix.rows * matrix.cols * itemsize, 1))
+    if matrix.backend == "numpy":
+        # буфер ndarray копируется в сегмент одним присваиванием, без промежуточных списков
+        target = np.ndarray((matrix.rows, matrix.cols), dtype=_numpy_dtype(typecode), buffer=block.buf)
+        target[...] = matrix.matrix
+        del target
+        return block
+    view = block.buf.cast(typecode)
+    for i, row in enumerate(matrix.matrix):
+        view[i * matrix.cols:(i + 1) * matrix.cols] = array(typecode, row)
+    view.release()
+    return block
+
+
+def _attach(names: Tuple[str, str, str]):
+    if _worker.get("names") != names:
+        for block in _worker.get("blocks", ()):
+            block.close()
+        _worker.clear()
+        _worker.update(names=names, blocks=[shared_memory.SharedMemory(name=name) for name in names])
+    return _worker["blocks"]
+
+
+def _multiply_rows(names: Tuple[str, str, str], shape: Tuple[int, int, int], typecode: str, use_numpy: bool,
+                   start: int, stop: int):
+    rows, inner, cols = shape
+    a_block, b_block, out_block = _attach(names)
+    if use_numpy:
+        dtype = _numpy_dtype(typecode)
+        a = np.ndarray((rows, inner), dtype=dtype, buffer=a_block.buf)
+        b = np.ndarray((inner, cols), dtype=dtype, buffer=b_block.buf)
+        out = np.ndarray((rows, cols), dtype=dtype, buffer=out_block.buf)
+        np.matmul(a[start:stop], b, out=out[start:stop])
+        return
+    if "b_rows" not in _worker:
+        # B нужна каждой задаче целиком: читаем её в списки один раз на воркер
+        b = b_block.buf.cast(typecode)
+        _worker["b_rows"] = [b[k * cols:(k + 1) * cols].tolist() for k in range(inner)]
+        b.release()
+    a = a_block.buf.cast(typecode)
+    out = out_block.buf.cast(typecode)
+    a_rows = [a[i * inner:(i + 1) * inner].tolist() for i in range(start, stop)]
+    for i, row in enumerate(matmul(a_rows, _worker["b_rows"]), start):
+        out[i * cols:(i + 1) * cols] = array(typecode, row)
+    a.release()
+    out.release()
+
+
+def _pool(workers: int) -> ProcessPoolExecutor:
+    pool = _pools.get(workers)
+    if pool is None:
+        pool = _pools[workers] = ProcessPoolExecutor(workers)
+    return pool
+
+
+def shutdown_pools():
+    # остановить общие пулы, например в конце программы или теста
+    for pool in _pools.values():
+        pool.shutdown()
+    _pools.clear()
+
+
+def parallel_multiply(a: Matrix, b: Matrix, workers: Optional[int] = None, use_numpy: Optional[bool] = None,
+                      pool: Optional[Executor] = None) -> Matrix:
+    """
+    Произведение a * b в пуле процессов: операнды один раз копируются в shared memory,
+    каждый воркер считает свой блок строк результата и пишет его туда же, без pickle матриц.
+    pool - свой пул процессов; по умолчанию общий пул на workers процессов, который живёт
+    между вызовами (см. shutdown_pools).
+    use_numpy=None - ядро numpy, если он установлен, иначе блочное умножение на чистом Python.
+    """
+    if a.cols != b.rows:
+        raise Exception("wrong dimension")
+    workers = workers or os.cpu_count() or 1
+    use_numpy = np is not None if use_numpy is None else use_numpy
+    if use_numpy and np is None:
+        raise ImportError("use_numpy=True requires numpy")
+    if a.rows == 0 or b.cols == 0:
+        return a * b
+
+    typecode = _typecode(a, b)
+    numpy_result = a.backend == "numpy" or b.backend == "numpy"
+    blocks: List[shared_memory.SharedMemory] = []
+    try:
+        blocks.append(_to_shared(a, typecode))
+        blocks.append(_to_shared(b, typecode))
+        blocks.append(shared_memory.SharedMemory(create=True, size=max(a.rows * b.cols * array(typecode).itemsize, 1)))
+
+        # блоков больше, чем воркеров, чтобы выровнять нагрузку
+        step = max(1, -(-a.rows // (workers * 4)))
+        names = tuple(block.name for block in blocks)
+        shape = (a.rows, a.cols, b.cols)
+        pool = pool or _pool(workers)
+        for future in [
+            pool.submit(_multiply_rows, names, shape, typecode, use_numpy, start, min(start + step, a.rows))
+            for start in range(0, a.rows, step)
+        ]:
+            future.result()
+
+        if numpy_result:
+            out = np.ndarray((a.rows, b.cols), dtype=_numpy_dtype(typecode), buffer=blocks[2].buf)
+            answer = out.copy()
+            del out
+            return Matrix(answer)
+        out = blocks[2].buf.cast(typecode)
+        answer = [out[i * b.cols:(i + 1) * b.cols].tolist() for i in range(a.rows)]
+        out.release()
+        return Matrix(answer)
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+
+def test_parallel_multiply():
+    a = Matrix([[(i * 7 + j * 3) % 11 - 5 for j in range(13)] for i in range(37)])
+    b = Matrix([[(i * 5 + j * 2) % 13 - 6 for j in range(9)] for i in range(13)])
+    expected = a * b
+
+    kernels = [False, True] if np is not None else [False]
+    for use_numpy in kernels:
+        for workers in (1, 3):
+            answer = parallel_multiply(a, b, workers=workers, use_numpy=use_numpy)
+            assert answer == expected, f"Тест не пройден: неверное произведение (workers={workers}, numpy={use_numpy})"
+            assert all(isinstance(value, int) for row in answer.matrix for value in row), "Тест не пройден: целые стали float"
+
+    floats = Matrix([[0.5, 1.5], [2.0, -1.0]])
+    assert parallel_multiply(floats, floats, workers=2, use_numpy=False) == floats * floats, "Тест не пройден: float"
+
+    # общий пул переиспользуется между вызовами, а воркеры переподключаются к новым сегментам
+    pool = _pools[3]
+    assert parallel_multiply(b, Matrix([[1]] * 9), workers=3) == b * Matrix([[1]] * 9)
+    assert _pools[3] is pool, "Тест не пройден: пул должен переиспользоваться между вызовами"
+
+    if np is not None:
+        # numpy-операнды копируются в shared memory напрямую, результат остаётся ndarray
+        a_numpy, b_numpy = a.to_numpy(), b.to_numpy()
+        with ProcessPoolExecutor(2) as own_pool:
+            answer = parallel_multiply(a_numpy, b_numpy, workers=2, pool=own_pool)
+            assert answer.backend == "numpy" and answer == expected, "Тест не пройден: неверное произведение numpy-матриц"
+            floats_numpy = floats.to_numpy()
+            answer = parallel_multiply(floats_numpy, floats_numpy, use_numpy=False, pool=own_pool)
+            assert answer.backend == "numpy" and answer == floats * floats, "Тест не пройден: float в numpy-матрице"
+    shutdown_pools()
+
+    try:
+        parallel_multiply(a, a)
+        assert False, "Тест не пройден: исключение должно было быть вызвано при неверных размерах"
+    except Exception as e:
+        assert str(e) == "wrong dimension"
+
+
+# Запуск тестов
+if __name__ == "__main__":
+    test_parallel_multiply()
+
+    print("Все тесты пройдены!")
@@ -0,0 +1,344 @@
+from array import array
+from bisect import bisect_left
+from itertools import repeat
+from operator import add, mul
+from typing import Any, Iterable, List
+
+from matrix_class import Matrix, np
+
+
+def _typecode(values: List[Any]) -> str:
+    # целые остаются целыми (int64), всё остальное хранится как float64
+    return "q" if all(isinstance(value, int) for value in values) else "d"
+
+
+def _values(values: List[Any]) -> array:
+    return array(_typecode(values), values)
+
+
+def _dense_rows(matrix: Any) -> List[List[Any]]:
+    if isinstance(matrix, Matrix):
+        return matrix.matrix.tolist() if matrix.backend == "numpy" else matrix.matrix
+    return matrix
+
+
+class COOMatrix:
+    """
+    Разреженная матрица в координатном формате: тройки (row, col, value) в трёх массивах.
+    Удобна для сборки по элементам; для вычислений переводится в CSR за O(nnz + rows).
+    """
+
+    __slots__ = ("rows", "cols", "row", "col", "data")
+
+    def __init__(self, rows: int, cols: int, row: Iterable[int] = (), col: Iterable[int] = (), data: Iterable[Any] = ()):
+        self.rows = rows
+        self.cols = cols
+        self.row = array("q", row)
+        self.col = array("q", col)
+        self.data = _values(list(data))
+        if not len(self.row) == len(self.col) == len(self.data):
+            raise ValueError("row, col and data must have the same length")
+        if self.row and not (0 <= min(self.row) and max(self.row) < rows and 0 <= min(self.col) and max(self.col) < cols):
+            raise IndexError("coordinate out of matrix bounds")
+
+    @classmethod
+    def from_dense(cls, matrix: Any) -> "COOMatrix":
+        return CSRMatrix.from_dense(matrix).to_coo()
+
+    @property
+    def nnz(self) -> int:
+        return len(self.data)
+
+    def transpose(self) -> "COOMatrix":
+        return COOMatrix(self.cols, self.rows, self.col, self.row, self.data)
+
+    def to_csr(self) -> "CSRMatrix":
+        # сортировка подсчётом по строкам, повторяющиеся координаты складываются
+        counts = [0]*(self.rows + 1)
+        for i in self.row:
+            counts[i + 1] += 1
+        for i in range(self.rows):
+            counts[i + 1] += counts[i]
+        order = [0]*self.nnz
+        next_slot = counts[:-1]
+        for position, i in enumerate(self.row):
+            order[next_slot[i]] = position
+            next_slot[i] += 1
+
+        indptr, indices, data = [0], [], []
+        for i in range(self.rows):
+            merged = {}
+            for position in order[counts[i]:counts[i + 1]]:
+                j = self.col[position]
+                merged[j] = merged.get(j, 0) + self.data[position]
+            for j in sorted(merged):
+                if merged[j]:
+                    indices.append(j)
+                    data.append(merged[j])
+            indptr.append(len(indices))
+        return CSRMatrix(self.rows, self.cols, indptr, indices, data)
+
+    def to_dense(self) -> Matrix:
+        return self.to_csr().to_dense()
+
+    def __repr__(self):
+        return f"COOMatrix({self.rows}x{self.cols}, nnz={self.nnz})"
+
+
+class CSRMatrix:
+    """
+    Разреженная матрица в формате CSR: значения и номера столбцов строки i лежат
+    в data[indptr[i]:indptr[i+1]] и indices[...]. Сложение, транспонирование и умножения
+    работают за время, пропорциональное числу ненулевых элементов, а не rows*cols.
+    """
+
+    __slots__ = ("rows", "cols", "indptr", "indices", "data")
+
+    def __init__(self, rows: int, cols: int, indptr: Iterable[int], indices: Iterable[int], data: Iterable[Any]):
+        # ожидается каноничная форма: столбцы в строке по возрастанию, без повторов и явных нулей
+        self.rows = rows
+        self.cols = cols
+        self.indptr = array("q", indptr)
+        self.indices = array("q", indices)
+        self.data = _values(list(data))
+        if len(self.indptr) != rows + 1 or len(self.indices) != len(self.data) or self.indptr[-1] != len(self.data):
+            raise ValueError("inconsistent CSR arrays")
+
+    @classmethod
+    def from_dense(cls, matrix: Any) -> "CSRMatrix":
+        rows = _dense_rows(matrix)
+        indptr, indices, data = [0], [], []
+        for row in rows:
+            for j, value in enumerate(row):
+                if value:
+                    indices.append(j)
+                    data.append(value)
+            indptr.append(len(indices))
+        return cls(len(rows), len(rows[0]) if rows else 0, indptr, indices, data)
+
+    @property
+    def nnz(self) -> int:
+        return len(self.data)
+
+    def _row(self, i: int):
+        start, stop = self.indptr[i], self.indptr[i + 1]
+        return self.indices[start:stop], self.data[start:stop]
+
+    def __getitem__(self, index):
+        i, j = index
+        if not (0 <= i < self.rows and 0 <= j < self.cols):
+            raise IndexError("index out of matrix bounds")
+        start, stop = self.indptr[i], self.indptr[i + 1]
+        k = bisect_left(self.indices, j, start, stop)
+        return self.data[k] if k < stop and self.indices[k] == j else 0
+
+    def to_coo(self) -> COOMatrix:
+        row = [i for i in range(self.rows) for _ in range(self.indptr[i + 1] - self.indptr[i])]
+        return COOMatrix(self.rows, self.cols, row, self.indices, self.data)
+
+    def to_dense(self) -> Matrix:
+        answer = [[0]*self.cols for _ in range(self.rows)]
+        for i, answer_row in enumerate(answer):
+            for j, value in zip(*self._row(i)):
+                answer_row[j] = value
+        return Matrix(answer)
+
+    def transpose(self) -> "CSRMatrix":
+        # сортировка подсчётом по столбцам: O(nnz + cols), строки в результате уже упорядочены
+        indptr = [0]*(self.cols + 1)
+        for j in self.indices:
+            indptr[j + 1] += 1
+        for j in range(self.cols):
+            indptr[j + 1] += indptr[j]
+        next_slot = indptr[:-1]
+        indices, data = [0]*self.nnz, [0]*self.nnz
+        for i in range(self.rows):
+            for j, value in zip(*self._row(i)):
+                indices[next_slot[j]] = i
+                data[next_slot[j]] = value
+                next_slot[j] += 1
+        return CSRMatrix(self.cols, self.rows, indptr, indices, data)
+
+    def _combine(self, another: "CSRMatrix", sign: int) -> "CSRMatrix":
+        if (self.rows, self.cols) != (another.rows, another.cols):
+            raise Exception("dimension not same")
+        indptr, indices, data = [0], [], []
+        for i in range(self.rows):
+            merged = dict(zip(*self._row(i)))
+            for j, value in zip(*another._row(i)):
+                merged[j] = merged.get(j, 0) + sign*value
+            for j in sorted(merged):
+                if merged[j]:
+                    indices.append(j)
+                    data.append(merged[j])
+            indptr.append(len(indices))
+        return CSRMatrix(self.rows, self.cols, indptr, indices, data)
+
+    def __add__(self, another):
+        if isinstance(another, CSRMatrix):
+            return self._combine(another, 1)
+        if isinstance(another, Matrix):
+            return self.to_dense() + another
+        return NotImplemented
+
+    def __radd__(self, another):
+        return self.__add__(another)
+
+    def __sub__(self, another):
+        if isinstance(another, CSRMatrix):
+            return self._combine(another, -1)
+        if isinstance(another, Matrix):
+            return self.to_dense() - another
+        return NotImplemented
+
+    def __rsub__(self, another):
+        if isinstance(another, Matrix):
+            return another - self.to_dense()
+        return NotImplemented
+
+    def dot(self, vector: List[Any]) -> List[Any]:
+        if len(vector) != self.cols:
+            raise Exception("wrong dimension")
+        if np is not None and self.nnz:
+            return self._dot_numpy(vector)
+        return self._dot_python(vector)
+
+    def _dot_python(self, vector: List[Any]) -> List[Any]:
+        indptr, indices, data = self.indptr, self.indices, self.data
+        return [
+            sum(map(mul, data[indptr[i]:indptr[i + 1]], map(vector.__getitem__, indices[indptr[i]:indptr[i + 1]])))
+            for i in range(self.rows)
+        ]
+
+    def _dot_numpy(self, vector: List[Any]) -> List[Any]:
+        # массивы array отдаются в numpy без копирования через buffer protocol
+        indptr = np.frombuffer(self.indptr, dtype=np.int64)
+        products = np.frombuffer(self.data, dtype=self.data.typecode) * np.asarray(vector)[np.frombuffer(self.indices, dtype=np.int64)]
+        answer = np.zeros(self.rows, dtype=products.dtype)
+        # пустые строки пропускаются: тогда каждый отрезок reduceat совпадает ровно с одной строкой
+        nonempty = indptr[:-1] < indptr[1:]
+        answer[nonempty] = np.add.reduceat(products, indptr[:-1][nonempty])
+        return answer.tolist()
+
+    def _multiply_sparse(self, another: "CSRMatrix") -> "CSRMatrix":
+        # алгоритм Густавсона: строка результата - сумма строк another с весами из строки self
+        indptr, indices, data = [0], [], []
+        for i in range(self.rows):
+            accumulator = {}
+            for k, value in zip(*self._row(i)):
+                for j, another_value in zip(*another._row(k)):
+                    accumulator[j] = accumulator.get(j, 0) + value*another_value
+            for j in sorted(accumulator):
+                if accumulator[j]:
+                    indices.append(j)
+                    data.append(accumulator[j])
+            indptr.append(len(indices))
+        return CSRMatrix(self.rows, another.cols, indptr, indices, data)
+
+    def _multiply_dense(self, rows: List[List[Any]]) -> Matrix:
+        answer = []
+        for i in range(self.rows):
+            answer_row = [0]*len(rows[0]) if rows else []
+            for k, value in zip(*self._row(i)):
+                answer_row = list(map(add, answer_row, map(mul, repeat(value), rows[k])))
+            answer.append(answer_row)
+        return Matrix(answer)
+
+    def __mul__(self, another):
+        if isinstance(another, CSRMatrix):
+            if self.cols != another.rows:
+                raise Exception("wrong dimension")
+            return self._multiply_sparse(another)
+        if isinstance(another, Matrix):
+            if self.cols != another.rows:
+                raise Exception("wrong dimension")
+            return self._multiply_dense(_dense_rows(another))
+        return NotImplemented
+
+    def __rmul__(self, another):
+        # dense * sparse = (sparse^T * dense^T)^T
+        if isinstance(another, Matrix):
+            if another.cols != self.rows:
+                raise Exception("wrong dimension")
+            transposed = [list(column) for column in zip(*_dense_rows(another))]
+            return Matrix([list(row) for row in zip(*self.transpose()._multiply_dense(transposed).matrix)])
+        return NotImplemented
+
+    def __eq__(self, another):
+        if isinstance(another, Matrix):
+            return self.to_dense() == another
+        if not isinstance(another, CSRMatrix):
+            return NotImplemented
+        return (
+            (self.rows, self.cols) == (another.rows, another.cols)
+            and self.indptr == another.indptr
+            and self.indices == another.indices
+            and self.data == another.data
+        )
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"CSRMatrix({self.rows}x{self.cols}, nnz={self.nnz})"
+
+
+def test_conversions():
+    dense = Matrix([[0, 2, 0], [0, 0, 0], [1, 0, 3]])
+    csr = CSRMatrix.from_dense(dense)
+    assert (csr.nnz, list(csr.indptr), list(csr.indices)) == (3, [0, 1, 1, 3], [1, 0, 2]), "Тест не пройден: неверный CSR"
+    assert csr[2, 2] == 3 and csr[1, 1] == 0, "Тест не пройден: неверное чтение элемента"
+    assert csr.to_dense() == dense, "Тест не пройден: CSR -> dense"
+    assert csr.to_coo().to_csr() == csr, "Тест не пройден: CSR -> COO -> CSR"
+    assert csr.transpose().to_dense().matrix == [[0, 0, 1], [2, 0, 0], [0, 0, 3]], "Тест не пройден: транспонирование"
+    assert csr.to_coo().transpose().to_csr() == csr.transpose(), "Тест не пройден: транспонирование COO"
+
+    # повторяющиеся координаты COO складываются, нули отбрасываются
+    coo = COOMatrix(2, 2, [1, 0, 1, 0], [1, 0, 1, 1], [2, 5, 3, 0])
+    assert coo.to_csr().to_dense().matrix == [[5, 0], [0, 5]], "Тест не пройден: сборка из COO"
+
+    try:
+        COOMatrix(2, 2, [2], [0], [1])
+        assert False, "Тест не пройден: IndexError должен был быть вызван для координаты вне матрицы"
+    except IndexError:
+        pass  # Ожидаемый результат
+
+def test_arithmetic():
+    a = [[1, 0, 0, 2], [0, 0, 3, 0], [0, 0, 0, 0]]
+    b = [[0, 1, 0], [4, 0, 0], [0, 0, 5], [1, 0, 0]]
+    sparse_a, sparse_b = CSRMatrix.from_dense(a), CSRMatrix.from_dense(b)
+    expected = Matrix(a) * Matrix(b)
+
+    assert (sparse_a * sparse_b).to_dense() == expected, "Тест не пройден: sparse * sparse"
+    assert sparse_a * Matrix(b) == expected, "Тест не пройден: sparse * dense"
+    assert Matrix(a) * sparse_b == expected, "Тест не пройден: dense * sparse"
+    assert sparse_a.dot([1, 2, 3, 4]) == [9, 9, 0], "Тест не пройден: умножение на вектор"
+    assert sparse_a._dot_python([1, 2, 3, 4]) == [9, 9, 0], "Тест не пройден: умножение на вектор без numpy"
+
+    assert (sparse_a + sparse_a).to_dense().matrix == [[2, 0, 0, 4], [0, 0, 6, 0], [0, 0, 0, 0]], "Тест не пройден: сложение"
+    assert (sparse_a - sparse_a).nnz == 0, "Тест не пройден: разность равных матриц должна быть пустой"
+    assert sparse_a + Matrix(a) == Matrix(a) + sparse_a == Matrix(a) + Matrix(a), "Тест не пройден: sparse + dense"
+
+    try:
+        sparse_a * sparse_a
+        assert False, "Тест не пройден: исключение должно было быть вызвано при несовпадении размеров"
+    except Exception as e:
+        assert str(e) == "wrong dimension"
+
+def test_large_matrix():
+    # 100k x 100k с 1000 ненулей хранится как ~1000 элементов, а не 10^10 ячеек
+    n = 100_000
+    coo = COOMatrix(n, n, range(0, n, 100), range(n - 1, 0, -100), [1.5]*1000)
+    csr = coo.to_csr()
+    assert csr.nnz == 1000 and len(csr.indptr) == n + 1, "Тест не пройден: неверный размер CSR"
+    result = csr.dot([1.0]*n)
+    assert sum(result) == 1500.0 and result[100] == 1.5, "Тест не пройден: неверное умножение на вектор"
+    assert csr.transpose().transpose() == csr, "Тест не пройден: двойное транспонирование"
+
+
+# Запуск тестов
+if __name__ == "__main__":
+    test_conversions()
+    test_arithmetic()
+    test_large_matrix()
+
+    print("Все тесты пройдены!")